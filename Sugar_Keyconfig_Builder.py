@@ -1,16 +1,61 @@
 import bpy
+import os
 import math
 import functools
+from types import SimpleNamespace
 from .src.tools.SugarKit_helpers import C, CD, CL
 from .src.tools.SugarKit_helpers import (
     restoreDefaultKeymaps,
     buildNewActiveKeyconfig,
+    buildKeymapIndex,
+    clearKeymapIndex,
     disableIncludingHotkeysInKeyconfig,
-    editUserKeymapItem,
-    addUserKeymapItem,
+    applyKeymapRules,
+    startEditJournal,
+    commitEditJournal,
+    rollbackEditJournal,
     clearAllInactiveKeymapItemsInKeyconfig,
-    saveAndExportKeyconfig,
+    getKeyconfigPresetFilepath,
+    startKeymapSpec,
+    setKeymapSpecSection,
+    stopKeymapSpec,
+    applyKeymapSpec,
+    BuildPipeline,
+    startBuildProfile,
+    stopBuildProfile,
+    profileBuild,
+    countBuildProfile,
+    getBuildProfileText,
+    findIn,
 )
+from .src.tools.SugarKit_keyconfig import (
+    copyKeyconfigToModel,
+    diffKeyconfigs,
+    applyKeyconfigDiffs,
+    getKeymapSpecHash,
+    getKeymapSpecHashes,
+    getChangedKeymapNames,
+    getKeyconfigFingerprint,
+    readBuildCache,
+    writeBuildCache,
+    getKeymapSyncProbe,
+    isKeymapSyncProbeInUserKeyconfig,
+    findKeyconfigConflicts,
+    getKeyconfigConflictsText,
+    writeBuildProfile,
+    getKeyconfigSnapshot,
+    writeKeyconfigSnapshot,
+    readKeyconfigSnapshot,
+    isKeyconfigSnapshotCurrent,
+    loadKeyconfigSnapshot,
+    exportKeyconfigDelta,
+    getKeyconfigDeltaExportText,
+    readHotkeysSheet,
+    diffHotkeysSheet,
+    getHotkeysSheetDriftText,
+)
+from .src.keyconfig_addons import loadAddonHotkeysRules
+from .src.tools.SugarKit_features import registeredFeatures
 from .src.tools.SugarKit_helpers import addActiveKeymapItem as add
 from .src.tools.SugarKit_helpers import disableActiveKeymapItem as disable
 
@@ -26,52 +71,281 @@ class BuildSugarKeyconfigOperator(bpy.types.Operator):
     bl_idname = "window.sk_build_sk_keyconfig"
     bl_options = {'REGISTER', 'UNDO'}
 
+    incremental: bpy.props.BoolProperty(
+        name='Incremental', description='Apply only changes against existing Sugar Keyconfig', default=False)
+    force: bpy.props.BoolProperty(
+        name='Force', description='Rebuild even if nothing changed since last export', default=False)
+    profile: bpy.props.BoolProperty(
+        name='Profile', description='Record time, scanned/created/disabled items and bpy.ops calls per stage', default=False)
+
+    lastPipeline = None  # BuildPipeline of last build, keeps per-stage timings \
+    lastProfile = None  # SimpleNamespace(entries, filepath) of last profiled build \
+
     def execute(self, context):
-        restoreDefaultKeymaps()
-        nkc = buildNewActiveKeyconfig('Sugar Keyconfig')
-        disableIncludingHotkeysInKeyconfig(
-            nkc, ['cmd', 'Numpad', 'NDOF'], excludes=[
+        if self.profile:
+            startBuildProfile()
+
+        records = self.buildKeymapSpec()
+        buildHash = self.getBuildHash(records)
+
+        if not self.force and self.activateCachedKeyconfig('Sugar Keyconfig', buildHash):
+            self.finishProfile()
+            return {'FINISHED'}
+
+        build = SimpleNamespace(kc=None, probeKeymapName=None, probe=None)
+        previousKeyconfigName = bpy.context.window_manager.keyconfigs.active.name
+        pipeline = BuildPipeline('Sugar Keyconfig')
+        kc = self.findKeyconfig('Sugar Keyconfig') if self.incremental else None
+        wmkcs = bpy.context.window_manager.keyconfigs
+        snapshot = readKeyconfigSnapshot() if not self.force and not kc else None
+        if not isKeyconfigSnapshotCurrent(snapshot, wmkcs.default, buildHash):
+            snapshot = None
+
+        def copyDefaults():
+            restoreDefaultKeymaps()
+            build.kc = buildNewActiveKeyconfig('Sugar Keyconfig')
+            buildKeymapIndex(build.kc)  # speeds up add/disable lookups, dropped before purge \
+
+        def disableDefaults():
+            return self.disableDefaultHotkeys(build.kc)  # {keymap name: disabled count} \
+
+        def addHotkeys():
+            applyKeymapSpec(build.kc, records)
+            lastAdd = findIn(reversed(records), lambda r: r.action == 'add')
+            build.probeKeymapName = lastAdd.keymapName if lastAdd else None
+
+        def updateHotkeys():
+            build.kc = kc
+            # Keymaps with unchanged records since last build are skipped, forced update diffs all of them
+            keymapNames = None if self.force else getChangedKeymapNames(readBuildCache(), records, buildHash)
+            diffs = self.updateKeyconfig(kc, records, keymapNames)
+            lastInsert = findIn(reversed(diffs), lambda diff: diff.inserts)
+            build.probeKeymapName = lastInsert.keymap.name if lastInsert else None
+
+        def purge():
+            clearKeymapIndex(build.kc)
+            removedCounts = clearAllInactiveKeymapItemsInKeyconfig(build.kc)
+            # User modifications are kept on update, so item counts can't be matched
+            build.probe = getKeymapSyncProbe(
+                build.kc, build.probeKeymapName, matchCount=not kc)
+            return removedCounts
+
+        def loadSnapshot():
+            # Replays delta against default keyconfig, no preset add and full copy
+            restoreDefaultKeymaps()
+            build.kc = loadKeyconfigSnapshot(snapshot, 'Sugar_Keyconfig', buildHash)
+            lastInsert = findIn(reversed(snapshot['keymaps']), lambda entry: entry['inserts'])
+            build.probe = getKeymapSyncProbe(
+                build.kc, lastInsert['name'] if lastInsert else None, matchCount=True)
+
+        def isUserKeyconfigSynced():
+            # Blender syncs user keyconfig with active one on event loop
+            return isKeymapSyncProbeInUserKeyconfig(build.probe)
+
+        if kc:
+            pipeline.addStage('update', updateHotkeys)
+            pipeline.addStage('purge', purge, deps=['update'])
+        elif snapshot:
+            pipeline.addStage('snapshot', loadSnapshot)
+        else:
+            pipeline.addStage('defaults', copyDefaults)
+            pipeline.addStage('disables', disableDefaults, deps=['defaults'])
+            pipeline.addStage('additions', addHotkeys, deps=['disables'])
+            pipeline.addStage('purge', purge, deps=['additions'])
+        # ADDONS {b}
+        pipeline.addStage('addons', self.editOuterAddonsHotkeys,
+                          deps=['snapshot' if snapshot else 'purge'], ready=isUserKeyconfigSynced)  # edits of not synced user keyconfig are lost \
+
+        def export():
+            # Saved prefs, preset, snapshot and build cache hash match the edits from here on
+            self.exportKeyconfig('Sugar_Keyconfig.py', buildHash, getKeymapSpecHashes(records))
+            commitEditJournal()
+
+        pipeline.addStage('export', export, deps=['addons'], ready=isUserKeyconfigSynced)
+        # Reports only, their failures don't fail the build
+        pipeline.addStage('conflicts', self.reportKeyconfigConflicts, deps=['export'], fatal=False)
+        pipeline.addStage('sheet', functools.partial(self.reportHotkeysSheetDrift, records), deps=['export'],
+                          fatal=False)
+
+        def done(pipeline):
+            C(pipeline.getTimingsText())
+            if pipeline.error and kc:
+                # Failed before export: edited keymaps only, no restore_to_default() of all of them
+                C('Build failed, rolled back', rollbackEditJournal(), 'keyconfig edits')
+            elif pipeline.error:
+                # Full and snapshot builds replace old Sugar Keyconfig before any edit, nothing to roll back to
+                C('Build failed, Sugar Keyconfig is incomplete, activated',
+                  BuildSugarKeyconfigOperator.activatePreviousKeyconfig(previousKeyconfigName))
+            BuildSugarKeyconfigOperator.finishProfile()
+
+        BuildSugarKeyconfigOperator.lastPipeline = pipeline
+        pipeline.onDone = done
+        if kc:
+            startEditJournal()  # only incremental builds edit a keyconfig that was complete before
+        pipeline.start()
+
+        if pipeline.error:
+            self.report({'ERROR'}, str(pipeline.error))
+            return {'CANCELLED'}
+        return {'FINISHED'}
+
+    @classmethod
+    def exportKeyconfig(cls, filename, buildHash, keymapHashes=None):
+        # Only keymaps changed against default, instead of keyconfig_export(all=True). \
+        # Preset is user keyconfig like that export: addons stage and user edits included. \
+        # Snapshot stays active keyconfig only, addons stage runs again after it is loaded.
+        wmkcs = bpy.context.window_manager.keyconfigs
+        bpy.ops.wm.save_userpref()
+        countBuildProfile(ops=1)
+        stats = exportKeyconfigDelta(
+            wmkcs.user, wmkcs.default, getKeyconfigPresetFilepath(filename))
+        C(getKeyconfigDeltaExportText(stats))
+        writeBuildCache(buildHash, stats.filepath, keymapHashes)
+        writeKeyconfigSnapshot(getKeyconfigSnapshot(wmkcs.active, wmkcs.default, buildHash))
+
+    @classmethod
+    def finishProfile(cls):
+        entries = stopBuildProfile()
+        if entries == None:
+            return
+        filepath = writeBuildProfile(entries)
+        BuildSugarKeyconfigOperator.lastProfile = SimpleNamespace(
+            entries=entries, filepath=filepath)
+        C(getBuildProfileText(entries))
+
+    @classmethod
+    def reportKeyconfigConflicts(cls):
+        # Final state is user keyconfig: synced active one with addons edits
+        conflicts = findKeyconfigConflicts(bpy.context.window_manager.keyconfigs.user)
+        text = bpy.data.texts.get('Sugar Keyconfig Conflicts') or bpy.data.texts.new(
+            'Sugar Keyconfig Conflicts')
+        text.from_string(getKeyconfigConflictsText(conflicts))
+        C(len(conflicts), 'keyconfig conflicts, see text', text.name)
+        return len(conflicts)
+
+    @classmethod
+    def reportHotkeysSheetDrift(cls, records):
+        # Blender Hotkeys.txt vs built spec, sheet is parsed again only when changed
+        entries = readHotkeysSheet()
+        if entries == None:
+            return None
+        # SugarKit features keymap items are addon keyconfig ones, enabled features only
+        drift = diffHotkeysSheet(entries, records, [
+            binding for registered in registeredFeatures for binding in registered.feature.keymaps])
+        text = bpy.data.texts.get('Sugar Keyconfig Hotkeys Drift') or bpy.data.texts.new(
+            'Sugar Keyconfig Hotkeys Drift')
+        text.from_string(getHotkeysSheetDriftText(drift))
+        C(len(drift.notBuilt) + len(drift.notDocumented), 'hotkeys sheet mismatches, see text', text.name)
+        return drift
+
+    @classmethod
+    def getBuildHash(cls, records):
+        # Changes if spec, blender, enabled addons profiles or default keyconfig change
+        wmkcs = bpy.context.window_manager.keyconfigs
+        rulesByAddon = loadAddonHotkeysRules(bpy.context.preferences.addons)
+        return getKeymapSpecHash(records) + '-' + '-'.join([
+            '.'.join(str(v) for v in bpy.app.version),
+            ','.join(rulesByAddon.keys()),
+            getKeymapSpecHash([rule for rules in rulesByAddon.values() for rule in rules]),
+            getKeyconfigFingerprint(wmkcs.default),
+        ])
+
+    @classmethod
+    def activateCachedKeyconfig(cls, name, buildHash):
+        cache = readBuildCache()
+        if cache.get('hash') != buildHash:
+            return None
+        wmkcs = bpy.context.window_manager.keyconfigs
+        kc = cls.findKeyconfig(name)
+        if kc:
+            wmkcs.active = kc
+            return kc
+        filepath = cache.get('filepath')
+        if filepath and os.path.exists(filepath):
+            bpy.ops.preferences.keyconfig_activate(filepath=filepath)
+            countBuildProfile(ops=1)
+            return wmkcs.active
+        return None
+
+    @classmethod
+    def disableDefaultHotkeys(cls, keyconfig):
+        return disableIncludingHotkeysInKeyconfig(
+            keyconfig, ['cmd', 'Numpad', 'NDOF'], excludes=[
                 'cmd A', 'cmd S', 'cmd D', 'cmd Z', 'shift cmd Z', 'cmd X', 'cmd C', 'cmd V'])
 
-        # INTERFACE
-        self.addInterfaceHotkeys()
-        # VIEW
-        self.addViewHotkeys()
-        # OBJECT
-        self.addObjectHotkeys()
-        # OUTLINER
-        self.addOutlinerHotkeys()
-        # TRANSFORMATIONS
-        self.addTransformationsHotkeys()
-        # PROPERTIES
-        self.addPropertiesHotkeys()
-        # ANIMATION
-        self.addAnimationHotkeys()
-        # EDIT MESH
-        self.addEditMeshHotkeys()
-        # CURVES
-        self.addCurvesHotkeys()
-        # SCULPT
-        self.addSculptHotkeys()
-        # PAINT
-        self.addPaintHotkeys()
-        # IMAGE/UV
-        self.addImageAndUvHotkeys()
-        # FILE BROWSER
-        self.addFileBrowserHotkeys()
-        # SHADER
-        self.addShaderHotkeys()
+    @classmethod
+    def buildDesiredKeyconfig(cls, records=None, keymapNames=None):
+        # Final Sugar Keyconfig state computed on a model of default keyconfig, \
+        # of given keymaps only if keymapNames
+        wmkcs = bpy.context.window_manager.keyconfigs
+        records = records if records != None else cls.buildKeymapSpec()
+        if keymapNames != None:
+            records = [r for r in records if r.keymapName == '*' or r.keymapName in keymapNames]
+        dkc = copyKeyconfigToModel(wmkcs.default, 'Sugar Keyconfig (desired)', keymapNames=keymapNames)
+        buildKeymapIndex(dkc)
+        cls.disableDefaultHotkeys(dkc)
+        applyKeymapSpec(dkc, records)
+        clearKeymapIndex(dkc)
+        return dkc
 
-        # ADDONS {b}
-        bpy.app.timers.register(
-            functools.partial(self.editOuterAddonsHotkeys), first_interval=0.1)  # must run async to prevent user kyconf collision with clearAllInactiveKeymapItemsInKeyconfig \
+    @classmethod
+    def activatePreviousKeyconfig(cls, name):
+        # -> activated keyconfig name. Previous one unless it was Sugar Keyconfig (removed or cleared \
+        # by build), then default keyconfig. Build cache is dropped, so incomplete Sugar Keyconfig \
+        # isn't activated as cached one.
+        wmkcs = bpy.context.window_manager.keyconfigs
+        writeBuildCache(None, None)
+        previous = cls.findKeyconfig(name)
+        if previous == None or previous == cls.findKeyconfig('Sugar Keyconfig'):
+            previous = wmkcs.default
+        wmkcs.active = previous
+        return previous.name
 
-        clearAllInactiveKeymapItemsInKeyconfig(nkc)
+    @classmethod
+    def findKeyconfig(cls, name):
+        wmkcs = bpy.context.window_manager.keyconfigs
+        try:
+            return wmkcs[name.replace(" ", "_")]
+        except Exception as er:
+            return None
 
-        bpy.app.timers.register(
-            functools.partial(saveAndExportKeyconfig, 'Sugar_Keyconfig.py'), first_interval=0.2)  # must run async to properly cache changes after editOuterAddonsHotkeys and clearAllInactiveKeymapItemsInKeyconfig \
+    @classmethod
+    def updateKeyconfig(cls, kc, records=None, keymapNames=None):
+        # Incremental rebuild: apply only diff between desired and existing keyconfig, \
+        # of given keymaps only if keymapNames (keymaps with changed records)
+        diffs = diffKeyconfigs(cls.buildDesiredKeyconfig(records, keymapNames), kc)
+        applyKeyconfigDiffs(kc, diffs)
+        bpy.context.window_manager.keyconfigs.active = kc
+        return diffs
 
-        return {'FINISHED'}
+    @classmethod
+    def buildKeymapSpec(cls):
+        # Sections record add()/disable() calls instead of applying them
+        records = startKeymapSpec()
+        try:
+            for section in [
+                cls.addInterfaceHotkeys,
+                cls.addViewHotkeys,
+                cls.addObjectHotkeys,
+                cls.addOutlinerHotkeys,
+                cls.addTransformationsHotkeys,
+                cls.addPropertiesHotkeys,
+                cls.addAnimationHotkeys,
+                cls.addEditMeshHotkeys,
+                cls.addCurvesHotkeys,
+                cls.addSculptHotkeys,
+                cls.addPaintHotkeys,
+                cls.addImageAndUvHotkeys,
+                cls.addFileBrowserHotkeys,
+                cls.addShaderHotkeys,
+            ]:
+                # Records keep section name, profiled batch counts go back to it
+                setKeymapSpecSection(section.__name__)
+                with profileBuild(section.__name__):
+                    section()
+        finally:
+            stopKeymapSpec()
+        return records
 
     @classmethod
     def addInterfaceHotkeys(cls):
@@ -85,7 +359,7 @@ class BuildSugarKeyconfigOperator(bpy.types.Operator):
             'S ctrl alt', disableOld='S shift ctrl')
         add('Window', 'wm.obj_import', 'I shift ctrl')
         add('Window', 'import_scene.fbx', 'I shift ctrl alt')
-        add('Window', 'wm.obj_impobj_exportort', 'E shift ctrl')
+        add('Window', 'wm.obj_export', 'E shift ctrl')
         add('Window', 'export_scene.fbx', 'E shift ctrl alt')
         add('Window', 'wm.append', 'A shift ctrl alt')
 
@@ -522,7 +796,7 @@ class BuildSugarKeyconfigOperator(bpy.types.Operator):
 
         for kmn, v in {
             'Markers': 'marker.',
-            'Dopesheet': 'action.select_all',
+            'Dopesheet': 'action.',
             'Grease Pencil Stroke Edit Mode': 'gpencil.',
             'Grease Pencil Stroke Paint Mode': 'gpencil.',
             'Grease Pencil Stroke Vertex Mode': 'gpencil.',
@@ -2161,162 +2435,11 @@ class BuildSugarKeyconfigOperator(bpy.types.Operator):
 
     @classmethod
     def editOuterAddonsHotkeys(cls):
-        # CL(bpy.context.preferences.addons)
-
-        # copy attrs {b}
-        if "space_view3d_copy_attributes" in bpy.context.preferences.addons:
-            for kmn, v in {
-                'Pose': 'VIEW3D_MT_posecopypopup',
-                'Object Mode': 'VIEW3D_MT_copypopup'
-            }.items():
-                editUserKeymapItem(kmn, {'wm.call_menu': {'name': v}},
-                                   'C shift', oldHotkey='C ctrl')
-
-        # bool tool {b}
-        if "object_boolean_tools" in bpy.context.preferences.addons:
-            editUserKeymapItem('Object Mode', {'wm.call_menu': {'name': 'VIEW3D_MT_booltool_menu'}},
-                               'T shift alt B', oldHotkey='B shift ctrl')
-            editUserKeymapItem('Object Mode', 'object.booltool_auto_difference',
-                               'MINUS shift alt DOUBLE_CLICK', oldHotkey='NUMPAD_MINUS shift ctrl')
-            editUserKeymapItem('Object Mode', 'object.booltool_auto_union',
-                               'EQUAL shift alt DOUBLE_CLICK', oldHotkey='NUMPAD_PLUS shift ctrl')
-            editUserKeymapItem('Object Mode', 'object.booltool_auto_intersect',
-                               'EIGHT shift alt DOUBLE_CLICK', oldHotkey='NUMPAD_ASTERIX shift ctrl')
-            editUserKeymapItem('Object Mode', 'object.booltool_auto_slice',
-                               'SLASH shift alt DOUBLE_CLICK', oldHotkey='NUMPAD_SLASH shift ctrl')
-
-        # f2 {b}
-        if "mesh_f2" in bpy.context.preferences.addons:
-            editUserKeymapItem('Mesh', 'mesh.f2', 'F alt', oldHotkey='F')
-
-        # node wrangler {b}
-        if "node_wrangler" in bpy.context.preferences.addons:
-            editUserKeymapItem('Node Editor', {'node.nw_preview_node': {'run_in_geometry_nodes': False}},
-                               'RIGHTMOUSE ctrl CLICK', oldHotkey='LEFTMOUSE shift ctrl')
-            editUserKeymapItem('Node Editor', {'node.nw_preview_node': {'run_in_geometry_nodes': True}},
-                               'RIGHTMOUSE shift ctrl CLICK', oldHotkey='LEFTMOUSE shift alt')
-            editUserKeymapItem('Node Editor', 'node.nw_link_out',
-                               'V DOUBLE_CLICK', oldHotkey='O')
-            addUserKeymapItem('Node Editor', 'node.nw_link_out',
-                              'RET shift')
-            editUserKeymapItem('Node Editor', {'wm.call_menu': {'name': 'NODE_MT_nw_switch_node_type_menu'}},
-                               'S alt', oldHotkey='S shift')
-            editUserKeymapItem('Node Editor', {'node.nw_lazy_connect': {'with_menu': False}},
-                               'RIGHTMOUSE shift CLICK_DRAG', oldHotkey='RIGHTMOUSE alt')
-            editUserKeymapItem('Node Editor', {'node.nw_lazy_connect': {'with_menu': True}},
-                               'RIGHTMOUSE ctrl CLICK_DRAG', oldHotkey='RIGHTMOUSE shift alt')
-            editUserKeymapItem('Node Editor', 'node.nw_lazy_mix',
-                               'RIGHTMOUSE shift ctrl CLICK_DRAG', oldHotkey='RIGHTMOUSE shift ctrl')
-            editUserKeymapItem('Node Editor', {'wm.call_menu': {'name': 'NODE_MT_nw_link_active_to_selected_menu'}},
-                               'C shift ctrl', oldHotkey='BACK_SLASH')
-            editUserKeymapItem('Node Editor', {'node.nw_link_active_to_selected': {'replace': True, 'use_outputs_names': False, 'use_node_names': False}},
-                               'C alt', oldHotkey='K shift')
-            editUserKeymapItem('Node Editor', {'node.nw_link_active_to_selected': {'replace': False, 'use_outputs_names': False, 'use_node_names': False}},
-                               'C alt DOUBLE_CLICK', oldHotkey='K')
-            editUserKeymapItem('Node Editor', {'node.nw_link_active_to_selected': {'replace': True, 'use_outputs_names': True, 'use_node_names': False}},
-                               'COMMA', oldHotkey='SEMI_COLON shift')
-            editUserKeymapItem('Node Editor', {'node.nw_link_active_to_selected': {'replace': False, 'use_outputs_names': True, 'use_node_names': False}},
-                               'COMMA DOUBLE_CLICK', oldHotkey='SEMI_COLON')
-            editUserKeymapItem('Node Editor', {'node.nw_link_active_to_selected': {'replace': True, 'use_outputs_names': False, 'use_node_names': True}},
-                               'COMMA alt', oldHotkey='QUOTE shift')
-            editUserKeymapItem('Node Editor', {'node.nw_link_active_to_selected': {'replace': False, 'use_outputs_names': False, 'use_node_names': True}},
-                               'COMMA alt DOUBLE_CLICK', oldHotkey='QUOTE')
-            editUserKeymapItem('Node Editor', 'node.nw_detach_outputs',
-                               'D alt', oldHotkey='D shift alt')
-            editUserKeymapItem('Node Editor', 'node.nw_del_unused',
-                               'X shift alt', oldHotkey='X alt')
-            editUserKeymapItem('Node Editor', 'node.nw_align_nodes',
-                               'A ctrl', oldHotkey='EQUAL shift')
-            editUserKeymapItem('Node Editor', 'node.nw_reload_images',
-                               'R shift ctrl alt', oldHotkey='R alt')
-            editUserKeymapItem('Node Editor', 'node.nw_reset_nodes',
-                               'R alt', oldHotkey='BACK_SPACE')
-            editUserKeymapItem('Node Editor', 'node.nw_bg_reset',
-                               'Z alt', oldHotkey='Z')
-            editUserKeymapItem('Node Editor', {'wm.call_menu': {'name': 'NODE_MT_nw_copy_node_properties_menu'}},
-                               'C shift alt', oldHotkey='C shift')
-            editUserKeymapItem('Node Editor', 'node.nw_frame_selected',
-                               'B shift ctrl', oldHotkey='P shift')
-            editUserKeymapItem('Node Editor', 'node.nw_copy_label',
-                               'L', oldHotkey='V shift')
-            editUserKeymapItem('Node Editor', 'node.nw_clear_label',
-                               'L alt', oldHotkey='L alt')
-            editUserKeymapItem('Node Editor', 'node.nw_modify_labels',
-                               'L shift ctrl', oldHotkey='L shift alt')
-            # selected merge auto
-            editUserKeymapItem('Node Editor', 'node.nw_merge_nodes',
-                               'M shift ctrl A', oldHotkey='ZERO ctrl')
-            editUserKeymapItem('Node Editor', 'node.nw_merge_nodes',
-                               'COMMA shift ctrl A', oldHotkey='COMMA ctrl')
-            editUserKeymapItem('Node Editor', 'node.nw_merge_nodes',
-                               'PERIOD shift ctrl A', oldHotkey='PERIOD ctrl')
-            editUserKeymapItem('Node Editor', 'node.nw_merge_nodes',
-                               'SLASH shift ctrl A', oldHotkey='SLASH ctrl')
-            editUserKeymapItem('Node Editor', 'node.nw_merge_nodes',
-                               'EIGHT shift ctrl A', oldHotkey='EIGHT ctrl')
-            editUserKeymapItem('Node Editor', 'node.nw_merge_nodes',
-                               'MINUS shift ctrl A', oldHotkey='MINUS ctrl')
-            editUserKeymapItem('Node Editor', 'node.nw_merge_nodes',
-                               'EQUAL shift ctrl A', oldHotkey='EQUAL ctrl')
-            # merge mix color
-            editUserKeymapItem('Node Editor', 'node.nw_merge_nodes',
-                               'M shift ctrl CLICK', oldHotkey='ZERO ctrl alt')
-            editUserKeymapItem('Node Editor', 'node.nw_merge_nodes',
-                               'SLASH shift ctrl CLICK', oldHotkey='SLASH ctrl alt')
-            editUserKeymapItem('Node Editor', 'node.nw_merge_nodes',
-                               'EIGHT shift ctrl CLICK', oldHotkey='EIGHT ctrl alt')
-            editUserKeymapItem('Node Editor', 'node.nw_merge_nodes',
-                               'MINUS shift ctrl CLICK', oldHotkey='MINUS ctrl alt')
-            editUserKeymapItem('Node Editor', 'node.nw_merge_nodes',
-                               'EQUAL shift ctrl CLICK', oldHotkey='EQUAL ctrl alt')
-            # merge math
-            editUserKeymapItem('Node Editor', 'node.nw_merge_nodes',
-                               'COMMA shift alt', oldHotkey='COMMA shift ctrl')
-            editUserKeymapItem('Node Editor', 'node.nw_merge_nodes',
-                               'PERIOD shift alt', oldHotkey='PERIOD shift ctrl')
-            editUserKeymapItem('Node Editor', 'node.nw_merge_nodes',
-                               'SLASH shift alt', oldHotkey='SLASH shift ctrl')
-            editUserKeymapItem('Node Editor', 'node.nw_merge_nodes',
-                               'EIGHT shift alt', oldHotkey='EIGHT shift ctrl')
-            editUserKeymapItem('Node Editor', 'node.nw_merge_nodes',
-                               'MINUS shift alt', oldHotkey='MINUS shift ctrl')
-            editUserKeymapItem('Node Editor', 'node.nw_merge_nodes',
-                               'EQUAL shift alt', oldHotkey='EQUAL shift ctrl')
-            # set mix/math type
-            editUserKeymapItem('Node Editor', 'node.nw_batch_change',
-                               'M ctrl alt', oldHotkey='ZERO alt')
-            editUserKeymapItem('Node Editor', 'node.nw_batch_change',
-                               'COMMA ctrl alt', oldHotkey='COMMA alt')
-            editUserKeymapItem('Node Editor', 'node.nw_batch_change',
-                               'PERIOD ctrl alt', oldHotkey='PERIOD alt')
-            editUserKeymapItem('Node Editor', 'node.nw_batch_change',
-                               'SLASH ctrl alt', oldHotkey='SLASH alt')
-            editUserKeymapItem('Node Editor', 'node.nw_batch_change',
-                               'EIGHT ctrl alt', oldHotkey='EIGHT alt')
-            editUserKeymapItem('Node Editor', 'node.nw_batch_change',
-                               'MINUS ctrl alt', oldHotkey='MINUS alt')
-            editUserKeymapItem('Node Editor', 'node.nw_batch_change',
-                               'EQUAL ctrl alt', oldHotkey='EQUAL alt')
-            editUserKeymapItem('Node Editor', 'node.nw_batch_change',
-                               'UP_ARROW ctrl alt', oldHotkey='UP_ARROW alt')
-            editUserKeymapItem('Node Editor', 'node.nw_batch_change',
-                               'DOWN_ARROW ctrl alt', oldHotkey='DOWN_ARROW alt')
-            # set node value
-            editUserKeymapItem('Node Editor', 'node.nw_factor',
-                               'ONE ctrl alt', oldHotkey='ONE shift ctrl alt')
-            editUserKeymapItem('Node Editor', 'node.nw_factor',
-                               'ZERO ctrl alt', oldHotkey='ZERO shift ctrl alt')
-            editUserKeymapItem('Node Editor', 'node.nw_factor',
-                               'LEFT_ARROW ctrl alt', oldHotkey='LEFT_ARROW shift ctrl alt')
-            editUserKeymapItem('Node Editor', 'node.nw_factor',
-                               'RIGHT_ARROW ctrl alt', oldHotkey='RIGHT_ARROW shift ctrl alt')
-
-        # node relax
-        if "NodeRelax-Blender-Addon-main" in bpy.context.preferences.addons:
-            editUserKeymapItem('Node Editor', 'node_relax.brush',
-                               'R alt', oldHotkey='R shift')
-            addUserKeymapItem('Node Editor', 'node_relax.arrange',
-                              'A ctrl alt')
+        # Profiles of enabled addons only (src/keyconfig_addons), applied in one batch
+        rulesByAddon = loadAddonHotkeysRules(bpy.context.preferences.addons)
+        applyKeymapRules(bpy.context.window_manager.keyconfigs.user,
+                         [rule for rules in rulesByAddon.values() for rule in rules])
+        return list(rulesByAddon.keys())
 
 
 # KMI PROPS SETTERS
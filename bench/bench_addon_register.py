@@ -0,0 +1,63 @@
+# Benchmark: SugarKit features import + register() cost outside Blender, with bench fake bpy.
+# Import breakdown: python -X importtime bench/bench_addon_register.py 2>&1 | grep SugarKit
+# Run from addon root: python bench/bench_addon_register.py [--all]
+import os
+import sys
+import time
+import argparse
+import importlib
+
+sys.path.insert(0, os.path.dirname(__file__))
+import fake_bpy  # noqa: E402
+from fake_bpy import PACKAGE  # noqa: E402
+
+bpy = fake_bpy.installFakeBpy()
+keyconfig = importlib.import_module(PACKAGE + '.src.tools.SugarKit_keyconfig')
+bpy.context.window_manager.keyconfigs.addon = keyconfig.KeyconfigModel('Blender addon')
+
+
+def getLoadedFeatureModules():
+    prefix = PACKAGE + '.src.tools.SugarKit'
+    return sorted(name[len(PACKAGE + '.src.tools.'):] for name in sys.modules
+                  if name.startswith(prefix) and name not in (
+                      prefix + '_helpers', prefix + '_keyconfig', prefix + '_features'))
+
+
+def run(loadAll=False):
+    start = time.perf_counter()
+    features = __import__(PACKAGE + '.src.tools.SugarKit_features', fromlist=['FEATURES'])  # logged by -X importtime
+    imported = time.perf_counter()
+    features.registerFeatures()
+    registered = time.perf_counter()
+    itemsCount = sum(len(km.keymap_items) for km in bpy.context.window_manager.keyconfigs.addon.keymaps)
+    print('import features %.2f ms, registerFeatures() %.2f ms, %d classes, %d keymap items' % (
+        (imported - start) * 1000, (registered - imported) * 1000, len(bpy.utils.registered), itemsCount))
+    for featureId, seconds in features.featureTimings.items():
+        print('  %-16s %7.2f ms' % (featureId, seconds * 1000))
+    print('modules: ' + ', '.join(getLoadedFeatureModules()))
+
+    if loadAll:
+        # What first invoke of each stub operator pulls in
+        start = time.perf_counter()
+        for registered in list(features.registeredFeatures):
+            features.loadFeature(registered)
+        print('\nload all lazy features %.2f ms, %d classes' % (
+            (time.perf_counter() - start) * 1000, len(bpy.utils.registered)))
+        print('modules: ' + ', '.join(getLoadedFeatureModules()))
+        # Props copied to a registered stub would be registered as RNA props by Blender
+        for registered in features.registeredFeatures:
+            for stub in registered.stubs.values():
+                props = [name for name, value in vars(stub).items()
+                         if isinstance(value, bpy.props._PropertyDeferred)]
+                assert not props, '%s stub got props %s' % (stub.__name__, props)
+
+    features.unregisterFeatures()
+    print('\nunregistered, %d classes, %d load_post handlers left' % (
+        len(bpy.utils.registered), len(bpy.app.handlers.load_post)))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--all', action='store_true', help='Also load every lazy feature')
+    args = parser.parse_args()
+    run(args.all)
@@ -0,0 +1,75 @@
+# Simulation: Brush.color notifications of a picker drag, applied per notification vs coalesced by timer.
+# Drag is notifications at event rate on a simulated clock, timers run when due like Blender's event loop.
+# Run from addon root: python bench/bench_brush_color_coalescing.py [--events-per-second N] [--fps N]
+import os
+import sys
+import argparse
+import importlib
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.dirname(__file__))
+import fake_bpy  # noqa: E402
+from fake_bpy import PACKAGE  # noqa: E402
+
+bpy = fake_bpy.installFakeBpy()
+viewportColor = importlib.import_module(PACKAGE + '.src.tools.SugarKit_viewport_color')
+
+clock = SimpleNamespace(now=0.0, due={})
+applied = []
+
+
+def registerTimer(fn, first_interval=0, persistent=False):
+    clock.due[fn] = clock.now + first_interval
+
+
+def runDueTimers(until):
+    while clock.due and min(clock.due.values()) <= until:
+        fn = min(clock.due, key=clock.due.get)
+        clock.now = clock.due.pop(fn)
+        interval = fn()
+        if interval != None:
+            clock.due[fn] = clock.now + interval
+    clock.now = until
+
+
+def countApplied(context, event):
+    # setObjectViewportColorSet looks up space under mouse first, context below makes it return right after
+    applied.append(clock.now)
+    return SimpleNamespace(type='VIEW_3D')
+
+
+def run(eventsPerSecond=240, fps=30, dragSeconds=2.0):
+    bpy.app.timers = SimpleNamespace(register=registerTimer, unregister=clock.due.pop,
+                                     is_registered=clock.due.__contains__)
+    subscriptions = []
+    bpy.msgbus = SimpleNamespace(subscribe_rna=lambda **kwargs: subscriptions.append(kwargs),
+                                 clear_by_owner=lambda owner: subscriptions.clear())
+    bpy.context = SimpleNamespace(mode='EDIT_MESH', preferences=SimpleNamespace(addons={
+        PACKAGE: SimpleNamespace(preferences=SimpleNamespace(brush_color_update_fps=fps))}))
+    viewportColor.updateGlobalEvent = lambda: None
+    viewportColor.getSpaceUnderMouseFromContext = countApplied
+
+    viewportColor.SubscribeBrushColor(True)
+    notify = subscriptions[0]['notify']
+    events = int(eventsPerSecond * dragSeconds)
+    for i in range(events):
+        runDueTimers(i / eventsPerSecond)
+        notify()
+    lastEvent = clock.now
+    runDueTimers(lastEvent + 1.0)
+    viewportColor.SubscribeBrushColor(False)
+
+    print('%d notifications in %.1f s drag, %d fps' % (events, dragSeconds, fps))
+    print('%-24s %d' % ('applied per notification', events))
+    print('%-24s %d' % ('applied coalesced', len(applied)))
+    print('%-24s %.1f ms after last notification' % ('final flush', (applied[-1] - lastEvent) * 1000))
+    assert applied[-1] > lastEvent and len(applied) <= dragSeconds * fps + 2
+    assert not clock.due, 'timer still running after drag'
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--events-per-second', type=int, default=240)
+    parser.add_argument('--fps', type=int, default=30)
+    args = parser.parse_args()
+    run(args.events_per_second, args.fps)
@@ -0,0 +1,47 @@
+# Micro-benchmark: global event copy per operator invoke / msgbus notify,
+# simplenamespace(event) dir() walk vs EventSnapshot.update() in place.
+# Run from addon root: python bench/bench_event_snapshot.py
+import os
+import sys
+import types
+import timeit
+
+sys.modules.setdefault('bpy', types.ModuleType('bpy'))  # helpers only need bpy at call time \
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src', 'tools'))
+import SugarKit_helpers as helpers  # noqa: E402
+
+
+# bpy.types.Event dir() in Blender 3.6: RNA properties (read through descriptors) + bpy_struct methods
+EVENT_PROPS = ['alt', 'ascii', 'bl_rna', 'ctrl', 'direction', 'is_consecutive', 'is_mouse_absolute',
+               'is_repeat', 'is_tablet', 'mouse_prev_press_x', 'mouse_prev_press_y', 'mouse_prev_x',
+               'mouse_prev_y', 'mouse_region_x', 'mouse_region_y', 'mouse_x', 'mouse_y', 'oskey',
+               'pressure', 'rna_type', 'shift', 'tilt', 'type', 'type_prev', 'unicode', 'value',
+               'value_prev', 'xr']
+STRUCT_METHODS = ['as_pointer', 'driver_add', 'driver_remove', 'get', 'id_data', 'is_property_hidden',
+                  'is_property_overridable_library', 'is_property_readonly', 'is_property_set', 'items',
+                  'keyframe_delete', 'keyframe_insert', 'keys', 'path_from_id', 'path_resolve', 'pop',
+                  'property_overridable_library_set', 'property_unset', 'type_recast', 'values']
+
+
+def newFakeEvent():
+    values = {name: i for i, name in enumerate(EVENT_PROPS)}
+    values.update(type='LEFTMOUSE', value='PRESS', shift=False, ctrl=True, alt=False, oskey=False)
+    attrs = {name: property(lambda self, value=value: value) for name, value in values.items()}
+    attrs.update({name: (lambda self: None) for name in STRUCT_METHODS})
+    return type('Event', (), attrs)()
+
+
+def run(number=20000):
+    event = newFakeEvent()
+    snapshot = helpers.EventSnapshot()
+    for name, stmt in [('simplenamespace(event)', lambda: helpers.simplenamespace(event)),
+                       ('EventSnapshot.update(event)', lambda: snapshot.update(event))]:
+        seconds = min(timeit.repeat(stmt, number=number, repeat=5))
+        print('%-28s %7.3f us/event' % (name, seconds / number * 1e6))
+    copy = helpers.simplenamespace(event)
+    assert all(getattr(snapshot, name) == getattr(copy, name) for name in helpers.EventSnapshot.__slots__)
+    print('fields copied: %d vs %d' % (len(vars(copy)), len(helpers.EventSnapshot.__slots__)))
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,118 @@
+# Micro-benchmark: compareKmiWithHotkey cost per comparison, string parsing vs HotkeySpec.
+# Run from addon root: python bench/bench_hotkey_spec.py
+import os
+import sys
+import types
+import timeit
+from types import SimpleNamespace
+
+sys.modules.setdefault('bpy', types.ModuleType('bpy'))  # helpers only need bpy at call time \
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src', 'tools'))
+import SugarKit_helpers as helpers  # noqa: E402
+
+
+# Previous implementation, kept here only as the baseline
+
+
+def legacyParseHotkeyStringInput(hotkey):
+    if type(hotkey) is str and len(hotkey.split()):
+        hotkeySplit = hotkey.split()
+        if len(hotkeySplit) == 1:
+            return hotkey
+        else:
+            return {hotkeySplit.pop(0): hotkeySplit}
+    else:
+        return hotkey
+
+
+def legacyParseKeyBinding(hotkey):
+    if type(hotkey) is dict:
+        key = list(hotkey.keys())[0]
+        modifiers = hotkey[key]
+        keyModifier = helpers.findIn(
+            modifiers, lambda it: it not in helpers.MODIFIERS and it not in helpers.INPUT_VALUES)
+        inputValue = helpers.findIn(
+            modifiers, lambda it: it in helpers.INPUT_VALUES)
+        repeat = helpers.findIn(modifiers, lambda it: it == 'repeat')
+    else:
+        key = hotkey
+        modifiers = []
+        keyModifier = None
+        inputValue = None
+        repeat = None
+    return key, modifiers, keyModifier, inputValue, repeat
+
+
+def legacyCompareKmiWithHotkey(kmi, hotkey):
+    if not hotkey:
+        return True
+
+    key, modifiers, keyModifier, inputValue, repeat = legacyParseKeyBinding(
+        hotkey)
+    different = []
+
+    if kmi.type != key:
+        different.append('type')
+    if (kmi.shift and 'shift' not in modifiers) or ('shift' in modifiers and not kmi.shift):
+        different.append('shift')
+    if (kmi.ctrl and 'ctrl' not in modifiers) or ('ctrl' in modifiers and not kmi.ctrl):
+        different.append('ctrl')
+    if (kmi.alt and 'alt' not in modifiers) or ('alt' in modifiers and not kmi.alt):
+        different.append('alt')
+    if (kmi.oskey and 'cmd' not in modifiers) or ('cmd' in modifiers and not kmi.oskey):
+        different.append('cmd')
+    if (kmi.any and 'any' not in modifiers) or ('any' in modifiers and not kmi.any):
+        different.append('any')
+    if kmi.key_modifier != 'NONE' and kmi.key_modifier != keyModifier:
+        different.append('keymod')
+    if kmi.value != (inputValue if inputValue else 'PRESS'):
+        different.append('value')
+
+    return True if not len(different) else False
+
+
+def fakeKmi(key, shift=False, ctrl=False, alt=False, oskey=False, keyModifier='NONE', value='PRESS'):
+    return SimpleNamespace(type=key, shift=shift, ctrl=ctrl, alt=alt, oskey=oskey, any=False,
+                           key_modifier=keyModifier, value=value)
+
+
+HOTKEYS = ['A shift ctrl CLICK', 'S ctrl alt', 'LEFTMOUSE X',
+           'RIGHTMOUSE alt ONE', 'TRACKPADPAN shift ANY', 'F']
+KMIS = [fakeKmi('A', shift=True, ctrl=True, value='CLICK'), fakeKmi('S', ctrl=True),
+        fakeKmi('LEFTMOUSE', keyModifier='X'), fakeKmi('RIGHTMOUSE', alt=True, keyModifier='ONE'),
+        fakeKmi('TRACKPADPAN', shift=True, value='ANY'), fakeKmi('F')]
+
+
+def checkSameResults():
+    for hotkey in HOTKEYS:
+        for kmi in KMIS:
+            legacy = legacyCompareKmiWithHotkey(
+                kmi, legacyParseHotkeyStringInput(hotkey))
+            current = helpers.compareKmiWithHotkey(
+                kmi, helpers.parseHotkeyStringInput(hotkey))
+            assert legacy == current, (hotkey, kmi)
+
+
+def run(number=20000):
+    checkSameResults()
+    legacyParsed = [legacyParseHotkeyStringInput(h) for h in HOTKEYS]
+    specs = [helpers.parseHotkeyStringInput(h) for h in HOTKEYS]
+    comparisons = number * len(HOTKEYS) * len(KMIS)
+
+    def legacy():
+        for hotkey in legacyParsed:
+            for kmi in KMIS:
+                legacyCompareKmiWithHotkey(kmi, hotkey)
+
+    def current():
+        for spec in specs:
+            for kmi in KMIS:
+                helpers.compareKmiWithHotkey(kmi, spec)
+
+    for name, fn in [('before (parsed dict)', legacy), ('after (HotkeySpec)', current)]:
+        seconds = timeit.timeit(fn, number=number)
+        print('%-22s %8.3f us/comparison' % (name, seconds / comparisons * 1e6))
+
+
+if __name__ == '__main__':
+    run()
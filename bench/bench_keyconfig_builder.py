@@ -0,0 +1,187 @@
+# Benchmark: BuildSugarKeyconfigOperator sections against an in-memory keyconfig, no Blender needed.
+# Default keyconfig is seeded from src/api/types/keymap.name.json and propvalue.json dumps.
+# Run from addon root: python bench/bench_keyconfig_builder.py [--items N] [--seed S]
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import tempfile
+import functools
+import importlib
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.dirname(__file__))
+import fake_bpy  # noqa: E402
+from fake_bpy import ROOT, PACKAGE  # noqa: E402
+
+TYPES_DIR = os.path.join(ROOT, 'src', 'api', 'types')
+
+
+bpy = fake_bpy.installFakeBpy(
+    newKeyconfig=lambda name: keyconfig.KeyconfigModel(name))
+builder = importlib.import_module(PACKAGE + '.Sugar_Keyconfig_Builder')
+helpers = importlib.import_module(PACKAGE + '.src.tools.SugarKit_helpers')
+keyconfig = importlib.import_module(PACKAGE + '.src.tools.SugarKit_keyconfig')
+Op = builder.BuildSugarKeyconfigOperator
+
+SECTIONS = ['addInterfaceHotkeys', 'addViewHotkeys', 'addObjectHotkeys', 'addOutlinerHotkeys',
+            'addTransformationsHotkeys', 'addPropertiesHotkeys', 'addAnimationHotkeys',
+            'addEditMeshHotkeys', 'addCurvesHotkeys', 'addSculptHotkeys', 'addPaintHotkeys',
+            'addImageAndUvHotkeys', 'addFileBrowserHotkeys', 'addShaderHotkeys']
+COUNTED = ['new', 'new_modal', 'new_from_item', 'find_from_operator', 'remove']
+counts = dict.fromkeys(COUNTED, 0)
+
+
+def countCalls(name, fn):
+    @functools.wraps(fn)
+    def counted(*args, **kwargs):
+        counts[name] += 1
+        return fn(*args, **kwargs)
+    return counted
+
+
+for name in COUNTED:
+    setattr(keyconfig.KeymapItemsModel, name,
+            countCalls(name, getattr(keyconfig.KeymapItemsModel, name)))
+
+
+def readTypesDump(filename):
+    with open(os.path.join(TYPES_DIR, filename)) as f:
+        return json.load(f)
+
+
+def seedDefaultKeyconfig(itemsPerKeymap, seed):
+    # Keymap names from dumps, items are random hotkeys on operators spec uses in that keymap \
+    # so find/disable lookups hit like in real default keyconfig
+    rnd = random.Random(seed)
+    keyTypes = [t for t in readTypesDump('key.type_event.type.json')
+                if keyconfig.getMapTypeOfKeyType(t) in ('KEYBOARD', 'MOUSE')]
+    propvalues = readTypesDump('propvalue.json')
+    records = Op.buildKeymapSpec()
+    opsByKeymap = {}
+    for record in records:
+        idName, properties = helpers.parseOperatorData(record.operatorData)
+        if type(idName) is str and not idName.startswith('*'):
+            opsByKeymap.setdefault(record.keymapName, []).append(idName)
+
+    kc = keyconfig.KeyconfigModel('Blender')
+    names = readTypesDump('keymap.name.json')
+    names += [name for name in opsByKeymap if name not in names and name != '*']  # newer than dump \
+    for name in names:
+        if name in propvalues:
+            continue
+        items = kc.keymaps.new(name).keymap_items
+        ops = opsByKeymap.get(name, []) + ['wm.call_menu', 'wm.context_toggle', 'transform.translate']
+        for i in range(itemsPerKeymap):
+            items.new(rnd.choice(ops), rnd.choice(keyTypes), rnd.choice(['PRESS', 'PRESS', 'CLICK']),
+                      shift=rnd.random() < .3, ctrl=rnd.random() < .3, alt=rnd.random() < .2,
+                      oskey=rnd.random() < .1)
+    for name, values in propvalues.items():
+        items = kc.keymaps.new(name, modal=True).keymap_items
+        for value in values:
+            items.new_modal(value, rnd.choice(keyTypes), 'PRESS')
+    return kc
+
+
+def startBuild(defaultKc):
+    # Fresh active keyconfig like buildNewActiveKeyconfig() makes
+    wmkcs = bpy.context.window_manager.keyconfigs
+    wmkcs.default = defaultKc
+    wmkcs.active = keyconfig.copyKeyconfigToModel(defaultKc, 'Sugar Keyconfig')
+    wmkcs.user = wmkcs.active
+    helpers.buildKeymapIndex(wmkcs.active)
+    Op.disableDefaultHotkeys(wmkcs.active)
+    counts.update(dict.fromkeys(COUNTED, 0))
+    return wmkcs.active
+
+
+def keyconfigItems(kc):
+    # Items state compared between direct and batch paths
+    return [(km.name, kmi.idname, kmi.type, kmi.value, kmi.any, kmi.shift, kmi.ctrl, kmi.alt, kmi.oskey,
+             kmi.key_modifier, kmi.active) for km in kc.keymaps for kmi in km.keymap_items]
+
+
+def measure(fn):
+    before = dict(counts)
+    start = time.perf_counter()
+    fn()
+    seconds = time.perf_counter() - start
+    return seconds, {name: counts[name] - before[name] for name in COUNTED}
+
+
+def printRow(name, seconds, calls):
+    print('%-28s %9.2f ms  ' % (name, seconds * 1000) +
+          '  '.join('%s=%d' % (n, calls[n]) for n in COUNTED if calls[n]))
+
+
+def run(itemsPerKeymap=40, seed=0):
+    defaultKc = seedDefaultKeyconfig(itemsPerKeymap, seed)
+    itemsCount = sum(len(km.keymap_items) for km in defaultKc.keymaps)
+    print('default keyconfig: %d keymaps, %d items' % (len(defaultKc.keymaps), itemsCount))
+
+    # Sections applied one by one to active keyconfig
+    print('\nsections (direct)')
+    startBuild(defaultKc)
+    total = 0
+    for section in SECTIONS:
+        seconds, calls = measure(getattr(Op, section))
+        total += seconds
+        printRow(section, seconds, calls)
+    printRow('total', total, dict(counts))
+    directItems = keyconfigItems(bpy.context.window_manager.keyconfigs.active)
+
+    # Whole spec recorded, then batch applied
+    print('\nspec (recorded + batch)')
+    kc = startBuild(defaultKc)
+    records = []
+    printRow('buildKeymapSpec', *measure(lambda: records.extend(Op.buildKeymapSpec())))
+    printRow('applyKeymapSpec', *measure(lambda: helpers.applyKeymapSpec(kc, records)))
+    assert keyconfigItems(kc) == directItems, 'batch applied keyconfig differs from direct'
+    helpers.clearKeymapIndex(kc)
+    printRow('clearAllInactiveKeymapItems', *measure(
+        lambda: helpers.clearAllInactiveKeymapItemsInKeyconfig(kc)))
+
+    # Incremental update of built keyconfig, one hotkey tweaked: every keymap vs keymaps with changed records
+    print('\nupdate (incremental)')
+    printRow('no change, all keymaps', *measure(lambda: Op.updateKeyconfig(kc, records)))
+    cache = {'hash': 'spec-base', 'keymapHashes': keyconfig.getKeymapSpecHashes(records)}
+    printRow('no change, changed keymaps', *measure(lambda: Op.updateKeyconfig(
+        kc, records, keyconfig.getChangedKeymapNames(cache, records, 'spec-base'))))
+    tweaked = list(records)
+    i = max(i for i, r in enumerate(records) if r.action == 'add')
+    tweaked[i] = SimpleNamespace(**vars(records[i]))
+    tweaked[i].hotkey = helpers.parseHotkeyStringInput('F12 shift ctrl alt')
+    keymapNames = keyconfig.getChangedKeymapNames(cache, tweaked, 'tweaked-base')
+    fullDiffs = keyconfig.diffKeyconfigs(Op.buildDesiredKeyconfig(tweaked), kc)
+    diffs = []
+    printRow('1 hotkey, changed keymaps', *measure(
+        lambda: diffs.extend(Op.updateKeyconfig(kc, tweaked, keymapNames))))
+    assert keymapNames == [records[i].keymapName]
+    assert [(d.keymap.name, len(d.inserts), len(d.deactivations), len(d.edits)) for d in diffs] == \
+        [(d.keymap.name, len(d.inserts), len(d.deactivations), len(d.edits)) for d in fullDiffs] != []
+
+    # Delta export vs every item written (what keyconfig_export(all=True) does)
+    print('\nexport (write, then load preset file)')
+    with tempfile.TemporaryDirectory() as tempDir:
+        for name, defaults in [('delta', defaultKc), ('all items', keyconfig.KeyconfigModel('Empty'))]:
+            filepath = os.path.join(tempDir, 'Sugar_Keyconfig.py')
+            stats = keyconfig.exportKeyconfigDelta(kc, defaults, filepath)
+            bpy.context.window_manager.keyconfigs.default = defaults
+            with open(filepath) as f:
+                code = compile(f.read(), filepath, 'exec')
+            seconds, calls = measure(lambda: exec(code, {'__name__': '__main__', '__file__': filepath}))
+            # Load runs on the python model, not a Blender load time: delta is smaller, not shown faster to load \
+            print('%-28s %9.1f KB  write %.2f ms  model load %.2f ms  ' % (
+                name, stats.bytes / 1024, stats.seconds * 1000, seconds * 1000) +
+                '  '.join('%s=%d' % (n, calls[n]) for n in COUNTED if calls[n]))
+        bpy.context.window_manager.keyconfigs.default = defaultKc
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--items', type=int, default=40, help='Items per seeded default keymap')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+    run(args.items, args.seed)
@@ -0,0 +1,155 @@
+# Micro-benchmark: objects using a material on Brush.color update, bpy.data.objects scan vs material users index.
+# Fake scene of mesh objects (some sharing meshes) and empties, random materials per mesh.
+# Run from addon root: python bench/bench_material_users.py [--objects N] [--materials N]
+import os
+import sys
+import random
+import timeit
+import argparse
+import importlib
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.dirname(__file__))
+import fake_bpy  # noqa: E402
+from fake_bpy import PACKAGE  # noqa: E402
+
+bpy = fake_bpy.installFakeBpy()
+helpers = importlib.import_module(PACKAGE + '.src.tools.SugarKit_helpers')
+viewportColor = importlib.import_module(PACKAGE + '.src.tools.SugarKit_viewport_color')
+
+
+class FakeCollection(list):
+    # bpy_prop_collection: iteration, get() and `in` by name
+    def get(self, name, default=None):
+        return next((item for item in self if item.name == name), default)
+
+    def __contains__(self, key):
+        return any(item != None and (item is key or item.name == key) for item in self)
+
+
+class FakeObjects(FakeCollection):
+    def __init__(self, objects):
+        super().__init__(objects)
+        self.byName = {obj.name: obj for obj in objects}
+
+    def get(self, name, default=None):
+        return self.byName.get(name, default)
+
+    def remove(self, obj):
+        super().remove(obj)
+        del self.byName[obj.name]
+
+    def rename(self, obj, name):
+        # No depsgraph update, like renaming in Blender
+        del self.byName[obj.name]
+        obj.name = name
+        self.byName[name] = obj
+        self.sort(key=lambda obj: obj.name)
+
+
+sessionUids = iter(range(1, 1 << 30))
+
+
+class FakeMesh(bpy.types.Mesh):
+    def __init__(self, name, materials):
+        self.name, self.materials, self.original = name, FakeCollection(materials), self
+        self.session_uid = next(sessionUids)
+
+
+class FakeObject(bpy.types.Object):
+    def __init__(self, name, data):
+        self.name, self.data, self.original = name, data, self
+        self.session_uid = next(sessionUids)
+
+
+def newScene(objectsCount, materialsCount, seed):
+    rnd = random.Random(seed)
+    materials = FakeCollection(SimpleNamespace(name='Material.%03d' % i) for i in range(materialsCount))
+    meshes = [FakeMesh('Mesh.%05d' % i, rnd.sample(materials, rnd.randint(1, 3)))
+              for i in range(objectsCount * 3 // 4)]
+    objects = []
+    for i in range(objectsCount):
+        data = rnd.choice(meshes) if rnd.random() < .9 else None  # empties, lights, ...
+        objects.append(FakeObject('Object.%05d' % i, data))
+    bpy.data = SimpleNamespace(materials=materials, objects=FakeObjects(objects))
+    return rnd
+
+
+def updateGeometry(*ids):
+    depsgraph = SimpleNamespace(updates=[SimpleNamespace(id=id, is_updated_geometry=True) for id in ids])
+    viewportColor.handleMaterialUsersDepsgraphUpdate(None, depsgraph)
+
+
+def assertSameUsers():
+    for mat in bpy.data.materials:
+        assert viewportColor.getMaterialUsers(mat) == helpers.getObjectUsersOfMat(mat, bpy.data.objects), mat.name
+
+
+def renameObjects(rnd, count):
+    # Renamed, renamed then old name reused by a new object, renamed mesh and material
+    for i in range(count):
+        obj = rnd.choice(bpy.data.objects)
+        oldName = obj.name
+        bpy.data.objects.rename(obj, obj.name + '.renamed')
+        if i % 2:
+            newObj = FakeObject(oldName, rnd.choice([obj.data, None]))
+            bpy.data.objects.append(newObj)
+            bpy.data.objects.byName[oldName] = newObj
+            bpy.data.objects.sort(key=lambda obj: obj.name)
+            updateGeometry(newObj)
+    mesh = next(obj.data for obj in bpy.data.objects if obj.data)
+    mesh.name += '.renamed'
+    mesh.materials.append(bpy.data.materials[1])
+    updateGeometry(mesh)
+    bpy.data.materials[2].name += '.renamed'
+
+
+def run(objectsCount=12000, materialsCount=40, seed=0, number=20):
+    rnd = newScene(objectsCount, materialsCount, seed)
+    viewportColor.resetMaterialUsersIndex()
+    print('%d objects, %d materials' % (objectsCount, materialsCount))
+    mat = bpy.data.materials[0]
+    seconds = timeit.timeit(lambda: helpers.getObjectUsersOfMat(mat, bpy.data.objects), number=number)
+    print('%-16s %9.3f ms/query' % ('scan', seconds / number * 1000))
+    seconds = timeit.timeit(lambda: (viewportColor.resetMaterialUsersIndex(), viewportColor.getMaterialUsers(mat)),
+                            number=3) / 3
+    print('%-16s %9.3f ms' % ('index build', seconds * 1000))
+    seconds = timeit.timeit(lambda: viewportColor.getMaterialUsers(mat), number=number)
+    print('%-16s %9.3f ms/query' % ('index', seconds / number * 1000))
+    obj = bpy.data.objects[0]
+    seconds = timeit.timeit(lambda: updateGeometry(obj, obj.data or obj), number=1000)
+    print('%-16s %9.3f us/update' % ('depsgraph update', seconds / 1000 * 1e6))
+    assertSameUsers()
+
+    # Edits kept by depsgraph updates or dropped on query: \
+    # material slots changed, mesh swapped, object removed, new material (index rebuilt)
+    meshes = [obj.data for obj in bpy.data.objects if obj.data]
+    for i in range(200):
+        mesh = rnd.choice(meshes)
+        mesh.materials[:] = rnd.sample(bpy.data.materials, rnd.randint(0, 3))
+        updateGeometry(mesh)
+        obj = rnd.choice(bpy.data.objects)
+        obj.data = rnd.choice(meshes + [None])
+        updateGeometry(obj)
+    for i in range(200):
+        bpy.data.objects.remove(rnd.choice(bpy.data.objects))
+    newMat = SimpleNamespace(name='Material.new')
+    bpy.data.materials.append(newMat)
+    rnd.choice(meshes).materials.append(newMat)
+    assertSameUsers()
+    print('edited scene ok')
+
+    renameObjects(rnd, 50)
+    assertSameUsers()
+    renameObjects(rnd, 1)
+    assertSameUsers()
+    assertSameUsers()  # no rebuild left pending
+    print('renamed objects ok')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--objects', type=int, default=12000)
+    parser.add_argument('--materials', type=int, default=40)
+    args = parser.parse_args()
+    run(args.objects, args.materials)
@@ -0,0 +1,84 @@
+# Micro-benchmark: getSpaceUnderMouseFromContext area lookup, areas scan vs cached area index.
+# Fake screen is a grid of areas like a multi-monitor layout, queries are random points.
+# Run from addon root: python bench/bench_space_under_mouse.py [--areas N]
+import os
+import sys
+import random
+import itertools
+import timeit
+import argparse
+import importlib
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.dirname(__file__))
+import fake_bpy  # noqa: E402
+from fake_bpy import PACKAGE  # noqa: E402
+
+fake_bpy.installFakeBpy()
+sugarKit = importlib.import_module(PACKAGE + '.src.tools.SugarKit')
+
+
+class FakeScreen:
+    def __init__(self, areas):
+        self.areas = areas
+
+    def as_pointer(self):
+        return id(self)
+
+
+def newGridScreen(areasCount, width=7680, height=2160):
+    columns = max(1, int(areasCount ** 0.5))
+    rows = -(-areasCount // columns)
+    areas = []
+    for i in range(areasCount):
+        column, row = i % columns, i // columns
+        x0, x1 = column * width // columns, (column + 1) * width // columns - 1
+        y0, y1 = row * height // rows, (row + 1) * height // rows - 1
+        areas.append(SimpleNamespace(x=x0, y=y0, width=x1 - x0, height=y1 - y0,
+                                     spaces=[SimpleNamespace(type='AREA_%d' % i)]))
+    return FakeScreen(areas)
+
+
+def scanAreas(screen, x, y):
+    # Previous getSpaceUnderMouseFromContext loop
+    for area in screen.areas:
+        if sugarKit.isAreaUnderMousePointer(area, x, y):
+            return area
+    return None
+
+
+def run(areasCount=40, seed=0, number=20000):
+    screen = newGridScreen(areasCount)
+    rnd = random.Random(seed)
+    points = [(rnd.randrange(-10, 7690), rnd.randrange(-10, 2170)) for i in range(1000)]
+    for x, y in points:
+        assert scanAreas(screen, x, y) is sugarKit.getAreaUnderMouse(screen, x, y)
+    print('%d areas' % areasCount)
+    for name, fn in [('scan', scanAreas), ('area index', sugarKit.getAreaUnderMouse)]:
+        calls = itertools.cycle(points)
+        seconds = min(timeit.repeat(lambda: fn(screen, *next(calls)), number=number, repeat=5))
+        print('%-12s %7.3f us/query' % (name, seconds / number * 1e6))
+
+    # Resized layout, answers still match a scan: \
+    # first area kept (index rebuilt on found area miss), then all areas (index key changes), \
+    # then areas grown into points no indexed area had, first area kept (rebuilt on no area found)
+    for areas, scale in [(screen.areas[1:], .5), (screen.areas[:1], .5), (screen.areas[1:], 2)]:
+        for area in areas:
+            area.width = int(area.width * scale)
+        assert all(scanAreas(screen, x, y) is sugarKit.getAreaUnderMouse(screen, x, y) for x, y in points)
+    print('resized layout ok')
+
+    # 2x2 grid, right column widened, first area unchanged
+    screen = newGridScreen(4, width=2400, height=1000)
+    assert sugarKit.getAreaUnderMouse(screen, 2500, 200) is None
+    for area in screen.areas[1::2]:
+        area.width = 2000
+    assert sugarKit.getAreaUnderMouse(screen, 2500, 200) is scanAreas(screen, 2500, 200) is screen.areas[1]
+    print('grown area ok')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--areas', type=int, default=40)
+    args = parser.parse_args()
+    run(args.areas)
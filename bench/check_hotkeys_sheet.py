@@ -0,0 +1,36 @@
+# Offline diff of Blender Hotkeys.txt sheet against builder keymap spec + SugarKit features keymap items,
+# no Blender needed.
+# Not documented hotkeys are printed in sheet notation.
+# Run from addon root: python bench/check_hotkeys_sheet.py [--disables]  (exit code 1 on mismatches)
+import os
+import sys
+import time
+import importlib
+
+sys.path.insert(0, os.path.dirname(__file__))
+import fake_bpy  # noqa: E402
+from fake_bpy import PACKAGE  # noqa: E402
+
+fake_bpy.installFakeBpy()
+builder = importlib.import_module(PACKAGE + '.Sugar_Keyconfig_Builder')
+keyconfig = importlib.import_module(PACKAGE + '.src.tools.SugarKit_keyconfig')
+features = importlib.import_module(PACKAGE + '.src.tools.SugarKit_features')
+
+
+def run(showDisables=False):
+    start = time.perf_counter()
+    entries = keyconfig.readHotkeysSheet()
+    parsed = time.perf_counter()
+    records = builder.BuildSugarKeyconfigOperator.buildKeymapSpec()
+    drift = keyconfig.diffHotkeysSheet(
+        entries, records, [binding for feature in features.FEATURES for binding in feature.keymaps])
+    if not showDisables:
+        drift.disablesNotBuilt, drift.disablesNotDocumented = [], []
+    print(keyconfig.getHotkeysSheetDriftText(drift))
+    print('%d sheet entries parsed %.1f ms, %d records diffed %.1f ms' % (
+        len(entries), (parsed - start) * 1000, len(records), drift.seconds * 1000))
+    return drift.notBuilt + drift.notDocumented + drift.disablesNotBuilt + drift.disablesNotDocumented
+
+
+if __name__ == '__main__':
+    sys.exit(1 if run('--disables' in sys.argv) else 0)
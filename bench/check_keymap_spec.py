@@ -0,0 +1,38 @@
+# Offline check of builder keymap spec against src/api/types dumps, no Blender needed.
+# Operators are checked against src/api/types/bpy.ops.json dump (writeOperatorsDump() in Blender) if written,
+# otherwise against bpy.ops.native.json list + python operators of bundled dumps and ui sources.
+# Run from addon root: python bench/check_keymap_spec.py [--warnings]  (exit code 1 on errors)
+import os
+import sys
+import glob
+import time
+import importlib
+
+sys.path.insert(0, os.path.dirname(__file__))
+import fake_bpy  # noqa: E402
+from fake_bpy import ROOT, PACKAGE  # noqa: E402
+
+fake_bpy.installFakeBpy()
+builder = importlib.import_module(PACKAGE + '.Sugar_Keyconfig_Builder')
+keyconfig = importlib.import_module(PACKAGE + '.src.tools.SugarKit_keyconfig')
+
+
+def run(showWarnings=False):
+    start = time.perf_counter()
+    # Addon's own operators are valid targets too
+    index = keyconfig.buildSpecValidationIndex(
+        sorted(glob.glob(os.path.join(ROOT, 'src', 'tools', 'SugarKit*.py'))))
+    indexed = time.perf_counter()
+    records = builder.BuildSugarKeyconfigOperator.buildKeymapSpec()
+    problems = keyconfig.validateKeymapSpec(records, index)
+    done = time.perf_counter()
+    shown = problems if showWarnings else [p for p in problems if p.severity == 'error']
+    print(keyconfig.getKeymapSpecProblemsText(problems, len(records)).split('\n')[0])
+    for line in keyconfig.getKeymapSpecProblemsText(shown, len(records)).split('\n')[1:]:
+        print(line)
+    print('index %.1f ms, spec + check %.1f ms' % ((indexed - start) * 1000, (done - indexed) * 1000))
+    return [problem for problem in problems if problem.severity == 'error']
+
+
+if __name__ == '__main__':
+    sys.exit(1 if run('--warnings' in sys.argv) else 0)
@@ -0,0 +1,53 @@
+# Minimal bpy stand-in for running addon modules outside Blender (bench and check scripts).
+import os
+import sys
+import types
+from types import SimpleNamespace
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+PACKAGE = 'sugarkit_bench'
+
+
+class FakeTypes(SimpleNamespace):
+    # Other bpy.types (SpaceView3D, VIEW3D_MT_view, ...) made on first access for SugarKit modules
+    def __getattr__(self, name):
+        if name.startswith('__'):
+            raise AttributeError(name)
+        fakeType = type(name, (), {'append': staticmethod(lambda fn: None),
+                                   'remove': staticmethod(lambda fn: None)})
+        setattr(self, name, fakeType)
+        return fakeType
+
+
+def installFakeBpy(newKeyconfig=None):
+    # Only what builder and helpers touch at import and build time
+    bpy = types.ModuleType('bpy')
+    bpy.types = FakeTypes(Operator=object, Panel=object, Menu=object, PropertyGroup=object,
+                          AddonPreferences=object, Mesh=type('Mesh', (), {}), bpy_prop_collection=list)
+    propertyDeferred = type('_PropertyDeferred', (), {})
+    bpy.props = SimpleNamespace(_PropertyDeferred=propertyDeferred, **{
+        name: (lambda *args, **kwargs: propertyDeferred()) for name in [
+            'BoolProperty', 'IntProperty', 'FloatProperty', 'StringProperty', 'EnumProperty',
+            'PointerProperty', 'FloatVectorProperty']})
+    handlers = SimpleNamespace(load_post=[], depsgraph_update_post=[], undo_post=[], redo_post=[],
+                               persistent=lambda fn: fn)
+    timers = []
+    bpy.app = SimpleNamespace(version=(3, 6, 0), handlers=handlers, timers=SimpleNamespace(
+        register=lambda fn, first_interval=0, persistent=False: timers.append(fn),
+        unregister=timers.remove, is_registered=timers.__contains__, registered=timers))
+    registered = []
+    bpy.utils = SimpleNamespace(register_class=registered.append, unregister_class=registered.remove,
+                                registered=registered)
+    bpy.msgbus = SimpleNamespace(subscribe_rna=lambda **kwargs: None, clear_by_owner=lambda owner: None)
+    keyconfigs = SimpleNamespace(default=None, active=None, user=None, addon=None,
+                                 new=newKeyconfig)
+    bpy.context = SimpleNamespace(window_manager=SimpleNamespace(keyconfigs=keyconfigs, windows=[]))
+    sys.modules['bpy'] = bpy
+    sys.modules['bpy.types'] = bpy.types
+    sys.modules['bpy.app'] = bpy.app
+    sys.modules['bpy.app.handlers'] = handlers
+    # Addon root as package without running its __init__ (registers classes) \
+    package = types.ModuleType(PACKAGE)
+    package.__path__ = [ROOT]
+    sys.modules[PACKAGE] = package
+    return bpy
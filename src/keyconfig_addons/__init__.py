@@ -0,0 +1,74 @@
+import importlib
+from types import SimpleNamespace
+from ..tools.SugarKit_helpers import parseHotkeyStringInput
+
+
+# / Hotkeys of other addons, edited in user keyconfig after Sugar Keyconfig is built.
+# / Profile module is imported only if its addon is enabled. New profile: module with HOTKEYS here \
+# / and a line in ADDON_HOTKEYS_PROFILES, or registerAddonHotkeysProfile() from anywhere.
+
+
+ADDON_HOTKEYS_PROFILES = {  # {addon module name: profile module | def -> [rule]}
+    'space_view3d_copy_attributes': '.copy_attributes',
+    'object_boolean_tools': '.bool_tool',
+    'mesh_f2': '.f2',
+    'node_wrangler': '.node_wrangler',
+    'NodeRelax-Blender-Addon-main': '.node_relax',
+}
+
+
+def registerAddonHotkeysProfile(addonName, profile):
+    ADDON_HOTKEYS_PROFILES[addonName] = profile
+
+
+def unregisterAddonHotkeysProfile(addonName):
+    ADDON_HOTKEYS_PROFILES.pop(addonName, None)
+
+
+def edit(
+    keymapName,
+    operatorData,
+    hotkey,
+    oldHotkey=None,  # None - one that found by find_from_operator()
+    oldHotkeyExactProps=None,
+):
+    return SimpleNamespace(
+        action='edit',
+        keymapName=keymapName,
+        operatorData=operatorData,
+        hotkey=parseHotkeyStringInput(hotkey),
+        oldHotkey=parseHotkeyStringInput(oldHotkey),
+        oldHotkeyExactProps=parseHotkeyStringInput(oldHotkeyExactProps),
+    )
+
+
+def add(
+    keymapName,
+    operatorData,
+    hotkey,
+    setKmiProps=None,
+    disableOld=False,
+    disableOldExactProps=None
+):
+    return SimpleNamespace(
+        action='add',
+        keymapName=keymapName,
+        operatorData=operatorData,
+        hotkey=parseHotkeyStringInput(hotkey),
+        setKmiProps=setKmiProps,
+        disableOld=parseHotkeyStringInput(disableOld),
+        disableOldExactProps=parseHotkeyStringInput(disableOldExactProps),
+    )
+
+
+def loadAddonHotkeysRules(enabledAddons):
+    # -> {addon name: [rule]} for enabled addons only, in profiles order
+    rulesByAddon = {}
+    for addonName, profile in ADDON_HOTKEYS_PROFILES.items():
+        if addonName not in enabledAddons:
+            continue
+        if callable(profile):
+            rulesByAddon[addonName] = list(profile())
+        else:
+            rulesByAddon[addonName] = importlib.import_module(profile, __name__).HOTKEYS
+    return rulesByAddon
@@ -0,0 +1,15 @@
+# Bool Tool
+from . import edit
+
+HOTKEYS = [
+    edit('Object Mode', {'wm.call_menu': {'name': 'VIEW3D_MT_booltool_menu'}},
+         'T shift alt B', oldHotkey='B shift ctrl'),
+    edit('Object Mode', 'object.booltool_auto_difference',
+         'MINUS shift alt DOUBLE_CLICK', oldHotkey='NUMPAD_MINUS shift ctrl'),
+    edit('Object Mode', 'object.booltool_auto_union',
+         'EQUAL shift alt DOUBLE_CLICK', oldHotkey='NUMPAD_PLUS shift ctrl'),
+    edit('Object Mode', 'object.booltool_auto_intersect',
+         'EIGHT shift alt DOUBLE_CLICK', oldHotkey='NUMPAD_ASTERIX shift ctrl'),
+    edit('Object Mode', 'object.booltool_auto_slice',
+         'SLASH shift alt DOUBLE_CLICK', oldHotkey='NUMPAD_SLASH shift ctrl'),
+]
@@ -0,0 +1,9 @@
+# Copy Attributes Menu
+from . import edit
+
+HOTKEYS = [
+    edit('Pose', {'wm.call_menu': {'name': 'VIEW3D_MT_posecopypopup'}},
+         'C shift', oldHotkey='C ctrl'),
+    edit('Object Mode', {'wm.call_menu': {'name': 'VIEW3D_MT_copypopup'}},
+         'C shift', oldHotkey='C ctrl'),
+]
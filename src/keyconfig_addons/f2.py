@@ -0,0 +1,6 @@
+# F2
+from . import edit
+
+HOTKEYS = [
+    edit('Mesh', 'mesh.f2', 'F alt', oldHotkey='F'),
+]
@@ -0,0 +1,9 @@
+# Node Relax
+from . import edit, add
+
+HOTKEYS = [
+    edit('Node Editor', 'node_relax.brush',
+         'R alt', oldHotkey='R shift'),
+    add('Node Editor', 'node_relax.arrange',
+        'A ctrl alt'),
+]
@@ -0,0 +1,124 @@
+# Node Wrangler
+from . import edit, add
+
+HOTKEYS = [
+    edit('Node Editor', {'node.nw_preview_node': {'run_in_geometry_nodes': False}},
+         'RIGHTMOUSE ctrl CLICK', oldHotkey='LEFTMOUSE shift ctrl'),
+    edit('Node Editor', {'node.nw_preview_node': {'run_in_geometry_nodes': True}},
+         'RIGHTMOUSE shift ctrl CLICK', oldHotkey='LEFTMOUSE shift alt'),
+    edit('Node Editor', 'node.nw_link_out',
+         'V DOUBLE_CLICK', oldHotkey='O'),
+    add('Node Editor', 'node.nw_link_out',
+        'RET shift'),
+    edit('Node Editor', {'wm.call_menu': {'name': 'NODE_MT_nw_switch_node_type_menu'}},
+         'S alt', oldHotkey='S shift'),
+    edit('Node Editor', {'node.nw_lazy_connect': {'with_menu': False}},
+         'RIGHTMOUSE shift CLICK_DRAG', oldHotkey='RIGHTMOUSE alt'),
+    edit('Node Editor', {'node.nw_lazy_connect': {'with_menu': True}},
+         'RIGHTMOUSE ctrl CLICK_DRAG', oldHotkey='RIGHTMOUSE shift alt'),
+    edit('Node Editor', 'node.nw_lazy_mix',
+         'RIGHTMOUSE shift ctrl CLICK_DRAG', oldHotkey='RIGHTMOUSE shift ctrl'),
+    edit('Node Editor', {'wm.call_menu': {'name': 'NODE_MT_nw_link_active_to_selected_menu'}},
+         'C shift ctrl', oldHotkey='BACK_SLASH'),
+    edit('Node Editor', {'node.nw_link_active_to_selected': {'replace': True, 'use_outputs_names': False, 'use_node_names': False}},
+         'C alt', oldHotkey='K shift'),
+    edit('Node Editor', {'node.nw_link_active_to_selected': {'replace': False, 'use_outputs_names': False, 'use_node_names': False}},
+         'C alt DOUBLE_CLICK', oldHotkey='K'),
+    edit('Node Editor', {'node.nw_link_active_to_selected': {'replace': True, 'use_outputs_names': True, 'use_node_names': False}},
+         'COMMA', oldHotkey='SEMI_COLON shift'),
+    edit('Node Editor', {'node.nw_link_active_to_selected': {'replace': False, 'use_outputs_names': True, 'use_node_names': False}},
+         'COMMA DOUBLE_CLICK', oldHotkey='SEMI_COLON'),
+    edit('Node Editor', {'node.nw_link_active_to_selected': {'replace': True, 'use_outputs_names': False, 'use_node_names': True}},
+         'COMMA alt', oldHotkey='QUOTE shift'),
+    edit('Node Editor', {'node.nw_link_active_to_selected': {'replace': False, 'use_outputs_names': False, 'use_node_names': True}},
+         'COMMA alt DOUBLE_CLICK', oldHotkey='QUOTE'),
+    edit('Node Editor', 'node.nw_detach_outputs',
+         'D alt', oldHotkey='D shift alt'),
+    edit('Node Editor', 'node.nw_del_unused',
+         'X shift alt', oldHotkey='X alt'),
+    edit('Node Editor', 'node.nw_align_nodes',
+         'A ctrl', oldHotkey='EQUAL shift'),
+    edit('Node Editor', 'node.nw_reload_images',
+         'R shift ctrl alt', oldHotkey='R alt'),
+    edit('Node Editor', 'node.nw_reset_nodes',
+         'R alt', oldHotkey='BACK_SPACE'),
+    edit('Node Editor', 'node.nw_bg_reset',
+         'Z alt', oldHotkey='Z'),
+    edit('Node Editor', {'wm.call_menu': {'name': 'NODE_MT_nw_copy_node_properties_menu'}},
+         'C shift alt', oldHotkey='C shift'),
+    edit('Node Editor', 'node.nw_frame_selected',
+         'B shift ctrl', oldHotkey='P shift'),
+    edit('Node Editor', 'node.nw_copy_label',
+         'L', oldHotkey='V shift'),
+    edit('Node Editor', 'node.nw_clear_label',
+         'L alt', oldHotkey='L alt'),
+    edit('Node Editor', 'node.nw_modify_labels',
+         'L shift ctrl', oldHotkey='L shift alt'),
+    # selected merge auto
+    edit('Node Editor', 'node.nw_merge_nodes',
+         'M shift ctrl A', oldHotkey='ZERO ctrl'),
+    edit('Node Editor', 'node.nw_merge_nodes',
+         'COMMA shift ctrl A', oldHotkey='COMMA ctrl'),
+    edit('Node Editor', 'node.nw_merge_nodes',
+         'PERIOD shift ctrl A', oldHotkey='PERIOD ctrl'),
+    edit('Node Editor', 'node.nw_merge_nodes',
+         'SLASH shift ctrl A', oldHotkey='SLASH ctrl'),
+    edit('Node Editor', 'node.nw_merge_nodes',
+         'EIGHT shift ctrl A', oldHotkey='EIGHT ctrl'),
+    edit('Node Editor', 'node.nw_merge_nodes',
+         'MINUS shift ctrl A', oldHotkey='MINUS ctrl'),
+    edit('Node Editor', 'node.nw_merge_nodes',
+         'EQUAL shift ctrl A', oldHotkey='EQUAL ctrl'),
+    # merge mix color
+    edit('Node Editor', 'node.nw_merge_nodes',
+         'M shift ctrl CLICK', oldHotkey='ZERO ctrl alt'),
+    edit('Node Editor', 'node.nw_merge_nodes',
+         'SLASH shift ctrl CLICK', oldHotkey='SLASH ctrl alt'),
+    edit('Node Editor', 'node.nw_merge_nodes',
+         'EIGHT shift ctrl CLICK', oldHotkey='EIGHT ctrl alt'),
+    edit('Node Editor', 'node.nw_merge_nodes',
+         'MINUS shift ctrl CLICK', oldHotkey='MINUS ctrl alt'),
+    edit('Node Editor', 'node.nw_merge_nodes',
+         'EQUAL shift ctrl CLICK', oldHotkey='EQUAL ctrl alt'),
+    # merge math
+    edit('Node Editor', 'node.nw_merge_nodes',
+         'COMMA shift alt', oldHotkey='COMMA shift ctrl'),
+    edit('Node Editor', 'node.nw_merge_nodes',
+         'PERIOD shift alt', oldHotkey='PERIOD shift ctrl'),
+    edit('Node Editor', 'node.nw_merge_nodes',
+         'SLASH shift alt', oldHotkey='SLASH shift ctrl'),
+    edit('Node Editor', 'node.nw_merge_nodes',
+         'EIGHT shift alt', oldHotkey='EIGHT shift ctrl'),
+    edit('Node Editor', 'node.nw_merge_nodes',
+         'MINUS shift alt', oldHotkey='MINUS shift ctrl'),
+    edit('Node Editor', 'node.nw_merge_nodes',
+         'EQUAL shift alt', oldHotkey='EQUAL shift ctrl'),
+    # set mix/math type
+    edit('Node Editor', 'node.nw_batch_change',
+         'M ctrl alt', oldHotkey='ZERO alt'),
+    edit('Node Editor', 'node.nw_batch_change',
+         'COMMA ctrl alt', oldHotkey='COMMA alt'),
+    edit('Node Editor', 'node.nw_batch_change',
+         'PERIOD ctrl alt', oldHotkey='PERIOD alt'),
+    edit('Node Editor', 'node.nw_batch_change',
+         'SLASH ctrl alt', oldHotkey='SLASH alt'),
+    edit('Node Editor', 'node.nw_batch_change',
+         'EIGHT ctrl alt', oldHotkey='EIGHT alt'),
+    edit('Node Editor', 'node.nw_batch_change',
+         'MINUS ctrl alt', oldHotkey='MINUS alt'),
+    edit('Node Editor', 'node.nw_batch_change',
+         'EQUAL ctrl alt', oldHotkey='EQUAL alt'),
+    edit('Node Editor', 'node.nw_batch_change',
+         'UP_ARROW ctrl alt', oldHotkey='UP_ARROW alt'),
+    edit('Node Editor', 'node.nw_batch_change',
+         'DOWN_ARROW ctrl alt', oldHotkey='DOWN_ARROW alt'),
+    # set node value
+    edit('Node Editor', 'node.nw_factor',
+         'ONE ctrl alt', oldHotkey='ONE shift ctrl alt'),
+    edit('Node Editor', 'node.nw_factor',
+         'ZERO ctrl alt', oldHotkey='ZERO shift ctrl alt'),
+    edit('Node Editor', 'node.nw_factor',
+         'LEFT_ARROW ctrl alt', oldHotkey='LEFT_ARROW shift ctrl alt'),
+    edit('Node Editor', 'node.nw_factor',
+         'RIGHT_ARROW ctrl alt', oldHotkey='RIGHT_ARROW shift ctrl alt'),
+]
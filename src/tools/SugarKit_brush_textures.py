@@ -0,0 +1,78 @@
+import bpy
+from .SugarKit_helpers import *
+
+
+# / Brush Tools
+
+
+def BrushTextureProps(isRegister):
+    def handleActiveBrushTextureImageUpdate(self, context):
+        setActiveBrushTextureImageInContext(
+            context, self.sk_active_brush_texture_image)
+
+    def handleActiveBrushMaskTextureImageUpdate(self, context):
+        setActiveBrushTextureImageInContext(
+            context, self.sk_active_brush_mask_texture_image)
+
+    if isRegister:
+        bpy.types.Scene.sk_active_brush_texture_image = bpy.props.PointerProperty(
+            name="", type=bpy.types.Image, update=handleActiveBrushTextureImageUpdate)
+        bpy.types.Scene.sk_active_brush_mask_texture_image = bpy.props.PointerProperty(
+            name="", type=bpy.types.Image, update=handleActiveBrushMaskTextureImageUpdate)
+    else:
+        del bpy.types.Scene.sk_active_brush_texture_image
+        del bpy.types.Scene.sk_active_brush_mask_texture_image
+
+
+class BrushTextureImageSetMenuOperator(bpy.types.Operator):
+    bl_label = "Brush Texture Image Set Menu"
+    bl_idname = "paint.sk_brush_texture_image_set_active_menu"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def execute(self, context):
+        tex = getActiveBrushTextureInContext(context)
+        if not tex:
+            self.report({'INFO'}, "Brush has no texture!")
+            return {'FINISHED'}
+
+        context.scene.sk_active_brush_texture_image = tex.image
+        bpy.ops.wm.call_menu(
+            name=BrushTextureImageSetMenu.bl_idname)
+        return {'FINISHED'}
+
+
+class BrushTextureImageSetMenu(bpy.types.Menu):
+    bl_label = "Set Texture Image"
+    bl_idname = "sk_brush_texture_image_set_active_menu"
+
+    def draw(self, context):
+        layout = self.layout
+        layout.template_ID(
+            context.scene, "sk_active_brush_texture_image", new="image.new", open="image.open")
+
+
+class BrushMaskTextureImageSetMenuOperator(bpy.types.Operator):
+    bl_label = "Brush Mask Texture Image Set Menu"
+    bl_idname = "paint.sk_brush_mask_texture_image_set_active_menu"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def execute(self, context):
+        tex = getActiveBrushMaskTextureInContext(context)
+        if not tex:
+            self.report({'INFO'}, "Brush has no texture!")
+            return {'FINISHED'}
+
+        context.scene.sk_active_brush_mask_texture_image = tex.image
+        bpy.ops.wm.call_menu(
+            name=BrushMaskTextureImageSetMenu.bl_idname)
+        return {'FINISHED'}
+
+
+class BrushMaskTextureImageSetMenu(bpy.types.Menu):
+    bl_label = "Set Mask Texture Image"
+    bl_idname = "sk_brush_mask_texture_image_set_active_menu"
+
+    def draw(self, context):
+        layout = self.layout
+        layout.template_ID(
+            context.scene, "sk_active_brush_mask_texture_image", new="image.new", open="image.open")
@@ -0,0 +1,58 @@
+import bpy
+from .SugarKit_helpers import *
+
+
+# / Curve Tools
+
+
+class CurveSelectWholeHandlePointsOperator(bpy.types.Operator):
+    bl_label = "Curve Select Whole Handle Points"
+    bl_idname = "curve.sk_curve_select_whole_handle_points"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def execute(self, context):
+        actPoint = getCurveActivePoint(context.active_object, True)
+        selectWholeBezierPoint(actPoint)
+        return {'FINISHED'}
+
+
+class CurveToggleDepthOperator(bpy.types.Operator):
+    bl_label = "Curve Toggle Depth"
+    bl_idname = "curve.sk_curve_toggle_depth"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    @classmethod
+    def poll(cls, context):
+        try:
+            curveData = context.active_object.data
+        except Exception as er:
+            curveData = None
+        return curveData and context.active_object.type == "CURVE"
+
+    def execute(self, context):
+        curveData = context.active_object.data
+        curveData.bevel_depth = 0.01 if curveData.bevel_depth == 0.0 else 0.0
+        return {'FINISHED'}
+
+
+class CurveToggleFillCapsOperator(bpy.types.Operator):
+    bl_label = "Curve Toggle Fill Caps"
+    bl_idname = "curve.sk_curve_toggle_fill_caps"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    @classmethod
+    def poll(cls, context):
+        try:
+            curveData = context.active_object.data
+        except Exception as er:
+            curveData = None
+        return curveData and context.active_object.type == "CURVE"
+
+    def execute(self, context):
+        curveData = context.active_object.data
+        curveData.use_fill_caps = True if curveData.use_fill_caps == False else False
+        return {'FINISHED'}
+
+
+# TODO: 3.2.x
+# CurveSeparateByLooseSplines [shift alt J]
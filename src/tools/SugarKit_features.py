@@ -0,0 +1,370 @@
+import bpy
+import sys
+import time
+import importlib
+import importlib.util
+from types import SimpleNamespace
+from .SugarKit_helpers import addAddonKeymapItems, removeAddonKeymapItems
+
+
+# / SugarKit features: classes, addon keymap items, props, menus and msgbus subscriptions.
+# / Registered from FEATURES table, each feature lives in its own SugarKit_<id> module.
+# / Lazy features (with stubs) register only stub operators for their keymap items, \
+# / the module is imported and the rest registered on first stub invoke.
+# / Optional features can be switched off in addon preferences, then they are never imported.
+
+
+def Feature(
+    id,
+    name,
+    module,  # relative to this package
+    classes=[],  # class names, registered in order
+    keymaps=[],  # [(keymap name, class name, hotkey)]
+    props=[],  # def(isRegister) names, run after classes
+    menus=[],
+    subscriptions=[],
+    optional=True,  # False - always registered, others depend on it
+    stubs=[],  # [(class name, bl_idname, bl_label)] - operators registered before module import, \
+    # must have no properties (state in plain class attributes) and REGISTER, UNDO options
+):
+    return SimpleNamespace(id=id, name=name, module=module, classes=list(classes), keymaps=list(keymaps),
+                           props=list(props), menus=list(menus), subscriptions=list(subscriptions),
+                           optional=optional, stubs=list(stubs))
+
+
+FEATURES = [
+    Feature('window_utils', 'Window Utils', '.SugarKit',
+            classes=['WindowUpdateGlobalEventOperator'],
+            optional=False),
+    # Not lazy: View menu entry and Brush.color subscription are needed from startup
+    Feature('viewport_color', 'Object Viewport Alpha/Color', '.SugarKit_viewport_color',
+            classes=['ObjectViewportAlphaToggleOperator',
+                     'ObjectViewportColorSetPanelOperator', 'ObjectViewportColorSetPanel'],
+            keymaps=[('3D View', 'ObjectViewportAlphaToggleOperator', 'NINE'),
+                     ('Object Mode', 'ObjectViewportColorSetPanelOperator', 'C')],
+            menus=['ObjectViewportMenus'],
+            subscriptions=['MaterialUsersIndex', 'SubscribeBrushColor']),
+    Feature('modifier_setups', 'Object Modifiers Setups', '.SugarKit_modifier_setups',
+            classes=['ModifierSetupAxisBendOperator', 'ModifierSetupRadialArrayOperator'],
+            keymaps=[('Object Mode', 'ModifierSetupAxisBendOperator', 'B shift alt A'),
+                     ('Object Mode', 'ModifierSetupRadialArrayOperator', 'A shift alt R')],
+            stubs=[('ModifierSetupAxisBendOperator', 'object.sk_modifier_setup_axis_bend',
+                    'Add Modifier Setup'),
+                   ('ModifierSetupRadialArrayOperator', 'object.sk_setup_radial_array_modifier',
+                    'Add Modifier Setup')]),
+    Feature('outliner', 'Outliner Unhide/Select Grouped', '.SugarKit_outliner',
+            classes=['OutlinerUnhideAllCollectionsOperator',
+                     'OutlinerSelectGroupedOperator', 'OutlinerSelectGroupedUnhideOperator'],
+            keymaps=[('Object Mode', 'OutlinerUnhideAllCollectionsOperator', 'H ctrl alt'),
+                     ('Outliner', 'OutlinerUnhideAllCollectionsOperator', 'H ctrl alt'),
+                     ('Outliner', 'OutlinerSelectGroupedOperator', 'G'),
+                     ('Outliner', 'OutlinerSelectGroupedUnhideOperator', 'G DOUBLE_CLICK')],
+            stubs=[('OutlinerUnhideAllCollectionsOperator', 'outliner.sk_outliner_unhide_all_collections',
+                    'Outliner Unhide All Collections'),
+                   ('OutlinerSelectGroupedOperator', 'outliner.sk_outliner_select_grouped',
+                    'Outliner Select Grouped'),
+                   ('OutlinerSelectGroupedUnhideOperator', 'outliner.sk_outliner_select_grouped_unhide',
+                    'Outliner Select Grouped Unhide')]),
+    Feature('vertex_groups', 'Vertex Groups Ops', '.SugarKit_vertex_groups',
+            classes=['VertexGroupRenamePanelOperator', 'VertexGroupRenamePanel',
+                     'VertexGroupToSculptFaceSetOperator', 'VertexGroupToPaintSelectMaskOperator'],
+            keymaps=[('Mesh', 'VertexGroupRenamePanelOperator', 'R ctrl alt'),
+                     ('Sculpt', 'VertexGroupToSculptFaceSetOperator', 'G alt'),
+                     ('Paint Vertex Selection (Weight, Vertex)', 'VertexGroupToPaintSelectMaskOperator', 'G'),
+                     ('Paint Face Mask (Weight, Vertex, Texture)', 'VertexGroupToPaintSelectMaskOperator', 'G')],
+            props=['VertexGroupProps'],
+            stubs=[('VertexGroupRenamePanelOperator', 'mesh.sk_vertex_group_rename',
+                    'Vertex Group Rename'),
+                   ('VertexGroupToSculptFaceSetOperator', 'paint.sk_vertex_group_to_sculpt_face_set',
+                    'Vertex Group To Sculpt Face Set'),
+                   ('VertexGroupToPaintSelectMaskOperator', 'paint.sk_vertex_group_to_paint_select_mask',
+                    'Vertex Group To Paint Select Mask')]),
+    Feature('curves', 'Curve Tools', '.SugarKit_curves',
+            classes=['CurveSelectWholeHandlePointsOperator',
+                     'CurveToggleDepthOperator', 'CurveToggleFillCapsOperator'],
+            keymaps=[('Curve', 'CurveSelectWholeHandlePointsOperator', 'LEFT_SHIFT DOUBLE_CLICK'),
+                     ('Curve', 'CurveToggleDepthOperator', 'T shift'),
+                     ('Curve', 'CurveToggleFillCapsOperator', 'F shift')],
+            stubs=[('CurveSelectWholeHandlePointsOperator', 'curve.sk_curve_select_whole_handle_points',
+                    'Curve Select Whole Handle Points'),
+                   ('CurveToggleDepthOperator', 'curve.sk_curve_toggle_depth', 'Curve Toggle Depth'),
+                   ('CurveToggleFillCapsOperator', 'curve.sk_curve_toggle_fill_caps', 'Curve Toggle Fill Caps')]),
+    Feature('brush_textures', 'Brush Texture Image', '.SugarKit_brush_textures',
+            classes=['BrushTextureImageSetMenuOperator', 'BrushTextureImageSetMenu',
+                     'BrushMaskTextureImageSetMenuOperator', 'BrushMaskTextureImageSetMenu'],
+            keymaps=[(kmn, 'BrushTextureImageSetMenuOperator', 'T ctrl')
+                     for kmn in ['Sculpt', 'Vertex Paint', 'Weight Paint', 'Image Paint']] +
+                    [('Image Paint', 'BrushMaskTextureImageSetMenuOperator', 'T alt')],
+            props=['BrushTextureProps'],
+            stubs=[('BrushTextureImageSetMenuOperator', 'paint.sk_brush_texture_image_set_active_menu',
+                    'Brush Texture Image Set Menu'),
+                   ('BrushMaskTextureImageSetMenuOperator', 'paint.sk_brush_mask_texture_image_set_active_menu',
+                    'Brush Mask Texture Image Set Menu')]),
+    Feature('sculpt_tools', 'Sculpt Draw Curve/Symmetrize Weld', '.SugarKit_sculpt_tools',
+            classes=['SculptDrawCurveOperator',
+                     'SculptSymmetrizeWeldPanelOperator', 'SculptSymmetrizeWeldPanel'],
+            keymaps=[('Sculpt', 'SculptDrawCurveOperator', 'C shift alt'),
+                     ('Sculpt', 'SculptSymmetrizeWeldPanelOperator', 'W shift alt')],
+            stubs=[('SculptDrawCurveOperator', 'sculpt.sk_sculpt_draw_curve', 'Sculpt Quick Draw Curve'),
+                   ('SculptSymmetrizeWeldPanelOperator', 'paint.sk_sculpt_symmetrize_weld_panel',
+                    'Sculpt Symmetrize Weld Panel')]),
+    # Workspace subscription only serves the modal, starts with it
+    Feature('sculpt_trim', 'Sculpt Trim Curve', '.SugarKit_sculpt_trim',
+            classes=['SculptTrimCurveModalOperator', 'SculptTrimCurveResolutionDialogOperator'],
+            keymaps=[('Sculpt', 'SculptTrimCurveModalOperator', 'X shift alt')],
+            subscriptions=['SubscribeWorkSpace'],
+            stubs=[('SculptTrimCurveModalOperator', 'sculpt.sk_trim_curve_modal', 'Sculpt Trim Curve Modal')]),
+    Feature('paint_tools', 'Paint Gradient/Color Palette', '.SugarKit_paint_tools',
+            classes=['PaintGradientSettingsPanelOperator', 'PaintGradientSettingsPanel',
+                     'PaintColorPalettePanelOperator', 'PaintColorPalettePanel'],
+            keymaps=[(kmn, 'PaintGradientSettingsPanelOperator', 'G ctrl')
+                     for kmn in ['Vertex Paint', 'Image Paint']] +
+                    [(kmn, 'PaintColorPalettePanelOperator', 'C')
+                     for kmn in ['Vertex Paint', 'Image Paint']],
+            stubs=[('PaintGradientSettingsPanelOperator', 'paint.sk_paint_gradient_panel',
+                    'Paint Gradient Settings Panel'),
+                   ('PaintColorPalettePanelOperator', 'paint.sk_paint_color_palette_panel',
+                    'Paint Color Palette Panel')]),
+    Feature('paint_mask', 'Paint Mask', '.SugarKit_paint_mask',
+            classes=['PaintMaskUvTransformProps', 'PaintMaskUvTransformPanelOperator',
+                     'PaintMaskUvTransformPanel', 'PaintMaskImageInvertOperator'],
+            keymaps=[('Image Paint', 'PaintMaskUvTransformPanelOperator', 'Q ctrl'),
+                     ('Image Paint', 'PaintMaskImageInvertOperator', 'Q alt')],
+            props=['PaintMaskProps'],
+            stubs=[('PaintMaskUvTransformPanelOperator', 'paint.sk_paint_mask_uv_transform_panel',
+                    'Paint Mask Transform Form Panel'),
+                   ('PaintMaskImageInvertOperator', 'paint.sk_paint_stencil_mask_image_invert',
+                    'Paint Mask Image Invert')]),
+    Feature('image_shading', 'Image/Shading', '.SugarKit_image_shading',
+            classes=['PackAllSavedOperator', 'ImagePackOperator', 'ImageUnpackOperator',
+                     'ShadingCreateNewOperator',
+                     'ImageSetActiveMenuOperator', 'ImageSetActiveMenu',
+                     'ShadingSetActiveMenuOperator', 'ShadingSetActiveMenu',
+                     'ImageKeepFakeUserOperator', 'ShadingKeepFakeUserOperator',
+                     'ImageMakeSingleCopyOperator', 'MaterialMakeSingleCopyOperator',
+                     'ImageCloseOperator', 'ShadingCloseOperator',
+                     'ImageRemoveOperator', 'ImageRemoveConfirmMenuOperator', 'ImageRemoveConfirmMenu',
+                     'ShadingRemoveOperator', 'ShadingRemoveConfirmMenuOperator', 'ShadingRemoveConfirmMenu'],
+            keymaps=[('Window', 'PackAllSavedOperator', 'SPACE shift ctrl'),
+                     ('Image', 'ImagePackOperator', 'SPACE alt'),
+                     ('Image', 'ImageUnpackOperator', 'SPACE alt DOUBLE_CLICK'),
+                     ('Node Editor', 'ShadingCreateNewOperator', 'N alt'),
+                     ('Image', 'ImageSetActiveMenuOperator', 'TAB shift ctrl'),
+                     ('Node Editor', 'ShadingSetActiveMenuOperator', 'TAB shift ctrl'),
+                     ('Image', 'ImageKeepFakeUserOperator', 'K'),
+                     ('Node Editor', 'ShadingKeepFakeUserOperator', 'K'),
+                     ('Image', 'ImageMakeSingleCopyOperator', 'M alt'),
+                     ('Node Editor', 'MaterialMakeSingleCopyOperator', 'M alt'),
+                     ('Image', 'ImageCloseOperator', 'X ctrl alt'),
+                     ('Node Editor', 'ShadingCloseOperator', 'X ctrl alt'),
+                     ('Image', 'ImageRemoveOperator', 'X shift ctrl'),
+                     ('Node Editor', 'ShadingRemoveOperator', 'X shift ctrl')],
+            stubs=[('PackAllSavedOperator', 'file.sk_pack_all_saved', 'Pack All Saved'),
+                   ('ImagePackOperator', 'file.sk_image_pack', 'Image Pack'),
+                   ('ImageUnpackOperator', 'file.sk_image_unpack', 'Image Unpack'),
+                   ('ShadingCreateNewOperator', 'node.sk_shader_new', 'Shading New'),
+                   ('ImageSetActiveMenuOperator', 'image.sk_image_set_active_menu', 'Image Set Active Menu'),
+                   ('ShadingSetActiveMenuOperator', 'node.sk_shader_set_active_menu', 'Shading Set Active Menu'),
+                   ('ImageKeepFakeUserOperator', 'image.sk_image_keep_fake_user', 'Image Keep Fake User'),
+                   ('ShadingKeepFakeUserOperator', 'node.sk_shader_keep_fake_user', 'Shading Keep Fake User'),
+                   ('ImageMakeSingleCopyOperator', 'image.sk_image_make_single_copy', 'Image Make Single Copy'),
+                   ('MaterialMakeSingleCopyOperator', 'node.sk_material_make_single_copy',
+                    'Material Make Single Copy'),
+                   ('ImageCloseOperator', 'image.sk_image_close', 'Image Close'),
+                   ('ShadingCloseOperator', 'node.sk_shader_close', 'Shading Close'),
+                   ('ImageRemoveOperator', 'image.sk_image_remove', 'Image Remove'),
+                   ('ShadingRemoveOperator', 'node.sk_shader_remove', 'Shading Remove')]),
+]
+
+# [SimpleNamespace(feature, module, stubs, keymapItems)] in register order, module None until loaded
+registeredFeatures = []
+featureTimings = {}  # {feature id: seconds} of last register, 'keymaps' for the batch
+featureLoadTimings = {}  # {feature id: seconds} of lazy feature first invoke load
+staleModules = set()  # imported before this register, reloaded on next use
+
+
+STUB_DISPATCHERS = ['poll', 'invoke', 'execute', 'modal']
+
+
+def getFeature(featureId):
+    return next((feature for feature in FEATURES if feature.id == featureId), None)
+
+
+def getRegisteredFeature(featureId):
+    return next((registered for registered in registeredFeatures
+                 if registered.feature.id == featureId), None)
+
+
+def getFeatureModuleName(feature):
+    return importlib.util.resolve_name(feature.module, __package__)
+
+
+def getFeatureModule(feature):
+    # Stale modules are reloaded once (addon re-enable picks up edits)
+    name = getFeatureModuleName(feature)
+    if name in staleModules and name in sys.modules:
+        staleModules.discard(name)
+        return importlib.reload(sys.modules[name])
+    return importlib.import_module(name)
+
+
+def newStubOperator(registered, className, idName, label):
+    # Registered in place of module operator, first invoke/execute loads the feature \
+    # and runs module operator methods on stub instance (class attributes copied to stub)
+    def getImpl():
+        return getattr(loadFeature(registered), className)
+
+    def poll(cls, context):
+        if registered.module == None:
+            return True
+        impl = getattr(registered.module, className)
+        return impl.poll(context) if 'poll' in vars(impl) else True
+
+    def invoke(self, context, event):
+        impl = getImpl()
+        if 'poll' in vars(impl) and not impl.poll(context):
+            return {'CANCELLED'}
+        if 'invoke' in vars(impl):
+            return impl.invoke(self, context, event)
+        return impl.execute(self, context)
+
+    def execute(self, context):
+        return getImpl().execute(self, context)
+
+    def modal(self, context, event):
+        return getImpl().modal(self, context, event)
+
+    return type(className, (bpy.types.Operator,), {
+        'bl_idname': idName,
+        'bl_label': label,
+        'bl_options': {'REGISTER', 'UNDO'},
+        'poll': classmethod(poll),
+        'invoke': invoke,
+        'execute': execute,
+        'modal': modal,
+    })
+
+
+def copyImplToStub(impl, stub):
+    # Plain attributes only, props set on registered stub class would be registered as RNA ones
+    for name, value in vars(impl).items():
+        if name.startswith('__') or name.startswith('bl_') or name in STUB_DISPATCHERS or \
+                isinstance(value, bpy.props._PropertyDeferred):
+            continue
+        setattr(stub, name, value)
+
+
+def loadFeature(registered):
+    # Imports feature module, registers its classes (stubs stand in for their ones) and hooks
+    if registered.module != None:
+        return registered.module
+    feature = registered.feature
+    start = time.perf_counter()
+    module = getFeatureModule(feature)
+    for className in feature.classes:
+        if className in registered.stubs:
+            impl, stub = getattr(module, className), registered.stubs[className]
+            if impl.bl_idname != stub.bl_idname:
+                print('SugarKit: %s stub bl_idname %s differs from %s' % (
+                    className, stub.bl_idname, impl.bl_idname))
+            copyImplToStub(impl, stub)
+        else:
+            bpy.utils.register_class(getattr(module, className))
+    for hookName in feature.props + feature.menus + feature.subscriptions:
+        getattr(module, hookName)(True)
+    registered.module = module
+    if registered.stubs:
+        featureLoadTimings[feature.id] = time.perf_counter() - start
+    return module
+
+
+def registerFeature(feature):
+    registered = SimpleNamespace(feature=feature, module=None, stubs={}, keymapItems=[])
+    for className, idName, label in feature.stubs:
+        registered.stubs[className] = newStubOperator(registered, className, idName, label)
+        bpy.utils.register_class(registered.stubs[className])
+    registeredFeatures.append(registered)
+    if not registered.stubs:
+        loadFeature(registered)
+    return registered
+
+
+def getFeatureBindings(registered):
+    # Stub bl_idname for lazy features, no import needed
+    def getIdName(className):
+        if className in registered.stubs:
+            return registered.stubs[className].bl_idname
+        return getattr(registered.module, className).bl_idname
+
+    return [(kmName, getIdName(className), hotkey)
+            for kmName, className, hotkey in registered.feature.keymaps]
+
+
+def unregisterFeature(registered):
+    feature, module = registered.feature, registered.module
+    removeAddonKeymapItems(registered.keymapItems)
+    if module != None:
+        for hookName in reversed(feature.props + feature.menus + feature.subscriptions):
+            getattr(module, hookName)(False)
+        for className in reversed(feature.classes):
+            if className not in registered.stubs:
+                bpy.utils.unregister_class(getattr(module, className))
+    for stub in reversed(list(registered.stubs.values())):
+        bpy.utils.unregister_class(stub)
+    registeredFeatures.remove(registered)
+    featureLoadTimings.pop(feature.id, None)
+
+
+def registerFeatures(isEnabled=lambda feature: True):
+    featureTimings.clear()
+    staleModules.clear()
+    staleModules.update(name for name in map(getFeatureModuleName, FEATURES) if name in sys.modules)
+    registereds = []
+    for feature in FEATURES:
+        if feature.optional and not isEnabled(feature):
+            continue
+        start = time.perf_counter()
+        registereds.append(registerFeature(feature))
+        featureTimings[feature.id] = time.perf_counter() - start
+    # Keymap items of all features, one keymap lookup per keymap
+    start = time.perf_counter()
+    bindings = [getFeatureBindings(registered) for registered in registereds]
+    added = addAddonKeymapItems([binding for fBindings in bindings for binding in fBindings])
+    for registered, fBindings in zip(registereds, bindings):
+        registered.keymapItems, added = added[:len(fBindings)], added[len(fBindings):]
+    featureTimings['keymaps'] = time.perf_counter() - start
+
+
+def unregisterFeatures():
+    for registered in reversed(list(registeredFeatures)):
+        unregisterFeature(registered)
+
+
+def setFeatureEnabled(featureId, enabled):
+    # Live toggle from addon preferences
+    feature = getFeature(featureId)
+    registered = getRegisteredFeature(featureId)
+    if enabled and registered == None:
+        start = time.perf_counter()
+        registered = registerFeature(feature)
+        registered.keymapItems = addAddonKeymapItems(getFeatureBindings(registered))
+        featureTimings[featureId] = time.perf_counter() - start
+    elif not enabled and registered != None:
+        unregisterFeature(registered)
+        featureTimings.pop(featureId, None)
+
+
+def getFeatureToggleProps():
+    # {prop name: BoolProperty} for AddonPreferences annotations
+    def getUpdate(featureId):
+        def update(self, context):
+            setFeatureEnabled(featureId, getattr(self, getFeaturePropName(featureId)))
+        return update
+
+    return {getFeaturePropName(feature.id): bpy.props.BoolProperty(
+        name=feature.name, default=True, update=getUpdate(feature.id))
+        for feature in FEATURES if feature.optional}
+
+
+def getFeaturePropName(featureId):
+    return 'feature_' + featureId
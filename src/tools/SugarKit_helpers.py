@@ -2,8 +2,11 @@ import bpy
 # from mathutils import Matrix
 # from uuid import uuid1 as uuid
 from types import SimpleNamespace  # SimpleNamespace(**dict)
+from types import FunctionType, CellType
+from contextlib import contextmanager
 import platform
 import math
+import time
 
 
 # / Use list() to duplicate bpy collection [array] to python list
@@ -22,6 +25,7 @@ def C(*args):
                 override = {'window': window, 'screen': screen, 'area': area}
                 bpy.ops.console.scrollback_append(
                     override, text=''.join(str(a) for a in args), type="OUTPUT")
+                countBuildProfile(ops=1)
 
 
 def CD(bpy_dict, tabs=0):
@@ -85,10 +89,38 @@ def addAddonKeymapItem(
     addonKeymaps.append((km, kmi))
 
 
-def removeAddonKeymapItems():
-    for km, kmi in addonKeymaps:
+def addAddonKeymapItems(bindings):
+    # [(keymap name, operatorData, hotkey)] -> [(km, kmi)] in bindings order, \
+    # items added with one keymaps.new() per keymap
+    wmkcs = bpy.context.window_manager.keyconfigs
+    added = [None] * len(bindings)
+    byKeymap = {}
+    for i, binding in enumerate(bindings):
+        byKeymap.setdefault(binding[0], []).append(i)
+    for keymapName, indices in byKeymap.items():
+        kmName, space = parseKeymapNameSpace(keymapName)
+        km = wmkcs.addon.keymaps.new(name=kmName, space_type=space)
+        for i in indices:
+            _, operatorData, hotkey = bindings[i]
+            km, kmi = newKeymapItem(
+                keyconfig=wmkcs.addon,
+                keymapName=kmName,
+                operatorData=operatorData,
+                hotkey=parseHotkeyStringInput(hotkey),
+                keymap=km,
+            )
+            added[i] = (km, kmi)
+    addonKeymaps.extend(added)
+    return added
+
+
+def removeAddonKeymapItems(items=None):
+    # items - [(km, kmi)] of one addAddonKeymapItems() call, all when None
+    if items == None:
+        items = list(addonKeymaps)
+    for km, kmi in items:
         km.keymap_items.remove(kmi)
-    addonKeymaps.clear()
+        addonKeymaps.remove((km, kmi))
 
 
 def addActiveKeymapItem(
@@ -99,6 +131,21 @@ def addActiveKeymapItem(
     disableOld=False,
     disableOldExactProps=None
 ):
+    if keymapSpecRecords != None:
+        # Recording: applied later by applyKeymapSpec()
+        keymapSpecRecords.append(SimpleNamespace(
+            action='add',
+            order=len(keymapSpecRecords),
+            section=keymapSpecSection,
+            keymapName=keymapName,
+            operatorData=operatorData,
+            hotkey=parseHotkeyStringInput(hotkey),
+            setKmiProps=freezeClosure(setKmiProps),
+            disableOld=parseHotkeyStringInput(disableOld),
+            disableOldExactProps=parseHotkeyStringInput(disableOldExactProps),
+        ))
+        return
+
     wmkcs = bpy.context.window_manager.keyconfigs
     newKeymapItem(
         keyconfig=wmkcs.active,
@@ -116,6 +163,18 @@ def disableActiveKeymapItem(
     operatorData,
     hotkey=None
 ):
+    if keymapSpecRecords != None:
+        # Recording: applied later by applyKeymapSpec()
+        keymapSpecRecords.append(SimpleNamespace(
+            action='disable',
+            order=len(keymapSpecRecords),
+            section=keymapSpecSection,
+            keymapName=keymapName,
+            operatorData=operatorData,
+            hotkey=parseHotkeyStringInput(hotkey),
+        ))
+        return
+
     wmkcs = bpy.context.window_manager.keyconfigs
     disableKeymapItem(
         wmkcs.active,
@@ -153,20 +212,60 @@ def editUserKeymapItem(
     oldHotkeyExactProps=None,
 ):
     wmkcs = bpy.context.window_manager.keyconfigs
+    return editKeymapItem(wmkcs.user, keymapName, operatorData, hotkey,
+                          oldHotkey=oldHotkey, oldHotkeyExactProps=oldHotkeyExactProps)
+
+
+def editKeymapItem(
+    keyconfig,
+    keymapName,
+    operatorData,
+    hotkey,
+    oldHotkey=None,  # None - one that found by find_from_operator()
+    oldHotkeyExactProps=None,  # hotkey, found item has same props
+):
     idName, properties = parseOperatorData(operatorData)
+    index = getKeymapIndex(keyconfig)
 
-    if oldHotkey == None:
-        kmi = wmkcs.user.keymaps[keymapName].keymap_items.find_from_operator(
-            idName)
-    elif type(oldHotkey) is str or type(oldHotkey) is dict:
+    if oldHotkey != None:
         kmi = findKeymapItem(
-            wmkcs.user, keymapName, idName, parseHotkeyStringInput(oldHotkey))
+            keyconfig, keymapName, idName, parseHotkeyStringInput(oldHotkey))
     elif oldHotkeyExactProps != None:
         kmi = findKeymapItem(
-            wmkcs.user, keymapName, operatorData, parseHotkeyStringInput(oldHotkey))
+            keyconfig, keymapName, operatorData, parseHotkeyStringInput(oldHotkeyExactProps))
+    elif index:
+        kmi = index.findFromOperator(keymapName, idName)
+    else:
+        kmi = keyconfig.keymaps[keymapName].keymap_items.find_from_operator(
+            idName)
 
+    oldType = kmi.type if kmi else None
     editKeymapItemHotkey(kmi, parseHotkeyStringInput(hotkey))
 
+    if index and kmi:
+        index.moveItem(keymapName, kmi, oldType)
+    return kmi
+
+
+def applyKeymapRules(keyconfig, rules):
+    # Rules of src/keyconfig_addons profiles. Index covers only keymaps rules touch, \
+    # so cost follows installed addons, not keyconfig size.
+    isIndexed = getKeymapIndex(keyconfig) != None
+    if not isIndexed:
+        buildKeymapIndex(keyconfig, {rule.keymapName for rule in rules})
+    try:
+        for rule in rules:
+            if rule.action == 'edit':
+                editKeymapItem(keyconfig, rule.keymapName, rule.operatorData, rule.hotkey,
+                               oldHotkey=rule.oldHotkey, oldHotkeyExactProps=rule.oldHotkeyExactProps)
+            else:
+                newKeymapItem(keyconfig, rule.keymapName, rule.operatorData, rule.hotkey,
+                              setKmiProps=rule.setKmiProps, disableOld=rule.disableOld,
+                              disableOldExactProps=rule.disableOldExactProps)
+    finally:
+        if not isIndexed:
+            clearKeymapIndex(keyconfig)
+
 
 KEYMAP_NAME_SPACES = {"3D View": "VIEW_3D", "Image": "IMAGE_EDITOR", "Node Editor": "NODE_EDITOR",
                       "SequencerCommon": "SEQUENCE_EDITOR", "Clip": "CLIP_EDITOR", "Dopesheet": "DOPESHEET_EDITOR",
@@ -188,13 +287,88 @@ def isValueInKmi(kmi, val):
         return kmi.type.startswith(val.upper())
 
 
-def parseHotkeyStringInput(hotkey):  # 'A shift ctrl CLICK' -> {'A': ['shift', 'ctrl', 'CLICK']} \
-    if type(hotkey) is str and len(hotkey.split()):
+MOD_SHIFT = 1
+MOD_CTRL = 2
+MOD_ALT = 4
+MOD_CMD = 8
+MOD_ANY = 16
+MODS_TO_MASK = {'shift': MOD_SHIFT, 'ctrl': MOD_CTRL,
+                'alt': MOD_ALT, 'cmd': MOD_CMD, 'any': MOD_ANY}
+
+
+class HotkeySpec:
+    # Parsed and interned hotkey: 'A shift ctrl CLICK' | {'A': ['shift', 'ctrl', 'CLICK']} \
+    # Equal hotkeys share one instance, so it's safe to compare them with 'is'.
+    __slots__ = ('key', 'modifiers', 'keyModifier', 'inputValue',
+                 'repeat', 'modMask', 'value')
+
+    def __init__(self, key, modifiers):
+        self.key = key
+        self.modifiers = tuple(modifiers)
+        self.keyModifier = None
+        self.inputValue = None
+        self.repeat = None
+        self.modMask = 0
+        for mod in self.modifiers:
+            if mod in MODS_TO_MASK:
+                self.modMask |= MODS_TO_MASK[mod]
+            elif mod == 'repeat':
+                self.repeat = True
+            elif mod in INPUT_VALUES:
+                self.inputValue = self.inputValue or mod
+            else:
+                self.keyModifier = self.keyModifier or mod
+        self.value = self.inputValue if self.inputValue else 'PRESS'
+
+    def signature(self):
+        # Value as written: 'A' keeps kmi value on edit, 'A PRESS' sets it
+        return (self.key, self.modMask, self.keyModifier, self.inputValue, self.repeat)
+
+    def __repr__(self):
+        return 'HotkeySpec(%r)' % ' '.join((self.key,) + self.modifiers)
+
+
+hotkeySpecs = {}  # {str | (key, modifiers) | signature: HotkeySpec}
+
+
+def getHotkeySpec(hotkey):
+    if not hotkey or type(hotkey) is HotkeySpec:
+        return hotkey or None
+
+    if type(hotkey) is str:
+        cacheKey = hotkey
+    elif type(hotkey) is dict:
+        key = list(hotkey.keys())[0]
+        cacheKey = (key, tuple(hotkey[key]))
+    else:
+        return None
+
+    spec = hotkeySpecs.get(cacheKey)
+    if spec:
+        return spec
+
+    if type(hotkey) is str:
         hotkeySplit = hotkey.split()
-        if len(hotkeySplit) == 1:
-            return hotkey
-        else:
-            return {hotkeySplit.pop(0): hotkeySplit}
+        if not hotkeySplit:
+            return None
+        spec = HotkeySpec(hotkeySplit[0], hotkeySplit[1:])
+    else:
+        spec = HotkeySpec(*cacheKey)
+    # Intern by signature, so modifiers order doesn't matter
+    spec = hotkeySpecs.setdefault(spec.signature(), spec)
+    hotkeySpecs[cacheKey] = spec
+    return spec
+
+
+def getKmiModMask(kmi):
+    return ((MOD_SHIFT if kmi.shift else 0) | (MOD_CTRL if kmi.ctrl else 0) |
+            (MOD_ALT if kmi.alt else 0) | (MOD_CMD if kmi.oskey else 0) |
+            (MOD_ANY if kmi.any else 0))
+
+
+def parseHotkeyStringInput(hotkey):  # 'A shift ctrl CLICK' -> HotkeySpec \
+    if (type(hotkey) is str and len(hotkey.split())) or type(hotkey) is dict:
+        return getHotkeySpec(hotkey)
     else:
         return hotkey
 
@@ -219,43 +393,44 @@ def parseOperatorData(operatorData):
 
 
 def parseKeyBinding(hotkey):
-    if type(hotkey) is dict:
-        key = list(hotkey.keys())[0]
-        modifiers = hotkey[key]
-        keyModifier = findIn(
-            modifiers, lambda it: it not in MODIFIERS and it not in INPUT_VALUES)
-        inputValue = findIn(modifiers, lambda it: it in INPUT_VALUES)
-        repeat = findIn(modifiers, lambda it: it == 'repeat')
-    else:
-        key = hotkey
-        modifiers = []
-        keyModifier = None
-        inputValue = None
-        repeat = None
-    return key, modifiers, keyModifier, inputValue, repeat
+    spec = getHotkeySpec(hotkey)
+    if not spec:
+        return hotkey, [], None, None, None
+    return spec.key, spec.modifiers, spec.keyModifier, spec.inputValue, spec.repeat
 
 
 def newKeymapItem(
     keyconfig,
     keymapName,
     operatorData,  # 'id/propvalue' | {[id]: {prop1: 1, ...}}
-    hotkey,  # 'key' | {[key]: ['shift', 'ctrl', 'alt', 'X', 'CLICK']}
+    hotkey,  # 'key' | {[key]: ['shift', 'ctrl', 'alt', 'X', 'CLICK']} | HotkeySpec
     setKmiProps=None,  # def - for non-default operators or enum props set by value
     disableOld=False,  # True - one that found by find_from_operator() | hotkey
     disableOldExactProps=None,  # hotkey
+    keymap=None,  # already resolved keymap
 ):
     kmName, space = parseKeymapNameSpace(keymapName)
     idName, properties = parseOperatorData(operatorData)
-    key, modifiers, keyModifier, inputValue, repeat = parseKeyBinding(hotkey)
+    spec = getHotkeySpec(hotkey)
+
+    index = getKeymapIndex(keyconfig)
 
-    km = keyconfig.keymaps.new(name=kmName, space_type=space) if (
-        keyconfig.name == 'Blender addon') else keyconfig.keymaps[kmName]
+    if keymap:
+        km = keymap
+    elif keyconfig.name == 'Blender addon':
+        km = keyconfig.keymaps.new(name=kmName, space_type=space)
+    elif index:
+        km = index.getKeymap(kmName)
+    else:
+        km = keyconfig.keymaps[kmName]
 
     if disableOld == True:
-        kmi = km.keymap_items.find_from_operator(idName)
+        kmi = index.findFromOperator(kmName, idName) if index else \
+            km.keymap_items.find_from_operator(idName)
         if kmi:
-            kmi.active = False
-    elif type(disableOld) is str or type(disableOld) is dict:
+            setKmiActive(kmi, False)
+            countBuildProfile(disabled=1)
+    elif type(disableOld) in (str, dict, HotkeySpec):
         disableKeymapItem(
             keyconfig,
             kmName,
@@ -273,26 +448,26 @@ def newKeymapItem(
     newMethod = getattr(
         km.keymap_items, 'new' if not km.is_modal else 'new_modal')
 
-    if 'any' in modifiers:
+    if spec.modMask & MOD_ANY:
         kmi = newMethod(
             idName,
-            key,
-            inputValue if inputValue else 'PRESS',
+            spec.key,
+            spec.value,
             any=True,
-            key_modifier=keyModifier if keyModifier else 'NONE',
-            repeat=True if repeat else False
+            key_modifier=spec.keyModifier if spec.keyModifier else 'NONE',
+            repeat=True if spec.repeat else False
         )
     else:
         kmi = newMethod(
             idName,
-            key,
-            inputValue if inputValue else 'PRESS',
-            shift='shift' in modifiers,
-            ctrl='ctrl' in modifiers,
-            alt='alt' in modifiers,
-            oskey='cmd' in modifiers,
-            key_modifier=keyModifier if keyModifier else 'NONE',
-            repeat=True if repeat else False
+            spec.key,
+            spec.value,
+            shift=bool(spec.modMask & MOD_SHIFT),
+            ctrl=bool(spec.modMask & MOD_CTRL),
+            alt=bool(spec.modMask & MOD_ALT),
+            oskey=bool(spec.modMask & MOD_CMD),
+            key_modifier=spec.keyModifier if spec.keyModifier else 'NONE',
+            repeat=True if spec.repeat else False
         )
 
     if properties and type(properties) is dict:
@@ -305,6 +480,11 @@ def newKeymapItem(
         except Exception as er:
             pass
 
+    if index:
+        index.addItem(kmName, kmi)
+    journalNewKeymapItem(km, kmi)
+    countBuildProfile(created=1)
+
     return (km, kmi)
 
 
@@ -315,22 +495,42 @@ def disableKeymapItem(
                    # 'id' - with id with any props | {[id]: False} - with id only without props
     hotkey=None,
 ):
-    if keymapName != '*':
+    index = getKeymapIndex(keyconfig)
+    scanned = 0
+    disabled = 0
+
+    if index:
+        # Compare only with indexed candidates
+        for kmName in (index.keymaps if keymapName == '*' else [keymapName]):
+            isModal = index.isModal(kmName)
+            candidates = index.getCandidates(kmName, operatorData, hotkey)
+            scanned += len(candidates)
+            for kmi in candidates:
+                if compareKeymapItem(kmi, operatorData, hotkey, isModal=isModal):
+                    setKmiActive(kmi, False)
+                    disabled += 1
+    elif keymapName != '*':
         # Compare only in specified keymap
         try:
             km = keyconfig.keymaps[keymapName]
         except Exception as er:
             km = None
         if km and km.keymap_items:
+            scanned += len(km.keymap_items)
             for kmi in km.keymap_items:
                 if compareKeymapItem(kmi, operatorData, hotkey, isModal=km.is_modal):
-                    kmi.active = False
+                    setKmiActive(kmi, False)
+                    disabled += 1
     else:
         # Compare in all keymaps
         for km in keyconfig.keymaps:
+            scanned += len(km.keymap_items)
             for kmi in km.keymap_items:
                 if compareKeymapItem(kmi, operatorData, hotkey, isModal=km.is_modal):
-                    kmi.active = False
+                    setKmiActive(kmi, False)
+                    disabled += 1
+
+    countBuildProfile(scanned=scanned, disabled=disabled)
 
 
 def compareKeymapItem(kmi, operatorData, hotkey, isModal):
@@ -375,30 +575,16 @@ def compareKmiWithOperator(kmi, operatorData, isModal, log=False):
 
 
 def compareKmiWithHotkey(kmi, hotkey, log=False):
-    if not hotkey:
+    spec = getHotkeySpec(hotkey)
+    if not spec:
         return True
 
-    key, modifiers, keyModifier, inputValue, repeat = parseKeyBinding(hotkey)
-    different = []
-
-    if kmi.type != key:
-        different.append('type')
-    if (kmi.shift and 'shift' not in modifiers) or ('shift' in modifiers and not kmi.shift):
-        different.append('shift')
-    if (kmi.ctrl and 'ctrl' not in modifiers) or ('ctrl' in modifiers and not kmi.ctrl):
-        different.append('ctrl')
-    if (kmi.alt and 'alt' not in modifiers) or ('alt' in modifiers and not kmi.alt):
-        different.append('alt')
-    if (kmi.oskey and 'cmd' not in modifiers) or ('cmd' in modifiers and not kmi.oskey):
-        different.append('cmd')
-    if (kmi.any and 'any' not in modifiers) or ('any' in modifiers and not kmi.any):
-        different.append('any')
-    if kmi.key_modifier != 'NONE' and kmi.key_modifier != keyModifier:
-        different.append('keymod')
-    if kmi.value != (inputValue if inputValue else 'PRESS'):
-        different.append('value')
-
-    return True if not len(different) else False
+    return (
+        kmi.type == spec.key and
+        getKmiModMask(kmi) == spec.modMask and
+        (kmi.key_modifier == 'NONE' or kmi.key_modifier == spec.keyModifier) and
+        kmi.value == spec.value
+    )
 
 
 def findKeymapItem(
@@ -407,11 +593,23 @@ def findKeymapItem(
     operatorData,
     hotkey
 ):
+    index = getKeymapIndex(keyconfig)
+
+    if index:
+        isModal = index.isModal(keymapName)
+        candidates = index.getCandidates(keymapName, operatorData, hotkey)
+        countBuildProfile(scanned=len(candidates))
+        for kmi in candidates:
+            if compareKeymapItem(kmi, operatorData, hotkey, isModal=isModal):
+                return kmi
+        return None
+
     try:
         km = keyconfig.keymaps[keymapName]
     except Exception as er:
         km = None
     if km and km.keymap_items:
+        countBuildProfile(scanned=len(km.keymap_items))
         for kmi in km.keymap_items:
             if compareKeymapItem(kmi, operatorData, hotkey, isModal=km.is_modal):
                 return kmi
@@ -421,26 +619,423 @@ def editKeymapItemHotkey(kmi, hotkey):
     if not kmi:
         return
 
-    key, modifiers, keyModifier, inputValue, repeat = parseKeyBinding(hotkey)
+    spec = getHotkeySpec(hotkey)
+    journalKmiHotkey(kmi)
 
-    kmi.type = key
-    if 'any' in modifiers:
+    kmi.type = spec.key
+    if spec.modMask & MOD_ANY:
         kmi.shift = False
         kmi.ctrl = False
         kmi.alt = False
         kmi.oskey = False
         kmi.any = True
     else:
-        kmi.shift = 'shift' in modifiers
-        kmi.ctrl = 'ctrl' in modifiers
-        kmi.alt = 'alt' in modifiers
-        kmi.oskey = 'cmd' in modifiers
-    kmi.key_modifier = keyModifier if keyModifier else kmi.key_modifier
-    kmi.value = inputValue if inputValue else kmi.value
-    kmi.repeat = repeat if repeat != None else kmi.repeat
+        kmi.shift = bool(spec.modMask & MOD_SHIFT)
+        kmi.ctrl = bool(spec.modMask & MOD_CTRL)
+        kmi.alt = bool(spec.modMask & MOD_ALT)
+        kmi.oskey = bool(spec.modMask & MOD_CMD)
+    kmi.key_modifier = spec.keyModifier if spec.keyModifier else kmi.key_modifier
+    kmi.value = spec.inputValue if spec.inputValue else kmi.value
+    kmi.repeat = spec.repeat if spec.repeat != None else kmi.repeat
+
+
+# Edit journal:
+editJournal = None  # [(action, ...)] while journaling, newest last
+KMI_HOTKEY_ATTRS = ['type', 'value', 'any', 'shift', 'ctrl', 'alt', 'oskey', 'key_modifier', 'repeat']
+
+
+def startEditJournal():
+    global editJournal
+    editJournal = []
+    return editJournal
+
+
+def commitEditJournal():
+    # Keeps edits -> journaled edits count
+    global editJournal
+    count = len(editJournal) if editJournal != None else 0
+    editJournal = None
+    return count
+
+
+def rollbackEditJournal():
+    # Reverts journaled edits newest first, untouched keymaps and items are not visited. \
+    # Removed items come back at keymap end: bpy api can't insert at position.
+    global editJournal
+    journal, editJournal = editJournal, None  # reverting isn't journaled \
+    if not journal:
+        return 0
+    from .SugarKit_keyconfig import newKmiFromModel  # keyconfig module imports helpers \
+    restored = {}  # {removed kmi: restored kmi} for older entries of same item
+    for entry in reversed(journal):
+        action, km, kmi, data = entry
+        kmi = restored.get(kmi, kmi)
+        if action == 'new':
+            km.keymap_items.remove(kmi)
+        elif action == 'active':
+            kmi.active = data
+        elif action == 'hotkey':
+            for attr, v in zip(KMI_HOTKEY_ATTRS, data):
+                setattr(kmi, attr, v)
+        elif action == 'remove':
+            restored[entry[2]] = newKmiFromModel(km, data)
+    return len(journal)
+
+
+def setKmiActive(kmi, active):
+    if editJournal != None and kmi.active != active:
+        editJournal.append(('active', None, kmi, kmi.active))
+    kmi.active = active
+
+
+def journalKmiHotkey(kmi):
+    # Call before hotkey edit
+    if editJournal != None:
+        editJournal.append(('hotkey', None, kmi, tuple(getattr(kmi, attr) for attr in KMI_HOTKEY_ATTRS)))
+
+
+def journalNewKeymapItem(km, kmi):
+    if editJournal != None:
+        editJournal.append(('new', km, kmi, None))
+
+
+def removeKeymapItem(km, kmi):
+    if editJournal != None:
+        from .SugarKit_keyconfig import copyKeymapItemToModel  # keyconfig module imports helpers \
+        editJournal.append(('remove', km, kmi, copyKeymapItemToModel(kmi)))
+    km.keymap_items.remove(kmi)
+
+
+# Keymap index:
+keymapIndexes = {}  # {keyconfig.name: KeymapIndex}
+
+
+class KeymapIndex:
+    # Lookup tables over keymap items of one keyconfig. \
+    # Candidates are narrowed by (keymap name, idname/propvalue, key type) \
+    # and still checked with compareKeymapItem, so matching rules stay the same.
+
+    def __init__(self, keyconfig, keymapNames=None):
+        self.name = keyconfig.name
+        self.keymaps = {}  # {kmName: SimpleNamespace}
+        if keymapNames == None:
+            for km in keyconfig.keymaps:
+                self.addKeymap(km)
+            return
+        for kmName in keymapNames:  # partial index, other keymaps are not looked up \
+            km = keyconfig.keymaps.get(kmName)
+            if km:
+                self.addKeymap(km)
+
+    def addKeymap(self, km):
+        entry = SimpleNamespace(
+            km=km,
+            isModal=km.is_modal,
+            items=[],
+            byOp={},  # {idname | propvalue: [kmi]}
+            byOpType={},  # {(idname | propvalue, type): [kmi]}
+            byType={},  # {type: [kmi]}
+            byIdname={},  # {idname: [kmi]}
+            bySubstr={},  # {'*...'[1:]: [idname]} - filled lazily
+        )
+        self.keymaps[km.name] = entry
+        for kmi in km.keymap_items:
+            self.insertItem(entry, kmi)
+        return entry
+
+    def insertItem(self, entry, kmi):
+        opKey = kmi.propvalue if entry.isModal else kmi.idname
+        if kmi.idname not in entry.byIdname:
+            entry.bySubstr.clear()
+        entry.items.append(kmi)
+        entry.byOp.setdefault(opKey, []).append(kmi)
+        entry.byOpType.setdefault((opKey, kmi.type), []).append(kmi)
+        entry.byType.setdefault(kmi.type, []).append(kmi)
+        entry.byIdname.setdefault(kmi.idname, []).append(kmi)
+
+    def addItem(self, keymapName, kmi):
+        entry = self.keymaps.get(keymapName)
+        if entry:
+            self.insertItem(entry, kmi)
+
+    def moveItem(self, keymapName, kmi, oldType):
+        # Rebucket item after its key type was edited
+        entry = self.keymaps.get(keymapName)
+        if not entry or oldType == kmi.type:
+            return
+        opKey = kmi.propvalue if entry.isModal else kmi.idname
+        for bucket in (entry.byOpType.get((opKey, oldType)), entry.byType.get(oldType)):
+            if bucket and kmi in bucket:
+                bucket.remove(kmi)
+        entry.byOpType.setdefault((opKey, kmi.type), []).append(kmi)
+        entry.byType.setdefault(kmi.type, []).append(kmi)
+
+    def getKeymap(self, keymapName):
+        entry = self.keymaps.get(keymapName)
+        return entry.km if entry else None
+
+    def isModal(self, keymapName):
+        entry = self.keymaps.get(keymapName)
+        return entry.isModal if entry else False
+
+    def findFromOperator(self, keymapName, idName):
+        # Same as km.keymap_items.find_from_operator(): first active item
+        entry = self.keymaps.get(keymapName)
+        items = entry.byOp.get(idName, []) if entry else []
+        return findIn(items, lambda kmi: kmi.active)
+
+    def getCandidates(self, keymapName, operatorData, hotkey=None):
+        entry = self.keymaps.get(keymapName)
+        if not entry:
+            return []
+
+        spec = getHotkeySpec(hotkey)
+        key = spec.key if spec else None
+
+        if type(operatorData) is str and operatorData.startswith('*'):
+            if operatorData == '*':
+                return list(entry.byType.get(key, [])) if key else list(entry.items)
+            substr = operatorData[1:]
+            if substr not in entry.bySubstr:
+                entry.bySubstr[substr] = [
+                    idName for idName in entry.byIdname if substr in idName]
+            candidates = []
+            for idName in entry.bySubstr[substr]:
+                for kmi in entry.byIdname[idName]:
+                    if not key or kmi.type == key:
+                        candidates.append(kmi)
+            return candidates
+
+        idName, properties = parseOperatorData(operatorData)
+        if key:
+            return list(entry.byOpType.get((idName, key), []))
+        return list(entry.byOp.get(idName, []))
+
+
+def buildKeymapIndex(keyconfig, keymapNames=None):
+    index = KeymapIndex(keyconfig, keymapNames)
+    keymapIndexes[keyconfig.name] = index
+    return index
+
+
+def getKeymapIndex(keyconfig):
+    return keymapIndexes.get(keyconfig.name) if keyconfig else None
+
+
+def clearKeymapIndex(keyconfig=None):
+    if keyconfig:
+        keymapIndexes.pop(keyconfig.name, None)
+    else:
+        keymapIndexes.clear()
+
+
+# Keymap spec:
+keymapSpecRecords = None  # [SimpleNamespace] while recording
+keymapSpecSection = None  # name of builder section records are made in
+
+
+def startKeymapSpec():
+    # add/disableActiveKeymapItem() calls are recorded instead of applied
+    global keymapSpecRecords
+    keymapSpecRecords = []
+    return keymapSpecRecords
+
+
+def setKeymapSpecSection(name):
+    global keymapSpecSection
+    keymapSpecSection = name
+
+
+def stopKeymapSpec():
+    global keymapSpecRecords
+    records = keymapSpecRecords
+    keymapSpecRecords = None
+    setKeymapSpecSection(None)
+    return records
+
+
+def freezeClosure(fn):
+    # Bind closure vars to their current values: lambdas made in loops \
+    # run later, when the loop var already points to the last item.
+    if not isinstance(fn, FunctionType) or not fn.__closure__:
+        return fn
+    cells = []
+    for cell in fn.__closure__:
+        try:
+            cells.append(CellType(cell.cell_contents))
+        except ValueError:
+            cells.append(cell)
+    frozen = FunctionType(fn.__code__, fn.__globals__, fn.__name__,
+                          fn.__defaults__, tuple(cells))
+    frozen.__kwdefaults__ = fn.__kwdefaults__
+    return frozen
+
+
+def getKeymapSpecDisableRules(record):
+    # -> [(order, operatorData, hotkey)] matched against existing items
+    if record.action == 'disable':
+        return [(record.order, record.operatorData, record.hotkey)]
+    idName, properties = parseOperatorData(record.operatorData)
+    if type(record.disableOld) in (str, dict, HotkeySpec):
+        return [(record.order, idName, record.disableOld)]
+    elif record.disableOld != True and record.disableOldExactProps != None:
+        return [(record.order, record.operatorData, record.disableOldExactProps)]
+    return []
+
+
+class KeymapSpecRules:
+    # Disable rules of one keymap bucketed the same way as KeymapIndex
+
+    def __init__(self, rules):
+        self.byOpType = {}
+        self.byOp = {}
+        self.byType = {}
+        self.wildcard = []
+        for rule in rules:
+            order, operatorData, hotkey = rule
+            spec = getHotkeySpec(hotkey)
+            if type(operatorData) is str and operatorData.startswith('*'):
+                if operatorData == '*' and spec:
+                    self.byType.setdefault(spec.key, []).append(rule)
+                else:
+                    self.wildcard.append(rule)
+            else:
+                idName, properties = parseOperatorData(operatorData)
+                if spec:
+                    self.byOpType.setdefault(
+                        (idName, spec.key), []).append(rule)
+                else:
+                    self.byOp.setdefault(idName, []).append(rule)
+
+    def match(self, kmi, isModal, afterOrder=-1):
+        # -> lowest order of rules matching kmi | None
+        opKey = kmi.propvalue if isModal else kmi.idname
+        matchedOrder = None
+        for rules in (
+            self.byOpType.get((opKey, kmi.type)),
+            self.byOp.get(opKey),
+            self.byType.get(kmi.type),
+            self.wildcard
+        ):
+            for order, operatorData, hotkey in rules or []:
+                if (
+                    order > afterOrder and
+                    (matchedOrder == None or order < matchedOrder) and
+                    compareKeymapItem(kmi, operatorData, hotkey, isModal)
+                ):
+                    matchedOrder = order
+        return matchedOrder
+
+
+def applyKeymapSpec(keyconfig, records):
+    # Group records by keymap, then per keymap: resolve it once, \
+    # disable candidates of keymap index (one scan without index), add new items. \
+    # Gives the same result as calling add()/disable() one by one in records order.
+    groups = {}  # {kmName: [record]}
+    globalRules = []
+    for record in records:
+        if record.keymapName == '*':
+            globalRules.extend(getKeymapSpecDisableRules(record))
+        else:
+            groups.setdefault(record.keymapName, []).append(record)
+
+    index = getKeymapIndex(keyconfig)
+    kmNames = list(groups.keys())
+    if globalRules:
+        kmNames += [km.name for km in keyconfig.keymaps if km.name not in groups]
+    recordsByOrder = {r.order: r for r in records} if buildProfile != None else None
+
+    for kmName in kmNames:
+        group = groups.get(kmName, [])
+        km = index.getKeymap(kmName) if index else None
+        km = km if km else keyconfig.keymaps[kmName]
+        isModal = km.is_modal
+
+        rules = list(globalRules)
+        for record in group:
+            rules.extend(getKeymapSpecDisableRules(record))
+        specRules = KeymapSpecRules(rules)
+        firstActiveRules = [r for r in group if r.action ==
+                            'add' and r.disableOld == True]
+
+        disabledAt = {}  # {kmi: order}
+        byIdname = {}  # {idname: [kmi]} items active before disables
+        entry = index.keymaps.get(kmName) if index else None
+        if entry:
+            # Disables: lowest matching rule order per candidate item, untouched items aren't visited
+            for record in firstActiveRules:
+                idName, properties = parseOperatorData(record.operatorData)
+                byIdname.setdefault(idName, [kmi for kmi in entry.byIdname.get(idName, []) if kmi.active])
+            scanned = 0
+            for order, operatorData, hotkey in rules:
+                candidates = index.getCandidates(kmName, operatorData, hotkey)
+                scanned += len(candidates)
+                for kmi in candidates:
+                    if disabledAt.get(kmi, order + 1) > order and \
+                            compareKeymapItem(kmi, operatorData, hotkey, isModal):
+                        disabledAt[kmi] = order
+            for kmi in disabledAt:
+                setKmiActive(kmi, False)
+        else:
+            # Disables: one scan over existing items
+            scanned = len(km.keymap_items)
+            for kmi in km.keymap_items:
+                if firstActiveRules and kmi.active:
+                    byIdname.setdefault(kmi.idname, []).append(kmi)
+                order = specRules.match(kmi, isModal)
+                if order != None:
+                    disabledAt[kmi] = order
+                    setKmiActive(kmi, False)
+
+        # Disables: disableOld=True picks first item active at record's turn
+        pendingFirstActive = []
+        for record in firstActiveRules:
+            idName, properties = parseOperatorData(record.operatorData)
+            kmi = findIn(byIdname.get(idName, []), lambda kmi: (
+                disabledAt.get(kmi, record.order) >= record.order))
+            if kmi:
+                disabledAt[kmi] = record.order
+                setKmiActive(kmi, False)
+            else:
+                pendingFirstActive.append(record)
+
+        # Additions
+        added = []  # [(order, kmi)]
+        for record in group:
+            if record.action != 'add':
+                continue
+            km, kmi = newKeymapItem(
+                keyconfig=keyconfig,
+                keymapName=kmName,
+                operatorData=record.operatorData,
+                hotkey=record.hotkey,
+                setKmiProps=record.setKmiProps,
+                keymap=km,
+            )
+            # Later records in this keymap could disable the new item
+            order = specRules.match(kmi, isModal, afterOrder=record.order)
+            if order != None:
+                disabledAt[kmi] = order
+                setKmiActive(kmi, False)
+            added.append((record.order, kmi))
+
+        for record in pendingFirstActive:
+            idName, properties = parseOperatorData(record.operatorData)
+            for order, kmi in added:
+                if order < record.order and kmi.active and kmi.idname == idName:
+                    disabledAt[kmi] = record.order
+                    setKmiActive(kmi, False)
+                    break
+
+        if recordsByOrder:
+            # Batch counts go to running stage and to sections records were made in
+            countBuildProfile(scanned=scanned, disabled=len(disabledAt))
+            for order in disabledAt.values():
+                countBuildProfile(disabled=1, name=recordsByOrder[order].section)
+            for order, kmi in added:
+                countBuildProfile(created=1, name=recordsByOrder[order].section)
 
 
-# Sculpt trim curve modal:
 def getKeymapFromContext(context, name, keyconfigName="active"):
     wmkcs = context.window_manager.keyconfigs
     if keyconfigName == "active":
@@ -472,7 +1067,7 @@ def removeActiveKeymapItems(keymap):
     if keymap and keymap.keymap_items:
         for kmi in list(keymap.keymap_items):
             if kmi.active:
-                keymap.keymap_items.remove(kmi)
+                removeKeymapItem(keymap, kmi)
 
 
 def unableDisabledKeymapItems(keymap, disabledKeymapItemsIds):
@@ -483,89 +1078,292 @@ def unableDisabledKeymapItems(keymap, disabledKeymapItemsIds):
         disabledKeymapItemsIds.clear()
 
 
+# Build profile:
+buildProfile = None  # {entry name: SimpleNamespace} while profiling
+buildProfileStack = []  # entries being run, counts go to all of them
+
+
+def startBuildProfile():
+    global buildProfile
+    buildProfile = {}
+    buildProfileStack.clear()
+    return buildProfile
+
+
+def stopBuildProfile():
+    global buildProfile
+    profile = buildProfile
+    buildProfile = None
+    buildProfileStack.clear()
+    return profile
+
+
+@contextmanager
+def profileBuild(name):
+    # Times block under entry name, nested entries are kept with their depth
+    if buildProfile == None:
+        yield None
+        return
+    entry = buildProfile.get(name)
+    if not entry:
+        entry = buildProfile[name] = SimpleNamespace(
+            name=name, depth=len(buildProfileStack), calls=0, seconds=0.0,
+            scanned=0, created=0, disabled=0, ops=0)
+    buildProfileStack.append(entry)
+    start = time.perf_counter()
+    try:
+        yield entry
+    finally:
+        entry.seconds += time.perf_counter() - start
+        entry.calls += 1
+        buildProfileStack.remove(entry)
+
+
+def countBuildProfile(scanned=0, created=0, disabled=0, ops=0, name=None):
+    # Adds to running entries | to named entry only (section of recorded spec)
+    if name != None:
+        entries = [buildProfile[name]] if buildProfile and name in buildProfile else []
+    else:
+        entries = buildProfileStack
+    for entry in entries:
+        entry.scanned += scanned
+        entry.created += created
+        entry.disabled += disabled
+        entry.ops += ops
+
+
+def getBuildProfileText(profile):
+    lines = []
+    for entry in profile.values():
+        line = '%s%s: %.1f ms' % ('  ' * entry.depth, entry.name, entry.seconds * 1000)
+        counts = ['%s %d' % (field, getattr(entry, field)) for field in
+                  ['scanned', 'created', 'disabled', 'ops'] if getattr(entry, field)]
+        lines.append(line + (' | ' + ', '.join(counts) if counts else ''))
+    return '\n'.join(lines)
+
+
 # Keyconf builder:
 def restoreDefaultKeymaps():
     wmkcs = bpy.context.window_manager.keyconfigs
     # Restore keymaps to default to avoid future collision bugs
-    for dkm in wmkcs.default.keymaps:
-        dkm.restore_to_default()
+    with profileBuild('restoreDefaultKeymaps'):
+        for dkm in wmkcs.default.keymaps:
+            dkm.restore_to_default()
 
 
 def buildNewActiveKeyconfig(name):
-    wmkcs = bpy.context.window_manager.keyconfigs
-    # Get old keyconfig
-    try:
-        kc = wmkcs[name.replace(" ", "_")]
-    except Exception as er:
-        kc = None
-    # Remove old keyconfig if exists
-    if kc:
-        wmkcs.active = kc
-        bpy.ops.wm.keyconfig_preset_add(remove_active=True)
-    # Create new keyconfig
-    bpy.ops.wm.keyconfig_preset_add(name=name)  # and set active
-    kc = wmkcs.active
-    # Copy all keymaps and keymap items from default keyconfig
-    for dkm in wmkcs.default.keymaps:
-        km = kc.keymaps.new(
-            name=dkm.name,
-            space_type=dkm.space_type,
-            region_type=dkm.region_type,
-            modal=dkm.is_modal
-        )
-        for kmi in dkm.keymap_items:
-            km.keymap_items.new_from_item(kmi)
-    return kc
-
-
-def disableIncludingHotkeysInKeyconfig(
-    keyconfig,
-    disableIncluding=[],
-    excludes=[]
-):
-    parsedIncluding = []
-    parsedExcludes = []
-
+    with profileBuild('buildNewActiveKeyconfig'):
+        wmkcs = bpy.context.window_manager.keyconfigs
+        # Get old keyconfig
+        try:
+            kc = wmkcs[name.replace(" ", "_")]
+        except Exception as er:
+            kc = None
+        # Remove old keyconfig if exists
+        if kc:
+            wmkcs.active = kc
+            bpy.ops.wm.keyconfig_preset_add(remove_active=True)
+            countBuildProfile(ops=1)
+        # Create new keyconfig
+        bpy.ops.wm.keyconfig_preset_add(name=name)  # and set active
+        countBuildProfile(ops=1)
+        kc = wmkcs.active
+        # Copy all keymaps and keymap items from default keyconfig
+        for dkm in wmkcs.default.keymaps:
+            km = kc.keymaps.new(
+                name=dkm.name,
+                space_type=dkm.space_type,
+                region_type=dkm.region_type,
+                modal=dkm.is_modal
+            )
+            for kmi in dkm.keymap_items:
+                km.keymap_items.new_from_item(kmi)
+            countBuildProfile(scanned=len(dkm.keymap_items), created=len(dkm.keymap_items))
+        return kc
+
+
+def compileIncludingHotkeysFilter(disableIncluding=[], excludes=[]):
+    # ['cmd', 'Numpad'], ['shift cmd Z'] -> filter checked on kmi fields only
+    modMask = 0
+    typePrefixes = []
     for key in disableIncluding:
-        if key in MODS_TO_STR:
-            parsedIncluding.append(MODS_TO_STR[key])
+        if key in MODS_TO_MASK:
+            modMask |= MODS_TO_MASK[key]
         else:
-            parsedIncluding.append(key)
+            typePrefixes.append(key.upper())
 
+    excluded = set()  # {(type, modMask)}
     for hotkey in excludes:
-        for k, v in MODS_TO_STR.items():
-            hotkey = hotkey.replace(k, v)
-        parsedExcludes.append(hotkey)
+        hotkeySplit = hotkey.split()
+        mask = 0
+        for mod in hotkeySplit[:-1]:
+            mask |= MODS_TO_MASK[mod]
+        excluded.add((hotkeySplit[-1], mask))
+
+    return SimpleNamespace(
+        modMask=modMask,
+        typePrefixes=tuple(typePrefixes),
+        excluded=excluded,
+        mapTypes={'KEYBOARD', 'MOUSE', 'NDOF'},
+    )
 
-    if keyconfig and keyconfig.keymaps:
-        for km in keyconfig.keymaps:
-            if km.keymap_items:
+
+def isKmiIncludedByFilter(hotkeysFilter, kmi):
+    if not kmi.active or kmi.map_type not in hotkeysFilter.mapTypes:
+        return False
+    modMask = getKmiModMask(kmi)
+    included = (
+        (not kmi.any and modMask & hotkeysFilter.modMask) or
+        (hotkeysFilter.typePrefixes and kmi.type.startswith(hotkeysFilter.typePrefixes))
+    )
+    if not included:
+        return False
+    return kmi.key_modifier != 'NONE' or (kmi.type, modMask) not in hotkeysFilter.excluded
+
+
+def disableIncludingHotkeysInKeyconfig(
+    keyconfig,
+    disableIncluding=[],  # modifiers | event type prefixes
+    excludes=[]  # 'shift cmd Z' - exact hotkeys to keep
+):
+    # -> {keymap name: disabled items count}
+    hotkeysFilter = compileIncludingHotkeysFilter(disableIncluding, excludes)
+    disabledCounts = {}
+
+    with profileBuild('disableIncludingHotkeysInKeyconfig'):
+        if keyconfig and keyconfig.keymaps:
+            for km in keyconfig.keymaps:
+                count = 0
                 for kmi in km.keymap_items:
-                    if kmi.active and kmi.map_type in ['KEYBOARD', 'MOUSE', 'NDOF']:
-                        kmiString = kmi.to_string()
-                        for val in parsedIncluding:
-                            if (
-                                kmiString not in parsedExcludes and
-                                val in kmiString and
-                                isValueInKmi(kmi, val)
-                            ):
-                                kmi.active = False
+                    if isKmiIncludedByFilter(hotkeysFilter, kmi):
+                        setKmiActive(kmi, False)
+                        count += 1
+                if count:
+                    disabledCounts[km.name] = count
+                countBuildProfile(scanned=len(km.keymap_items), disabled=count)
+
+    return disabledCounts
 
 
 def clearAllInactiveKeymapItemsInKeyconfig(keyconfig):
+    # -> {keymap name: removed items count}
+    removedCounts = {}
     if keyconfig and keyconfig.keymaps:
         for km in keyconfig.keymaps:
-            if km and km.keymap_items:
-                for kmi in list(km.keymap_items):
-                    if not kmi.active:
-                        km.keymap_items.remove(kmi)
+            # Pre-scan collects inactive items only, keymaps without them are skipped
+            inactiveItems = [kmi for kmi in km.keymap_items if not kmi.active]
+            countBuildProfile(scanned=len(km.keymap_items))
+            if not inactiveItems:
+                continue
+            # Head first: remove() looks item up from keymap start
+            for kmi in inactiveItems:
+                removeKeymapItem(km, kmi)
+            removedCounts[km.name] = len(inactiveItems)
+    return removedCounts
+
+
+class BuildPipeline:
+    # Stages run in dependency order. A stage with ready() check waits until \
+    # it passes, polled on next event loop ticks (not a fixed delay), \
+    # or until timeout, so a missed sync never blocks the build. \
+    # Not fatal stages (reports) only fail themselves and skip their dependents.
+    pollInterval = 0.01
+    timeout = 2.0
+
+    def __init__(self, name):
+        self.name = name
+        self.stages = []
+        self.done = False
+        self.error = None
+        self.onDone = None
+
+    def addStage(self, name, run, deps=[], ready=None, fatal=True):
+        self.stages.append(SimpleNamespace(name=name, run=run, deps=list(deps), ready=ready, fatal=fatal,
+                                           state='pending', waitStart=None, waited=0.0, seconds=0.0,
+                                           result=None, error=None))
+
+    def getStage(self, name):
+        return findIn(self.stages, lambda stage: stage.name == name)
+
+    def start(self):
+        self.runReadyStages()
+        if not self.done:
+            bpy.app.timers.register(self.poll, first_interval=0)
+
+    def poll(self):
+        self.runReadyStages()
+        return None if self.done else self.pollInterval
+
+    def runReadyStages(self):
+        progress = True
+        while progress and not self.done:
+            progress = False
+            for stage in self.stages:
+                if stage.state != 'pending':
+                    continue
+                depStates = [self.getStage(dep).state for dep in stage.deps]
+                if 'failed' in depStates or 'skipped' in depStates:
+                    stage.state = 'skipped'
+                    progress = True
+                    continue
+                if any(state != 'done' for state in depStates):
+                    continue
+                now = time.perf_counter()
+                if stage.waitStart == None:
+                    stage.waitStart = now
+                stage.waited = now - stage.waitStart
+                if stage.ready and stage.waited < self.timeout and not stage.ready():
+                    continue
+                try:
+                    with profileBuild(stage.name):
+                        stage.result = stage.run()
+                    stage.state = 'done'
+                except Exception as er:
+                    stage.state = 'failed'
+                    stage.error = er
+                    if stage.fatal:
+                        self.error = er
+                stage.seconds = time.perf_counter() - now
+                progress = True
+                if self.error:
+                    break
+            self.done = bool(self.error) or all(
+                stage.state != 'pending' for stage in self.stages)
+        if self.done and self.onDone:
+            self.onDone(self)
+
+    def getTimings(self):
+        # -> [(stage name, seconds, seconds waited for ready)]
+        return [(stage.name, stage.seconds, stage.waited) for stage in self.stages]
+
+    def getTimingsText(self):
+        lines = [self.name + ':']
+        for stage in self.stages:
+            line = '  %s: %.1f ms' % (stage.name, stage.seconds * 1000)
+            if stage.waited:
+                line += ' (waited %.1f ms)' % (stage.waited * 1000)
+            if type(stage.result) is dict:
+                line += ' | %d items in %d keymaps' % (
+                    sum(stage.result.values()), len(stage.result))
+            if stage.state != 'done':
+                line += ' | ' + stage.state
+            if stage.error != None:
+                line += ': %s' % stage.error
+            lines.append(line)
+        return '\n'.join(lines)
+
+
+def getKeyconfigPresetFilepath(filename):
+    path = bpy.utils.user_resource('SCRIPTS', path="presets")
+    return bpy.path.native_pathsep(path + '/keyconfig/' + filename)
 
 
 def saveAndExportKeyconfig(filename):
     bpy.ops.wm.save_userpref()
-    path = bpy.utils.user_resource('SCRIPTS', path="presets")
-    filepath = bpy.path.native_pathsep(path + '/keyconfig/' + filename)
+    filepath = getKeyconfigPresetFilepath(filename)
     bpy.ops.preferences.keyconfig_export(filepath=filepath, all=True)
+    countBuildProfile(ops=2)
+    return filepath
 
 
 def clearAndSaveKeyconfig(keyconfig, filename):
@@ -584,6 +1382,38 @@ def simplenamespace(bpy_dict):
     return obj
 
 
+class EventSnapshot:
+    # Copy of bpy.types.Event fields the kit reads (event is freed after invoke). \
+    # update() overwrites in place, no dir() walk and no new object per event.
+    __slots__ = ('mouse_x', 'mouse_y', 'mouse_prev_x', 'mouse_prev_y', 'type', 'value',
+                 'shift', 'ctrl', 'alt', 'oskey')
+
+    def __init__(self):
+        self.mouse_x = -1
+        self.mouse_y = -1
+        self.mouse_prev_x = -1
+        self.mouse_prev_y = -1
+        self.type = 'NONE'
+        self.value = 'NOTHING'
+        self.shift = False
+        self.ctrl = False
+        self.alt = False
+        self.oskey = False
+
+    def update(self, event):
+        self.mouse_x = event.mouse_x
+        self.mouse_y = event.mouse_y
+        self.mouse_prev_x = event.mouse_prev_x
+        self.mouse_prev_y = event.mouse_prev_y
+        self.type = event.type
+        self.value = event.value
+        self.shift = event.shift
+        self.ctrl = event.ctrl
+        self.alt = event.alt
+        self.oskey = event.oskey
+        return self
+
+
 def appendNewActMatToObject(obj, diffuseColor=(1.0, 1.0, 1.0, 1.0), matSlot=None):
     newMat = bpy.data.materials.new("Material")
     newMat.diffuse_color = diffuseColor
@@ -0,0 +1,384 @@
+import bpy
+from .SugarKit_helpers import *
+from .SugarKit import updateGlobalEvent, getSpaceUnderMouseFromContext
+
+
+# / Resources: Image, Shading
+
+
+# Pack
+
+
+class PackAllSavedOperator(bpy.types.Operator):
+    """Pack all saved instances into the .blend file."""
+    bl_label = "Pack All Saved"
+    bl_idname = "file.sk_pack_all_saved"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def execute(self, context):
+        try:
+            bpy.ops.file.pack_all()
+            self.report({'INFO'}, "All saved resources are packed!")
+        except Exception as er:
+            self.report({'ERROR'}, "{0}".format(er))
+
+        return {'FINISHED'}
+
+
+class ImagePackOperator(bpy.types.Operator):
+    bl_label = "Image Pack"
+    bl_idname = "file.sk_image_pack"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def execute(self, context):
+        bpy.ops.image.pack()
+        return {'FINISHED'}
+
+
+class ImageUnpackOperator(bpy.types.Operator):
+    bl_label = "Image Unpack"
+    bl_idname = "file.sk_image_unpack"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def execute(self, context):
+        bpy.ops.image.unpack(method='WRITE_ORIGINAL')
+        return {'FINISHED'}
+
+
+# Create New
+
+
+class ShadingCreateNewOperator(bpy.types.Operator):
+    bl_label = "Shading New"
+    bl_idname = "node.sk_shader_new"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    @classmethod
+    def poll(cls, context):
+        snode = context.space_data
+        return snode.tree_type == 'ShaderNodeTree'
+
+    def execute(self, context):
+        snode = context.space_data
+        if snode.shader_type == 'OBJECT':
+            mat = bpy.data.materials.new('Material')
+            mat.use_nodes = True
+            context.active_object.active_material = mat
+        elif snode.shader_type == 'WORLD':
+            world = bpy.data.worlds.new("World")
+            world.use_nodes = True
+            context.scene.world = world
+        elif snode.shader_type == 'LINESTYLE':
+            bpy.ops.scene.freestyle_linestyle_new()
+        return {'FINISHED'}
+
+
+# Set Active
+
+
+class ImageSetActiveMenuOperator(bpy.types.Operator):
+    bl_label = "Image Set Active Menu"
+    bl_idname = "image.sk_image_set_active_menu"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def invoke(self, context, event):
+        updateGlobalEvent(event)
+        return self.execute(context)
+
+    def execute(self, context):
+        bpy.ops.wm.call_menu(name=ImageSetActiveMenu.bl_idname)
+        return {'FINISHED'}
+
+
+class ImageSetActiveMenu(bpy.types.Menu):
+    bl_label = "Set Active"
+    bl_idname = "sk_image_set_active_menu"
+
+    def draw(self, context):
+        editor_space = getSpaceUnderMouseFromContext(context)
+        layout = self.layout
+        with context.temp_override(space=editor_space):
+            layout.template_ID(editor_space, "image")
+
+
+class ShadingSetActiveMenuOperator(bpy.types.Operator):
+    bl_label = "Shading Set Active Menu"
+    bl_idname = "node.sk_shader_set_active_menu"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    @classmethod
+    def poll(cls, context):
+        snode = context.space_data
+        return snode.tree_type == 'ShaderNodeTree'
+
+    def invoke(self, context, event):
+        updateGlobalEvent(event)
+        return self.execute(context)
+
+    def execute(self, context):
+        bpy.ops.wm.call_menu(name=ShadingSetActiveMenu.bl_idname)
+        return {'FINISHED'}
+
+
+class ShadingSetActiveMenu(bpy.types.Menu):
+    bl_label = "Set Active"
+    bl_idname = "sk_shader_set_active_menu"
+
+    def draw(self, context):
+        layout = self.layout
+        editor_space = getSpaceUnderMouseFromContext(context)
+        snode = context.space_data
+
+        if snode.shader_type == 'OBJECT' and context.object:
+            with context.temp_override(space=editor_space):
+                layout.template_ID(
+                    context.object, "active_material", new="material.new")
+        elif snode.shader_type == 'WORLD':
+            scene = context.scene
+            with context.temp_override(space=editor_space):
+                layout.template_ID(
+                    scene, "world", new="world.new")
+        elif snode.shader_type == 'LINESTYLE':
+            lineset = context.view_layer.freestyle_settings.linesets.active
+            with context.temp_override(space=editor_space):
+                layout.template_ID(
+                    lineset, "linestyle", new="scene.freestyle_linestyle_new")
+
+
+# Keep Fake User
+
+
+class ImageKeepFakeUserOperator(bpy.types.Operator):
+    bl_label = "Image Keep Fake User"
+    bl_idname = "image.sk_image_keep_fake_user"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def invoke(self, context, event):
+        updateGlobalEvent(event)
+        return self.execute(context)
+
+    def execute(self, context):
+        space = getSpaceUnderMouseFromContext(context)
+        if space.image:
+            space.image.use_fake_user = True if not space.image.use_fake_user else False
+            # Refresh/update header
+            bpy.ops.wm.redraw_timer(type='DRAW_WIN_SWAP', iterations=1)
+        return {'FINISHED'}
+
+
+class ShadingKeepFakeUserOperator(bpy.types.Operator):
+    bl_label = "Shading Keep Fake User"
+    bl_idname = "node.sk_shader_keep_fake_user"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    @classmethod
+    def poll(cls, context):
+        snode = context.space_data
+        return snode.tree_type == 'ShaderNodeTree'
+
+    def execute(self, context):
+        snode = context.space_data
+
+        if snode.shader_type == 'OBJECT':
+            mat = context.active_object.active_material
+            if mat:
+                mat.use_fake_user = True if not mat.use_fake_user else False
+        elif snode.shader_type == 'WORLD':
+            world = context.scene.world
+            if world:
+                world.use_fake_user = True if not world.use_fake_user else False
+        elif snode.shader_type == 'LINESTYLE':
+            lineset = context.view_layer.freestyle_settings.linesets.active
+            if lineset:
+                linestyle = lineset.linestyle
+                linestyle.use_fake_user = True if not linestyle.use_fake_user else False
+
+        # Refresh/update header
+        bpy.ops.wm.redraw_timer(type='DRAW_WIN_SWAP', iterations=1)
+
+        return {'FINISHED'}
+
+
+# Make Single Copy
+
+
+class ImageMakeSingleCopyOperator(bpy.types.Operator):
+    bl_label = "Image Make Single Copy"
+    bl_idname = "image.sk_image_make_single_copy"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def invoke(self, context, event):
+        updateGlobalEvent(event)
+        return self.execute(context)
+
+    def execute(self, context):
+        space = getSpaceUnderMouseFromContext(context)
+        space.image = space.image.copy()
+        return {'FINISHED'}
+
+
+class MaterialMakeSingleCopyOperator(bpy.types.Operator):
+    bl_label = "Material Make Single Copy"
+    bl_idname = "node.sk_material_make_single_copy"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    @classmethod
+    def poll(cls, context):
+        snode = context.space_data
+        return snode.tree_type == 'ShaderNodeTree'
+
+    def execute(self, context):
+        snode = context.space_data
+        if snode.shader_type == 'OBJECT':
+            for obj in context.selected_objects:
+                mat = obj.active_material
+                if mat:
+                    obj.active_material = mat.copy()
+        return {'FINISHED'}
+
+
+# Close
+
+
+class ImageCloseOperator(bpy.types.Operator):
+    bl_label = "Image Close"
+    bl_idname = "image.sk_image_close"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def invoke(self, context, event):
+        updateGlobalEvent(event)
+        return self.execute(context)
+
+    def execute(self, context):
+        space = getSpaceUnderMouseFromContext(context)
+        space.image = None
+        return {'FINISHED'}
+
+
+class ShadingCloseOperator(bpy.types.Operator):
+    bl_label = "Shading Close"
+    bl_idname = "node.sk_shader_close"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    @classmethod
+    def poll(cls, context):
+        snode = context.space_data
+        return snode.tree_type == 'ShaderNodeTree'
+
+    def execute(self, context):
+        snode = context.space_data
+        if snode.shader_type == 'OBJECT':
+            context.active_object.active_material = None
+        elif snode.shader_type == 'WORLD':
+            context.scene.world = None
+        return {'FINISHED'}
+
+
+# Remove
+
+
+class ImageRemoveOperator(bpy.types.Operator):
+    bl_label = "Image Remove"
+    bl_idname = "image.sk_image_remove"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def invoke(self, context, event):
+        space = getSpaceUnderMouseFromContext(context, event)
+        if bool(space) and bool(space.image):
+            return self.execute(context)
+        else:
+            return {'CANCELLED'}
+
+    def execute(self, context):
+        bpy.ops.wm.call_menu(name=ImageRemoveConfirmMenu.bl_idname)
+        return {'FINISHED'}
+
+
+class ImageRemoveConfirmMenu(bpy.types.Menu):
+    bl_label = "OK?"
+    bl_idname = "sk_image_remove_confirm_menu"
+
+    def draw(self, context):
+        layout = self.layout
+        layout.operator_context = 'INVOKE_DEFAULT'
+        layout.operator("image.sk_image_remove_confirm_menu", text="Remove")
+
+
+class ImageRemoveConfirmMenuOperator(bpy.types.Operator):
+    bl_label = "Image Remove Confirm Menu"
+    bl_idname = "image.sk_image_remove_confirm_menu"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def invoke(self, context, event):
+        updateGlobalEvent(event)
+        return self.execute(context)
+
+    def execute(self, context):
+        space = getSpaceUnderMouseFromContext(context)
+        if not space.image.use_fake_user:
+            img = space.image
+            img.user_clear()
+            bpy.data.images.remove(img, do_unlink=True,
+                                   do_id_user=True, do_ui_user=True)
+        else:
+            self.report(
+                {'INFO'}, "Can't remove image while fake user is turned on!")
+        return {'FINISHED'}
+
+
+class ShadingRemoveOperator(bpy.types.Operator):
+    bl_label = "Shading Remove"
+    bl_idname = "node.sk_shader_remove"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def execute(self, context):
+        bpy.ops.wm.call_menu(name=ShadingRemoveConfirmMenu.bl_idname)
+        return {'FINISHED'}
+
+
+class ShadingRemoveConfirmMenu(bpy.types.Menu):
+    bl_label = "OK?"
+    bl_idname = "sk_shader_remove_confirm_menu"
+
+    @classmethod
+    def poll(cls, context):
+        snode = context.space_data
+        if snode.shader_type == 'OBJECT':
+            act = context.active_object.active_material
+        elif snode.shader_type == 'WORLD':
+            act = context.scene.world
+        return snode.tree_type == 'ShaderNodeTree' and act
+
+    def draw(self, context):
+        layout = self.layout
+        layout.operator_context = 'INVOKE_DEFAULT'
+        layout.operator("node.sk_shader_remove_confirm_menu", text="Remove")
+
+
+class ShadingRemoveConfirmMenuOperator(bpy.types.Operator):
+    bl_label = "Shading Remove"
+    bl_idname = "node.sk_shader_remove_confirm_menu"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def execute(self, context):
+        snode = context.space_data
+        if snode.shader_type == 'OBJECT':
+            mat = context.active_object.active_material
+            if not mat.use_fake_user:
+                mat.user_clear()
+                bpy.data.materials.remove(
+                    mat, do_unlink=True, do_id_user=True, do_ui_user=True)
+            else:
+                self.report(
+                    {'INFO'}, "Can't remove image while fake user is turned on!")
+        elif snode.shader_type == 'WORLD':
+            world = context.scene.world
+            if not world.use_fake_user:
+                world.user_clear()
+                bpy.data.worlds.remove(
+                    world, do_unlink=True, do_id_user=True, do_ui_user=True)
+            else:
+                self.report(
+                    {'INFO'}, "Can't remove image while fake user is turned on!")
+
+        return {'FINISHED'}
@@ -0,0 +1,1294 @@
+import bpy
+import os
+import json
+import hashlib
+import re
+import time
+import difflib
+from types import SimpleNamespace
+from .SugarKit_helpers import (
+    MODS_TO_STR,
+    MODS_TO_MASK,
+    MOD_ANY,
+    getKmiModMask,
+    getHotkeySpec,
+    parseOperatorData,
+    findIn,
+    setKmiActive,
+    journalKmiHotkey,
+    journalNewKeymapItem,
+)
+
+
+# / Use keyconfig models to compute keyconfig states without touching bpy keyconfigs.
+# / Models mimic bpy KeyConfig/KeyMap/KeyMapItem api used by SugarKit_helpers.
+
+
+KM_ANY = -1
+MOUSE_TYPES_PREFIXES = ('LEFTMOUSE', 'MIDDLEMOUSE', 'RIGHTMOUSE', 'BUTTON', 'PEN', 'ERASER',
+                        'MOUSE', 'INBETWEEN_MOUSEMOVE', 'TRACKPAD', 'WHEEL')
+KMI_ATTRS = ['idname', 'propvalue', 'type', 'value', 'any', 'shift', 'ctrl', 'alt', 'oskey',
+             'key_modifier', 'repeat', 'active', 'map_type']
+
+
+def getMapTypeOfKeyType(keyType):
+    if keyType.startswith('NDOF'):
+        return 'NDOF'
+    elif keyType.startswith('TIMER'):
+        return 'TIMER'
+    elif keyType == 'TEXTINPUT':
+        return 'TEXTINPUT'
+    elif keyType.startswith(MOUSE_TYPES_PREFIXES) or keyType.endswith('MOUSE'):
+        return 'MOUSE'
+    else:
+        return 'KEYBOARD'
+
+
+class KeymapItemPropertiesModel:
+    # kmi.properties.name = v | kmi.properties['name'] = v \
+    # Operator macro props (kmi.properties.MESH_OT_rip.use_fill) are created on access
+
+    def __init__(self):
+        object.__setattr__(self, '_values', {})
+
+    def __getattr__(self, name):
+        if name in self._values:
+            return self._values[name]
+        elif '_OT_' in name:
+            return self._values.setdefault(name, KeymapItemPropertiesModel())
+        raise AttributeError(name)
+
+    def __setattr__(self, name, value):
+        self._values[name] = value
+
+    def __getitem__(self, name):
+        return self._values[name]
+
+    def __setitem__(self, name, value):
+        self._values[name] = value
+
+    def __len__(self):
+        return len(self._values)
+
+    def keys(self):
+        return self._values.keys()
+
+    def items(self):
+        return self._values.items()
+
+
+class KeymapItemModel:
+    lastId = 0
+
+    def __init__(self, idname, type, value='PRESS', any=False, shift=False, ctrl=False, alt=False,
+                 oskey=False, key_modifier='NONE', repeat=False, propvalue=''):
+        KeymapItemModel.lastId += 1
+        self.id = KeymapItemModel.lastId
+        self.idname = idname
+        self.propvalue = propvalue
+        self.type = type
+        self.value = value
+        self.any = any
+        self.shift = KM_ANY if any else shift
+        self.ctrl = KM_ANY if any else ctrl
+        self.alt = KM_ANY if any else alt
+        self.oskey = KM_ANY if any else oskey
+        self.key_modifier = key_modifier
+        self.repeat = repeat
+        self.active = True
+        self.map_type = getMapTypeOfKeyType(type)
+        self.properties = KeymapItemPropertiesModel()
+
+    def to_string(self, compact=False):
+        # Roughly mimics kmi.to_string(), for logs
+        parts = [] if not self.any else ['Any']
+        for mod, attr in [('shift', 'shift'), ('ctrl', 'ctrl'), ('alt', 'alt'), ('cmd', 'oskey')]:
+            if getattr(self, attr) and not self.any:
+                parts.append(MODS_TO_STR[mod])
+        parts.append(self.type.replace('NUMPAD_', 'Numpad ').replace('NDOF_', 'NDOF '))
+        return ' '.join(parts)
+
+
+class KeymapItemsModel(list):
+
+    def new(self, idname, type, value, any=False, shift=False, ctrl=False, alt=False,
+            oskey=False, key_modifier='NONE', repeat=False, head=False):
+        kmi = KeymapItemModel(idname, type, value, any=any, shift=shift, ctrl=ctrl, alt=alt,
+                              oskey=oskey, key_modifier=key_modifier, repeat=repeat)
+        self.insert(0, kmi) if head else self.append(kmi)
+        return kmi
+
+    def new_modal(self, propvalue, type, value, any=False, shift=False, ctrl=False, alt=False,
+                  oskey=False, key_modifier='NONE', repeat=False):
+        kmi = KeymapItemModel('', type, value, any=any, shift=shift, ctrl=ctrl, alt=alt,
+                              oskey=oskey, key_modifier=key_modifier, repeat=repeat, propvalue=propvalue)
+        self.append(kmi)
+        return kmi
+
+    def new_from_item(self, item, head=False):
+        kmi = copyKeymapItemToModel(item)
+        self.insert(0, kmi) if head else self.append(kmi)
+        return kmi
+
+    def find_from_operator(self, idname, properties=None):
+        return findIn(self, lambda kmi: kmi.idname == idname and kmi.active)
+
+    def remove(self, item):
+        list.remove(self, item)
+
+
+class KeymapModel:
+
+    def __init__(self, name, space_type='EMPTY', region_type='WINDOW', modal=False):
+        self.name = name
+        self.space_type = space_type
+        self.region_type = region_type
+        self.is_modal = modal
+        self.keymap_items = KeymapItemsModel()
+
+
+class KeymapsModel(list):
+
+    def __init__(self):
+        super().__init__()
+        self.byName = {}
+
+    def __getitem__(self, key):
+        if type(key) is str:
+            return self.byName[key]
+        return list.__getitem__(self, key)
+
+    def get(self, key, default=None):
+        return self.byName.get(key, default)
+
+    def new(self, name, space_type='EMPTY', region_type='WINDOW', modal=False, tool=False):
+        km = self.get(name)
+        if not km:
+            km = KeymapModel(name, space_type, region_type, modal)
+            self.append(km)
+            self.byName[name] = km
+        return km
+
+
+class KeyconfigModel:
+
+    def __init__(self, name):
+        self.name = name
+        self.keymaps = KeymapsModel()
+
+
+def normalizeKmiPropValue(v):
+    if type(v) is float:
+        return round(v, 5)  # rna floats are single precision \
+    elif type(v) in (str, bool, int) or v == None:
+        return v
+    elif type(v) in (set, frozenset):
+        return frozenset(v)
+    elif hasattr(v, 'keys') and callable(v.keys):
+        return getKmiPropsValues(v)
+    try:
+        return tuple(normalizeKmiPropValue(it) for it in v)
+    except TypeError:
+        return v
+
+
+def getKmiPropsValues(props):
+    # bpy OperatorProperties | KeymapItemPropertiesModel -> {name: value}
+    values = {}
+    if not props:
+        return values
+    for k in props.keys():
+        try:
+            v = getattr(props, k)
+        except Exception as er:
+            v = props[k]
+        values[k] = normalizeKmiPropValue(v)
+    return values
+
+
+def setKmiPropsValues(props, values):
+    for k, v in values.items():
+        if type(v) is dict:
+            setKmiPropsValues(getattr(props, k), v)
+            continue
+        v = set(v) if type(v) is frozenset else v
+        try:
+            setattr(props, k, v)
+        except Exception as er:
+            try:
+                props[k] = v
+            except Exception as er:
+                pass
+
+
+def copyKeymapItemToModel(item):
+    kmi = KeymapItemModel(item.idname, item.type, item.value, propvalue=item.propvalue)
+    for attr in KMI_ATTRS:
+        setattr(kmi, attr, getattr(item, attr))
+    setKmiPropsValues(kmi.properties, getKmiPropsValues(item.properties))
+    return kmi
+
+
+def newKmiFromModel(km, item):
+    # KeymapItemModel -> new item in keymap, e.g. journaled one before its removal
+    newMethod = getattr(km.keymap_items, 'new' if not km.is_modal else 'new_modal')
+    kmi = newMethod(item.propvalue if km.is_modal else item.idname, item.type, item.value,
+                    key_modifier=item.key_modifier, repeat=bool(item.repeat))
+    setKmiHotkeyFromItem(kmi, item)
+    kmi.active = item.active
+    setKmiPropsValues(kmi.properties, getKmiPropsValues(item.properties))
+    return kmi
+
+
+def copyKeyconfigToModel(keyconfig, name=None, activeOnly=False, keymapNames=None):
+    kc = KeyconfigModel(name if name else keyconfig.name)
+    for km in keyconfig.keymaps:
+        if keymapNames != None and km.name not in keymapNames:
+            continue
+        kmModel = kc.keymaps.new(
+            name=km.name,
+            space_type=km.space_type,
+            region_type=km.region_type,
+            modal=km.is_modal
+        )
+        for kmi in km.keymap_items:
+            if not activeOnly or kmi.active:
+                kmModel.keymap_items.new_from_item(kmi)
+    return kc
+
+
+# Diff
+
+
+def getKmiDiffKey(kmi, isModal):
+    # Operator part: same key -> item can be edited in place
+    props = getKmiPropsValues(kmi.properties)
+    return (kmi.propvalue if isModal else kmi.idname, repr(sorted(props.items())))
+
+
+def getKmiDiffHotkey(kmi):
+    modMask = MOD_ANY if kmi.any else getKmiModMask(kmi)
+    return (kmi.type, kmi.value, modMask, kmi.key_modifier, bool(kmi.repeat))
+
+
+def diffKeyconfigs(desired, existing):
+    # -> [SimpleNamespace(keymap, inserts, deactivations, edits)] for active items only
+    diffs = []
+    for dkm in desired.keymaps:
+        km = existing.keymaps.get(dkm.name)
+        isModal = dkm.is_modal
+
+        pending = {}  # {(diffKey, diffHotkey): [kmi]}
+        for kmi in (km.keymap_items if km else []):
+            if kmi.active:
+                pending.setdefault(
+                    (getKmiDiffKey(kmi, isModal), getKmiDiffHotkey(kmi)), []).append(kmi)
+
+        missing = []
+        for dkmi in dkm.keymap_items:
+            if not dkmi.active:
+                continue
+            sig = (getKmiDiffKey(dkmi, isModal), getKmiDiffHotkey(dkmi))
+            if pending.get(sig):
+                pending[sig].pop(0)
+            else:
+                missing.append((sig, dkmi))
+
+        # Leftovers with the same operator are edited instead of replaced
+        leftovers = {}  # {diffKey: [kmi]}
+        for (diffKey, diffHotkey), items in pending.items():
+            for kmi in items:
+                leftovers.setdefault(diffKey, []).append(kmi)
+
+        inserts = []
+        edits = []
+        for (diffKey, diffHotkey), dkmi in missing:
+            if leftovers.get(diffKey):
+                edits.append((leftovers[diffKey].pop(0), dkmi))
+            else:
+                inserts.append(dkmi)
+        deactivations = [kmi for items in leftovers.values() for kmi in items]
+
+        if inserts or edits or deactivations:
+            diffs.append(SimpleNamespace(keymap=dkm, inserts=inserts,
+                                         deactivations=deactivations, edits=edits))
+    return diffs
+
+
+def setKmiHotkeyFromItem(kmi, item):
+    kmi.type = item.type
+    kmi.value = item.value
+    if item.any:
+        kmi.any = True
+    else:
+        kmi.any = False
+        kmi.shift = bool(item.shift)
+        kmi.ctrl = bool(item.ctrl)
+        kmi.alt = bool(item.alt)
+        kmi.oskey = bool(item.oskey)
+    kmi.key_modifier = item.key_modifier
+    kmi.repeat = item.repeat
+
+
+def applyKeyconfigDiffs(keyconfig, diffs):
+    stats = {'inserted': 0, 'deactivated': 0, 'edited': 0}
+    for diff in diffs:
+        dkm = diff.keymap
+        km = keyconfig.keymaps.get(dkm.name)
+        if not km:
+            km = keyconfig.keymaps.new(
+                name=dkm.name,
+                space_type=dkm.space_type,
+                region_type=dkm.region_type,
+                modal=dkm.is_modal
+            )
+        for kmi in diff.deactivations:
+            setKmiActive(kmi, False)
+            stats['deactivated'] += 1
+        for kmi, item in diff.edits:
+            journalKmiHotkey(kmi)
+            setKmiHotkeyFromItem(kmi, item)
+            stats['edited'] += 1
+        for item in diff.inserts:
+            newMethod = getattr(
+                km.keymap_items, 'new' if not km.is_modal else 'new_modal')
+            kmi = newMethod(
+                item.idname if not km.is_modal else item.propvalue,
+                item.type,
+                item.value,
+                key_modifier=item.key_modifier,
+                repeat=bool(item.repeat)
+            )
+            setKmiHotkeyFromItem(kmi, item)
+            setKmiPropsValues(kmi.properties, getKmiPropsValues(item.properties))
+            journalNewKeymapItem(km, kmi)
+            stats['inserted'] += 1
+    return stats
+
+
+# Sync probe
+
+
+def getKeymapSyncProbe(keyconfig, keymapName, matchCount=False):
+    # Last item of keymap, expected to show up in user keyconfig after sync. \
+    # matchCount - user keymap must also hold exactly keymap + addon keymap items.
+    km = keyconfig.keymaps.get(keymapName) if keymapName else None
+    if not km or not len(km.keymap_items):
+        return None
+    kmi = km.keymap_items[len(km.keymap_items) - 1]
+    count = None
+    if matchCount:
+        akm = bpy.context.window_manager.keyconfigs.addon.keymaps.get(keymapName)
+        count = len(km.keymap_items) + (len(akm.keymap_items) if akm else 0)
+    return (keymapName, kmi.propvalue if km.is_modal else kmi.idname, getKmiDiffHotkey(kmi), count)
+
+
+def isKeymapSyncProbeInUserKeyconfig(probe):
+    if not probe:
+        return True
+    keymapName, opKey, diffHotkey, count = probe
+    ukm = bpy.context.window_manager.keyconfigs.user.keymaps.get(keymapName)
+    if not ukm or (count != None and len(ukm.keymap_items) != count):
+        return False
+    for kmi in ukm.keymap_items:
+        if (kmi.propvalue if ukm.is_modal else kmi.idname) == opKey and getKmiDiffHotkey(kmi) == diffHotkey:
+            return True
+    return False
+
+
+# Build cache
+
+
+BUILD_CACHE_FILENAME = 'sugar_keyconfig_cache.json'
+BUILD_PROFILE_FILENAME = 'sugar_keyconfig_profile.json'
+
+
+def getCallableFingerprint(fn):
+    # Stable between sessions, unlike repr(fn)
+    code = getattr(fn, '__code__', None)
+    if not code:
+        return getattr(fn, '__qualname__', type(fn).__name__)
+    parts = [fn.__qualname__, code.co_code.hex(), repr(code.co_names),
+             repr([c for c in code.co_consts if not hasattr(c, 'co_code')])]
+    for cell in fn.__closure__ or []:
+        try:
+            v = cell.cell_contents
+        except ValueError:
+            continue
+        parts.append(getCallableFingerprint(v) if callable(v) else repr(v))
+    return '|'.join(parts)
+
+
+def getHotkeyFingerprint(hotkey):
+    spec = getHotkeySpec(hotkey)
+    return repr(spec.signature()) if spec else repr(hotkey)
+
+
+def getKeymapSpecHash(records):
+    sha = hashlib.sha1()
+    for r in records:
+        sha.update(repr((
+            r.action,
+            r.keymapName,
+            repr(r.operatorData),
+            getHotkeyFingerprint(r.hotkey),
+            getHotkeyFingerprint(getattr(r, 'disableOld', None)),
+            getHotkeyFingerprint(getattr(r, 'disableOldExactProps', None)),
+            getHotkeyFingerprint(getattr(r, 'oldHotkey', None)),
+            getHotkeyFingerprint(getattr(r, 'oldHotkeyExactProps', None)),
+            getCallableFingerprint(r.setKmiProps) if getattr(
+                r, 'setKmiProps', None) else '',
+        )).encode())
+    return sha.hexdigest()
+
+
+def getKeymapSpecHashes(records):
+    # -> {keymap name | '*': hash of its records}
+    groups = {}
+    for r in records:
+        groups.setdefault(r.keymapName, []).append(r)
+    return {name: getKeymapSpecHash(group) for name, group in groups.items()}
+
+
+def getChangedKeymapNames(cache, records, buildHash):
+    # -> keymap names whose records changed since cached build | None if all keymaps may have. \
+    # Rest of build hash (blender, addons, default keyconfig) and '*' records must be unchanged.
+    cached = cache.get('keymapHashes')
+    if not cached or (cache.get('hash') or '').partition('-')[2] != buildHash.partition('-')[2]:
+        return None
+    hashes = getKeymapSpecHashes(records)
+    if hashes.get('*') != cached.get('*'):
+        return None
+    return [name for name in set(hashes) | set(cached) if hashes.get(name) != cached.get(name)]
+
+
+def getKeyconfigFingerprint(keyconfig):
+    sha = hashlib.sha1()
+    for km in keyconfig.keymaps:
+        sha.update(repr((km.name, km.space_type,
+                   km.region_type, km.is_modal)).encode())
+        for kmi in km.keymap_items:
+            sha.update(repr((
+                kmi.propvalue if km.is_modal else kmi.idname,
+                getKmiDiffHotkey(kmi),
+                kmi.active,
+                sorted(getKmiPropsValues(kmi.properties).items()),
+            )).encode())
+    return sha.hexdigest()
+
+
+def getBuildCacheFilepath():
+    return os.path.join(bpy.utils.user_resource('CONFIG'), BUILD_CACHE_FILENAME)
+
+
+def readBuildCache():
+    try:
+        with open(getBuildCacheFilepath()) as f:
+            return json.load(f)
+    except Exception as er:
+        return {}
+
+
+def writeBuildCache(buildHash, filepath, keymapHashes=None):
+    try:
+        with open(getBuildCacheFilepath(), 'w') as f:
+            json.dump({'hash': buildHash, 'filepath': filepath, 'keymapHashes': keymapHashes}, f)
+    except Exception as er:
+        pass
+
+
+def writeBuildProfile(profile):
+    # -> filepath | None, entries in run order as [{name, depth, calls, seconds, ...}]
+    filepath = os.path.join(bpy.utils.user_resource('CONFIG'), BUILD_PROFILE_FILENAME)
+    try:
+        with open(filepath, 'w') as f:
+            json.dump([vars(entry) for entry in profile.values()], f, indent=2)
+        return filepath
+    except Exception as er:
+        return None
+
+
+# Snapshot
+
+
+SNAPSHOT_FORMAT = 1
+SNAPSHOT_FILENAME = 'sugar_keyconfig_snapshot.json'
+
+
+def encodeKmiPropValue(v):
+    # Normalized prop value -> json value, sets are tagged to be restored as sets
+    if type(v) is frozenset:
+        return {'__set__': sorted(v)}
+    elif type(v) is dict:
+        return {k: encodeKmiPropValue(it) for k, it in v.items()}
+    elif type(v) is tuple:
+        return [encodeKmiPropValue(it) for it in v]
+    return v
+
+
+def decodeKmiPropValue(v):
+    if type(v) is dict:
+        if '__set__' in v:
+            return set(v['__set__'])
+        return {k: decodeKmiPropValue(it) for k, it in v.items()}
+    return v
+
+
+def getKmiSnapshot(kmi, isModal):
+    return {
+        'op': kmi.propvalue if isModal else kmi.idname,
+        'type': kmi.type,
+        'value': kmi.value,
+        'any': bool(kmi.any),
+        'shift': bool(kmi.shift) and not kmi.any,
+        'ctrl': bool(kmi.ctrl) and not kmi.any,
+        'alt': bool(kmi.alt) and not kmi.any,
+        'oskey': bool(kmi.oskey) and not kmi.any,
+        'key_modifier': kmi.key_modifier,
+        'repeat': bool(kmi.repeat),
+        'props': encodeKmiPropValue(getKmiPropsValues(kmi.properties)),
+    }
+
+
+def iterKeyconfigDelta(keyconfig, defaultKeyconfig):
+    # -> (km, removed default items indices, appended items, default items count) per changed keymap. \
+    # Kept default items (matched in order) + appended items reproduce active items of keymap \
+    # in the same order. Default items edited in place (addons, user) end matching, rest is appended.
+    for km in keyconfig.keymaps:
+        isModal = km.is_modal
+        dkm = defaultKeyconfig.keymaps.get(km.name)
+        defaultItems = list(dkm.keymap_items) if dkm else []
+        items = [kmi for kmi in km.keymap_items if kmi.active]
+
+        removed = []
+        i = 0
+        j = 0
+        while i < len(defaultItems) and j < len(items):
+            if (getKmiDiffKey(defaultItems[i], isModal), getKmiDiffHotkey(defaultItems[i])) == \
+                    (getKmiDiffKey(items[j], isModal), getKmiDiffHotkey(items[j])):
+                j += 1
+            else:
+                removed.append(i)
+            i += 1
+        removed.extend(range(i, len(defaultItems)))
+
+        if removed or j < len(items):
+            yield km, removed, items[j:], len(defaultItems)
+
+
+def getKeyconfigSnapshot(keyconfig, defaultKeyconfig, buildHash=None):
+    # Per changed keymap: indices of removed default items and appended items
+    keymaps = []
+    for km, removed, inserts, defaultCount in iterKeyconfigDelta(keyconfig, defaultKeyconfig):
+        keymaps.append({
+            'name': km.name,
+            'space_type': km.space_type,
+            'region_type': km.region_type,
+            'modal': km.is_modal,
+            'removed': removed,
+            'inserts': [getKmiSnapshot(kmi, km.is_modal) for kmi in inserts],
+        })
+    return {
+        'format': SNAPSHOT_FORMAT,
+        'blender': list(bpy.app.version),
+        'default': getKeyconfigFingerprint(defaultKeyconfig),
+        'hash': buildHash,
+        'keymaps': keymaps,
+    }
+
+
+def getSnapshotFilepath():
+    return os.path.join(bpy.utils.user_resource('CONFIG'), SNAPSHOT_FILENAME)
+
+
+def writeKeyconfigSnapshot(snapshot, filepath=None):
+    filepath = filepath if filepath else getSnapshotFilepath()
+    try:
+        with open(filepath, 'w') as f:
+            json.dump(snapshot, f, separators=(',', ':'))
+        return filepath
+    except Exception as er:
+        return None
+
+
+def readKeyconfigSnapshot(filepath=None):
+    try:
+        with open(filepath if filepath else getSnapshotFilepath()) as f:
+            return json.load(f)
+    except Exception as er:
+        return None
+
+
+def isKeyconfigSnapshotCurrent(snapshot, defaultKeyconfig, buildHash=None):
+    # Indices of default items are valid only for the same blender and default keyconfig
+    return bool(snapshot) and (
+        snapshot.get('format') == SNAPSHOT_FORMAT and
+        tuple(snapshot.get('blender', ())) == tuple(bpy.app.version) and
+        snapshot.get('default') == getKeyconfigFingerprint(defaultKeyconfig) and
+        (buildHash == None or snapshot.get('hash') == buildHash)
+    )
+
+
+def newKmiFromSnapshot(km, item):
+    newMethod = getattr(km.keymap_items, 'new' if not km.is_modal else 'new_modal')
+    kmi = newMethod(item['op'], item['type'], item['value'],
+                    key_modifier=item['key_modifier'], repeat=item['repeat'])
+    setKmiHotkeyFromItem(kmi, SimpleNamespace(**item))
+    setKmiPropsValues(kmi.properties, decodeKmiPropValue(item['props']))
+    return kmi
+
+
+def loadKeyconfigSnapshot(snapshot, name, buildHash=None):
+    # -> new active keyconfig | None if snapshot is stale. Only changed keymaps \
+    # are created, Blender takes the rest from default keyconfig.
+    wmkcs = bpy.context.window_manager.keyconfigs
+    if not isKeyconfigSnapshotCurrent(snapshot, wmkcs.default, buildHash):
+        return None
+
+    kc = wmkcs.new(name)  # clears existing one with the same name \
+
+    for entry in snapshot['keymaps']:
+        km = kc.keymaps.new(
+            name=entry['name'],
+            space_type=entry['space_type'],
+            region_type=entry['region_type'],
+            modal=entry['modal']
+        )
+        dkm = wmkcs.default.keymaps.get(entry['name'])
+        removed = set(entry['removed'])
+        for i, dkmi in enumerate(dkm.keymap_items if dkm else []):
+            if i not in removed:
+                km.keymap_items.new_from_item(dkmi)
+        for item in entry['inserts']:
+            newKmiFromSnapshot(km, item)
+
+    wmkcs.active = kc
+    return kc
+
+
+# Delta export
+
+
+DELTA_LOADER = """
+def keyconfig_delta_props_set(props, values):
+    for k, v in values.items():
+        if type(v) is dict:
+            keyconfig_delta_props_set(getattr(props, k), v)
+            continue
+        try:
+            setattr(props, k, v)
+        except Exception:
+            pass
+
+
+def keyconfig_delta_load(name, delta):
+    # Changed keymaps only: default items minus removed ones + appended items
+    wmkcs = bpy.context.window_manager.keyconfigs
+    kc = wmkcs.new(name)
+    for km_name, space_type, region_type, modal, default_count, removed, inserts in delta:
+        km = kc.keymaps.new(km_name, space_type=space_type, region_type=region_type, modal=modal)
+        dkm = wmkcs.default.keymaps.get(km_name)
+        default_items = list(dkm.keymap_items) if dkm else []
+        if len(default_items) != default_count:
+            print("Sugar Keyconfig: default '%s' keymap differs, its items are kept" % km_name)
+            removed = ()
+        removed = set(removed)
+        for i, dkmi in enumerate(default_items):
+            if i not in removed:
+                km.keymap_items.new_from_item(dkmi)
+        items_new = km.keymap_items.new_modal if modal else km.keymap_items.new
+        for op, type, value, any, shift, ctrl, alt, oskey, key_modifier, repeat, props in inserts:
+            kmi = items_new(op, type, value, any=any, shift=shift, ctrl=ctrl, alt=alt,
+                            oskey=oskey, key_modifier=key_modifier, repeat=repeat)
+            keyconfig_delta_props_set(kmi.properties, props)
+    return kc
+
+
+if __name__ == "__main__":
+    import os
+    keyconfig_delta_load(os.path.splitext(os.path.basename(__file__))[0], keyconfig_delta)
+"""
+
+
+def getKmiPropsLiteral(values):
+    # Normalized props -> python literal, frozensets back to sets
+    def literal(v):
+        if type(v) is frozenset:
+            return set(v)
+        elif type(v) is dict:
+            return {k: literal(it) for k, it in v.items()}
+        return v
+    return repr(literal(values))
+
+
+def getKmiDeltaLine(kmi, isModal):
+    return '            (%r, %r, %r, %r, %r, %r, %r, %r, %r, %r, %s),\n' % (
+        kmi.propvalue if isModal else kmi.idname,
+        kmi.type,
+        kmi.value,
+        bool(kmi.any),
+        bool(kmi.shift) and not kmi.any,
+        bool(kmi.ctrl) and not kmi.any,
+        bool(kmi.alt) and not kmi.any,
+        bool(kmi.oskey) and not kmi.any,
+        kmi.key_modifier,
+        bool(kmi.repeat),
+        getKmiPropsLiteral(getKmiPropsValues(kmi.properties)),
+    )
+
+
+def exportKeyconfigDelta(keyconfig, defaultKeyconfig, filepath):
+    # Keyconfig preset with only changed keymaps, written keymap by keymap. \
+    # Loader at file end rebuilds them from default keyconfig on activation.
+    start = time.perf_counter()
+    stats = SimpleNamespace(filepath=filepath, keymaps=0, inserted=0, removed=0,
+                            items=sum(len(km.keymap_items) for km in keyconfig.keymaps),
+                            bytes=0, seconds=0.0)
+    with open(filepath, 'w', encoding='utf-8') as f:
+        f.write('# Sugar Keyconfig: keymaps changed against default keyconfig of Blender %s.\n'
+                % '.'.join(str(v) for v in bpy.app.version))
+        f.write('# Removed default items are stored by index, valid for this version only.\n')
+        f.write('import bpy\n\nkeyconfig_delta = [\n')
+        for km, removed, inserts, defaultCount in iterKeyconfigDelta(keyconfig, defaultKeyconfig):
+            f.write('    (%r, %r, %r, %r, %d, %r, [\n' % (
+                km.name, km.space_type, km.region_type, km.is_modal, defaultCount, removed))
+            for kmi in inserts:
+                f.write(getKmiDeltaLine(kmi, km.is_modal))
+            f.write('    ]),\n')
+            stats.keymaps += 1
+            stats.inserted += len(inserts)
+            stats.removed += len(removed)
+        f.write(']\n\n')
+        f.write(DELTA_LOADER)
+        stats.bytes = f.tell()
+    stats.seconds = time.perf_counter() - start
+    return stats
+
+
+def getKeyconfigDeltaExportText(stats):
+    return '%s: %.1f KB in %.1f ms | %d keymaps, %d appended and %d removed items of %d' % (
+        os.path.basename(stats.filepath), stats.bytes / 1024, stats.seconds * 1000,
+        stats.keymaps, stats.inserted, stats.removed, stats.items)
+
+
+# Conflicts
+
+
+GLOBAL_KEYMAPS_ROOTS = ['Window', 'Screen']  # active in every editor
+
+
+def getKeymapHierarchy():
+    # Same tree rna_keymap_ui.draw_hierarchy() draws: [(name, space, region, children)]
+    try:
+        from bl_keymap_utils import keymap_hierarchy
+        return keymap_hierarchy.generate()
+    except Exception as er:
+        return []
+
+
+def getKeymapScopes(hierarchy):
+    # -> {kmName: (space, region, path)} - space/region of hierarchy root, \
+    # path of keymap names from root; () for always active global keymaps
+    scopes = {}
+
+    def walk(entries, root, path):
+        for name, space, region, children in entries:
+            entryRoot = root if root else (name, space, region)
+            isGlobal = entryRoot[0] in GLOBAL_KEYMAPS_ROOTS
+            entryPath = () if isGlobal else path + (name,)
+            scopes.setdefault(name, (entryRoot[1], entryRoot[2], entryPath))
+            walk(children, entryRoot, entryPath)
+
+    walk(hierarchy, None, ())
+    return scopes
+
+
+def isKeymapScopesOverlap(pathA, pathB):
+    # One keymap is active whenever the other one is: same branch of hierarchy
+    shorter, longer = (pathA, pathB) if len(pathA) <= len(pathB) else (pathB, pathA)
+    return longer[:len(shorter)] == shorter
+
+
+def findKeyconfigConflicts(keyconfig, hierarchy=None):
+    # -> [SimpleNamespace(hotkey, items=[(kmName, kmi)])] active items claiming same event
+    scopes = getKeymapScopes(
+        hierarchy if hierarchy != None else getKeymapHierarchy())
+    index = {}  # {(space, region, type, modMask, value, keyModifier): [(path, kmName, kmi)]}
+
+    for km in keyconfig.keymaps:
+        if km.is_modal:
+            continue
+        space, region, path = scopes.get(
+            km.name, (km.space_type, km.region_type, (km.name,)))
+        for kmi in km.keymap_items:
+            if not kmi.active or kmi.map_type not in ('KEYBOARD', 'MOUSE', 'NDOF'):
+                continue
+            keyType, value, modMask, keyModifier, repeat = getKmiDiffHotkey(kmi)
+            index.setdefault((space, region, keyType, modMask, value, keyModifier), []).append(
+                (path, km.name, kmi))
+
+    conflicts = []
+    for key, entries in index.items():
+        space, region, keyType, modMask, value, keyModifier = key
+        # Global keymaps and any-modifier items claim the event in every space / for every mask
+        others = []
+        if (space, region) != ('EMPTY', 'WINDOW'):
+            others += [e for e in index.get(('EMPTY', 'WINDOW', keyType, modMask, value, keyModifier), [])
+                       if e[0] == ()]
+        if modMask != MOD_ANY:
+            others += index.get((space, region, keyType, MOD_ANY, value, keyModifier), [])
+        clashing = []
+        for path, kmName, kmi in entries:
+            if any(isKeymapScopesOverlap(path, other[0])
+                   for other in entries + others if other[2] != kmi):
+                clashing.append((kmName, kmi))
+        if clashing:
+            clashing += [(kmName, kmi) for path, kmName, kmi in others
+                         if any(isKeymapScopesOverlap(path, e[0]) for e in entries)]
+            conflicts.append(SimpleNamespace(
+                hotkey=(keyType, modMask, value, keyModifier), items=clashing))
+    return conflicts
+
+
+def getKeyconfigConflictsText(conflicts):
+    lines = ['%d conflicts' % len(conflicts)]
+    for conflict in conflicts:
+        keyType, modMask, value, keyModifier = conflict.hotkey
+        mods = [mod for mod, mask in MODS_TO_MASK.items() if modMask & mask]
+        hotkey = ' '.join([keyType] + mods + ([keyModifier] if keyModifier != 'NONE' else []) +
+                          ([value] if value != 'PRESS' else []))
+        lines.append(hotkey)
+        for kmName, kmi in conflict.items:
+            lines.append('  [%s] %s' % (kmName, kmi.idname))
+    return '\n'.join(lines)
+
+
+# Spec validation
+
+
+API_DIR = os.path.join(os.path.dirname(__file__), '..', 'api')
+OPERATORS_DUMP_FILENAME = 'bpy.ops.json'  # written by writeOperatorsDump() in Blender \
+NATIVE_OPERATORS_FILENAME = 'bpy.ops.native.json'  # reviewed native operators used by spec, new ones are added there \
+OPERATOR_ID_PATTERNS = [
+    re.compile(r'''["']([a-z0-9_]+\.[a-z0-9_]+)["']'''),  # 'mesh.select_all', may be a data path too \
+    re.compile(r'''bpy\.ops\.([a-z0-9_]+\.[a-z0-9_]+)'''),
+]
+
+
+def readApiTypesDump(filename):
+    try:
+        with open(os.path.join(API_DIR, 'types', filename)) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+
+
+def writeOperatorsDump():
+    # Run in Blender: native operators are not in bpy.types dump
+    ops = sorted(cat + '.' + op for cat in dir(bpy.ops) for op in dir(getattr(bpy.ops, cat)))
+    with open(os.path.join(API_DIR, 'types', OPERATORS_DUMP_FILENAME), 'w') as f:
+        json.dump(ops, f, indent=2)
+
+
+def buildSpecValidationIndex(sourcePaths=[]):
+    # Dumps are read once into sets. Without bpy.ops dump operators are known from native \
+    # operators list, bpy.types dump (python ones) and ids used in bundled ui sources.
+    operatorsDump = readApiTypesDump(OPERATORS_DUMP_FILENAME)
+    nativeOperators = readApiTypesDump(NATIVE_OPERATORS_FILENAME)
+    operators = set(operatorsDump or nativeOperators or [])
+    for name in readApiTypesDump('bpy.types.json'):
+        if '_OT_' in name:
+            prefix, opName = name.split('_OT_', 1)
+            operators.add(prefix.lower() + '.' + opName)
+    sourcesDir = os.path.join(API_DIR, 'source')
+    for filepath in [os.path.join(sourcesDir, f) for f in sorted(os.listdir(sourcesDir))
+                     if f.endswith('.py')] + list(sourcePaths):
+        with open(filepath, encoding='utf-8') as f:
+            text = f.read()
+        for pattern in OPERATOR_ID_PATTERNS:
+            operators.update(pattern.findall(text))
+
+    operatorsByCategory = {}  # {category: [name]} - typo suggestions within category
+    for idName in operators:
+        category, opName = idName.split('.', 1)
+        operatorsByCategory.setdefault(category, []).append(opName)
+
+    return SimpleNamespace(
+        keymaps=set(readApiTypesDump('keymap.name.json')),
+        modalValues={k: set(v) for k, v in readApiTypesDump('propvalue.json').items()},
+        eventTypes=set(readApiTypesDump('key.type_event.type.json')),
+        eventValues=set(readApiTypesDump('key.value_event.value.json')),
+        operators=operators,
+        operatorsByCategory=operatorsByCategory,
+        isOperatorsComplete=operatorsDump != None or nativeOperators != None,
+        operatorsSource=OPERATORS_DUMP_FILENAME if operatorsDump != None else NATIVE_OPERATORS_FILENAME,
+    )
+
+
+def validateKeymapSpecRecord(index, record):
+    # -> [(severity, field, value, message)], 'warning' where dumps may be incomplete
+    problems = []
+    kmName = record.keymapName
+    if kmName != '*' and kmName not in index.keymaps:
+        problems.append(('warning', 'keymap', kmName, 'keymap not in dump'))
+
+    idName, properties = parseOperatorData(record.operatorData)
+    modalValues = index.modalValues.get(kmName)
+    if type(idName) is not str or idName.startswith('*'):
+        pass
+    elif modalValues != None:
+        if idName not in modalValues:
+            problems.append(('error', 'propvalue', idName, 'unknown modal value of ' + kmName))
+    elif idName not in index.operators:
+        category, opName = idName.split('.', 1) if '.' in idName else ('', idName)
+        close = difflib.get_close_matches(
+            opName, index.operatorsByCategory.get(category, []), n=1, cutoff=0.8)
+        problems.append(('error' if index.isOperatorsComplete else 'warning', 'operator', idName,
+                         'unknown operator' + (', did you mean %s.%s' % (category, close[0]) if close else
+                                               ', not in ' + index.operatorsSource)))
+
+    for field in ['hotkey', 'disableOld', 'disableOldExactProps']:
+        spec = getHotkeySpec(getattr(record, field, None))
+        if not spec:
+            continue
+        if spec.key not in index.eventTypes:
+            problems.append(('error', field, spec.key, 'unknown event type'))
+        if spec.keyModifier and spec.keyModifier not in index.eventTypes:
+            problems.append(('error', field, spec.keyModifier, 'unknown key modifier'))
+        if spec.value not in index.eventValues:
+            problems.append(('error', field, spec.value, 'unknown event value'))
+    return problems
+
+
+def validateKeymapSpec(records, index):
+    # -> [SimpleNamespace(severity, section, order, record, field, value, message)], errors first. \
+    # Checks are set lookups, single pass over records is faster than splitting work by sections.
+    problems = []
+    for record in records:
+        for severity, field, value, message in validateKeymapSpecRecord(index, record):
+            problems.append(SimpleNamespace(severity=severity, section=record.section, order=record.order,
+                                            record=record, field=field, value=value, message=message))
+    problems.sort(key=lambda problem: problem.severity != 'error')
+    return problems
+
+
+def getKeymapSpecProblemsText(problems, recordsCount):
+    errors = [problem for problem in problems if problem.severity == 'error']
+    lines = ['%d errors, %d warnings in %d records' % (
+        len(errors), len(problems) - len(errors), recordsCount)]
+    for problem in problems:
+        lines.append('  %s: %s #%d [%s] %s %r: %s' % (
+            problem.severity, problem.section, problem.order, problem.record.keymapName,
+            problem.field, problem.value, problem.message))
+    return '\n'.join(lines)
+
+
+# Hotkeys sheet
+
+
+HOTKEYS_SHEET_FILEPATH = os.path.join(os.path.dirname(__file__), '..', '..', 'Blender Hotkeys.txt')
+HOTKEYS_SHEET_SECTIONS = {  # sheet '// NAME' header: builder section, SETTINGS are preferences \
+    'INTEFACE': 'addInterfaceHotkeys',
+    'VIEW': 'addViewHotkeys',
+    'OBJECT': 'addObjectHotkeys',
+    'OUTLINER': 'addOutlinerHotkeys',
+    'TRANSFORMATIONS': 'addTransformationsHotkeys',
+    'PROPERTIES': 'addPropertiesHotkeys',
+    'ANIMATION': 'addAnimationHotkeys',
+    'EDIT': 'addEditMeshHotkeys',
+    'CURVES': 'addCurvesHotkeys',
+    'SCULPT': 'addSculptHotkeys',
+    'VERTEX/WEIGHT/IMAGE PAINT': 'addPaintHotkeys',
+    'LAYER PAINTER': 'addPaintHotkeys',
+    'IMAGE/UV EDITOR': 'addImageAndUvHotkeys',
+    'FILE BROWSER': 'addFileBrowserHotkeys',
+    'SHADER EDITOR': 'addShaderHotkeys',
+}
+SHEET_KEYS = {
+    'LB': 'LEFTMOUSE', 'RB': 'RIGHTMOUSE', 'MB': 'MIDDLEMOUSE', 'trackpad': 'TRACKPADPAN',
+    'wheelup': 'WHEELUPMOUSE', 'wheeldown': 'WHEELDOWNMOUSE',
+    'space': 'SPACE', 'tab': 'TAB', 'enter': 'RET', 'esc': 'ESC', 'del': 'DEL', 'backspace': 'BACK_SPACE',
+    'home': 'HOME', 'end': 'END', 'pageup': 'PAGE_UP', 'pagedown': 'PAGE_DOWN', 'insert': 'INSERT',
+    'left': 'LEFT_ARROW', 'right': 'RIGHT_ARROW', 'up': 'UP_ARROW', 'down': 'DOWN_ARROW',
+    '`': 'ACCENT_GRAVE', ',': 'COMMA', '.': 'PERIOD', '/': 'SLASH', '\\': 'BACK_SLASH', ';': 'SEMI_COLON',
+    "'": 'QUOTE', '-': 'MINUS', '=': 'EQUAL', '[': 'LEFT_BRACKET', ']': 'RIGHT_BRACKET',
+    '0': 'ZERO', '1': 'ONE', '2': 'TWO', '3': 'THREE', '4': 'FOUR',
+    '5': 'FIVE', '6': 'SIX', '7': 'SEVEN', '8': 'EIGHT', '9': 'NINE',
+}
+SHEET_NUMPAD_KEYS = {'-': 'NUMPAD_MINUS', '+': 'NUMPAD_PLUS', '/': 'NUMPAD_SLASH', '*': 'NUMPAD_ASTERIX',
+                     '.': 'NUMPAD_PERIOD', 'enter': 'NUMPAD_ENTER'}
+SHEET_VALUES = {'dbl': 'DOUBLE_CLICK', 'clk': 'CLICK', 'drag': 'CLICK_DRAG', 'release': 'RELEASE'}
+SHEET_MODIFIERS = ['shift', 'ctrl', 'alt', 'cmd', 'any']
+SHEET_HEADER = re.compile(r'^// (\S.*?)\s*$')
+SHEET_MARK = re.compile(r'\[([+*,#-]+)\]')  # [+] added, [*] replaced, [-] disabled, [*,+] per hotkey \
+SHEET_ADDON_FLAG = re.compile(r'\{([nb ])\}')  # {n} new addon operator, {b} bundled addon, { } other \
+SHEET_COLUMNS = re.compile(r'\t+\s*|\s{2,}')
+
+hotkeysSheetCache = {}  # {filepath: (mtime, entries)}
+
+
+def getSheetKeyType(token, isNumpad=False):
+    if isNumpad:
+        return 'NUMPAD_' + token if token.isdigit() and len(token) == 1 else SHEET_NUMPAD_KEYS.get(token)
+    elif token in SHEET_KEYS:
+        return SHEET_KEYS[token]
+    elif len(token) == 1 and 'A' <= token <= 'Z':
+        return token
+    elif re.match(r'^F([1-9]|1[0-9]|2[0-4])$', token):
+        return token
+    return None
+
+
+def parseSheetHotkeys(text):
+    # 'shift ctrl dbl 4 , X LB' -> [HotkeySpec('FOUR shift ctrl DOUBLE_CLICK'), HotkeySpec('LEFTMOUSE X')]. \
+    # Last key is event type, key before it is key modifier. None for hints like 'ctrl/alt' or 'shift'.
+    tokens = []
+    for token in text.split():
+        if len(token) > 1 and token.endswith(','):
+            tokens += [token[:-1], ',']
+        else:
+            tokens.append(token)
+
+    hotkeys = []
+    hotkey = SimpleNamespace(keys=[], modifiers=[], value=None, isValid=True)
+
+    def flush():
+        spec = None
+        if not hotkey.keys and hotkey.modifiers and hotkey.value:
+            # 'alt dbl shift': modifier itself is the key
+            mod = hotkey.modifiers.pop()
+            hotkey.keys.append('OSKEY' if mod == 'cmd' else 'LEFT_' + mod.upper())
+        if hotkey.isValid and 0 < len(hotkey.keys) <= 2:
+            parts = [hotkey.keys[-1]] + hotkey.modifiers + hotkey.keys[:-1]
+            spec = getHotkeySpec(' '.join(parts + ([hotkey.value] if hotkey.value else [])))
+        if hotkey.keys or hotkey.modifiers or not hotkey.isValid:
+            hotkeys.append(spec)
+        hotkey.keys, hotkey.modifiers, hotkey.value, hotkey.isValid = [], [], None, True
+
+    isNumpad = False
+    for token in tokens:
+        if token == ',' and hotkey.keys:
+            flush()
+        elif token == 'num':
+            isNumpad = True
+        elif token in SHEET_MODIFIERS:
+            hotkey.modifiers.append(token)
+        elif token in SHEET_VALUES:
+            hotkey.value = SHEET_VALUES[token]
+        else:
+            keyType = getSheetKeyType(token, isNumpad)
+            isNumpad = False
+            if keyType:
+                hotkey.keys.append(keyType)
+            else:
+                hotkey.isValid = False
+    flush()
+    return hotkeys
+
+
+def getSheetHotkeyText(spec):
+    # HotkeySpec -> sheet notation, for documenting built hotkeys
+    sheetKeys = {v: k for k, v in SHEET_KEYS.items()}
+    sheetKeys.update({v: 'num ' + k for k, v in SHEET_NUMPAD_KEYS.items()})
+    sheetValues = {v: k for k, v in SHEET_VALUES.items()}
+
+    def getKeyText(key):
+        if key in sheetKeys:
+            return sheetKeys[key]
+        elif key.startswith('NUMPAD_') and key[-1].isdigit():
+            return 'num ' + key[-1]
+        return key
+
+    parts = [mod for mod in SHEET_MODIFIERS if spec.modMask & MODS_TO_MASK[mod]]
+    if spec.value in sheetValues:
+        parts.append(sheetValues[spec.value])
+    if spec.keyModifier:
+        parts.append(getKeyText(spec.keyModifier))
+    return ' '.join(parts + [getKeyText(spec.key)])
+
+
+def isSheetHotkeyToken(token):
+    return token in (',', 'num') or token in SHEET_MODIFIERS or token in SHEET_VALUES or \
+        getSheetKeyType(token) != None or getSheetKeyType(token, isNumpad=True) != None
+
+
+def parseHotkeysSheetLine(line):
+    # -> (indent, label, hotkeys, marks, olds, disables, addonFlag) of one entry line
+    text = line.rstrip('\n')
+    addonFlag = None
+    flagMatch = SHEET_ADDON_FLAG.search(text)
+    if flagMatch:
+        addonFlag = flagMatch.group(1)
+        text = text[:flagMatch.start()] + text[flagMatch.end():]
+
+    parts = SHEET_MARK.split(text)  # [columns, mark, text, mark, text, ...]
+    columns = SHEET_COLUMNS.split(parts[0].strip())
+    indent = len(parts[0]) - len(parts[0].lstrip(' '))
+    isLabelled = parts[0][:1] not in ('\t', '') or indent
+    label = columns[0] if isLabelled else ''
+    hotkeyColumns = columns[1:] if isLabelled else columns
+    if not hotkeyColumns and len(parts) > 1:
+        # 'mesh (apply modif.) shift ctrl M  [+]': hotkey words are the tail of label
+        words = label.split()
+        i = len(words)
+        while i > 1 and isSheetHotkeyToken(words[i - 1]):
+            i -= 1
+        label, hotkeyColumns = ' '.join(words[:i]), [' '.join(words[i:])] if i < len(words) else []
+    hotkeys = parseSheetHotkeys(hotkeyColumns[-1]) if hotkeyColumns else []
+
+    marks, olds, disables = [''] * len(hotkeys), [], []
+    for i in range(1, len(parts), 2):
+        mark, comment = parts[i], parts[i + 1].split('#', 1)[0]
+        if i == 1 and ('+' in mark or '*' in mark):
+            # One mark applies to all hotkeys, more are aligned to last ones (first may be on previous line)
+            entryMarks = mark.split(',')
+            if len(entryMarks) == 1:
+                marks = entryMarks * len(hotkeys)
+            else:
+                marks = ([''] * len(hotkeys) + entryMarks)[-len(hotkeys):] if hotkeys else []
+        if '*' in mark:
+            olds += [spec for spec in parseSheetHotkeys(comment) if spec]
+        elif mark == '-':
+            disables += [spec for spec in parseSheetHotkeys(comment) if spec]
+    return indent, label, hotkeys, [m.strip('#') for m in marks], olds, disables, addonFlag
+
+
+def iterHotkeysSheet(filepath=HOTKEYS_SHEET_FILEPATH):
+    # Streams sheet entries: SimpleNamespace(line, heading, section, group, label, hotkeys, marks, \
+    # olds, disables, addon). Lines before first '// NAME' header (notes) are skipped.
+    heading = section = group = groupAddon = None
+    previous = ''
+    with open(filepath, encoding='utf-8', errors='replace') as f:
+        for lineNo, line in enumerate(f, 1):
+            headerMatch = SHEET_HEADER.match(line) if previous.startswith('//') and \
+                not previous.strip('/\n ') else None
+            previous = line
+            if headerMatch:
+                heading = headerMatch.group(1)
+                section = HOTKEYS_SHEET_SECTIONS.get(heading)
+                group = groupAddon = None
+                continue
+            if heading == None or not line.strip() or line.strip() == '||' or line.startswith('//'):
+                continue
+
+            indent, label, hotkeys, marks, olds, disables, addonFlag = parseHotkeysSheetLine(line)
+            if label and not indent and not line.startswith('\t'):
+                group, groupAddon = label, addonFlag
+            elif addonFlag == None:
+                addonFlag = groupAddon  # entries under 'node wrangler {b}' are addon ones too
+            if not hotkeys and not olds and not disables:
+                continue
+            yield SimpleNamespace(line=lineNo, heading=heading, section=section, group=group,
+                                  label=label, hotkeys=hotkeys, marks=marks, olds=olds,
+                                  disables=disables, addon=addonFlag)
+
+
+def readHotkeysSheet(filepath=HOTKEYS_SHEET_FILEPATH):
+    # Parsed once per sheet change, rebuilds reuse entries
+    try:
+        mtime = os.path.getmtime(filepath)
+    except OSError:
+        return None
+    cached = hotkeysSheetCache.get(filepath)
+    if cached and cached[0] == mtime:
+        return cached[1]
+    entries = list(iterHotkeysSheet(filepath))
+    hotkeysSheetCache[filepath] = (mtime, entries)
+    return entries
+
+
+def getSheetSignature(spec):
+    # Sheet doesn't note 'any', 'repeat' and ANY value, so they match plain press
+    return (spec.key, spec.modMask & ~MOD_ANY, spec.keyModifier,
+            'PRESS' if spec.value == 'ANY' else spec.value)
+
+
+def diffHotkeysSheet(entries, records, featureKeymaps=[]):
+    # Documented vs built hotkeys per section, one pass over each side with \
+    # {(section, sheet signature): [(spec, entry | record)]}. \
+    # Addon entries {b} { } are edited outside the spec, so not compared. \
+    # SugarKit features keymap items [(keymap name, class name, hotkey)] have no section: \
+    # built in every section adding to their keymap, not documented only if none documents them.
+    start = time.perf_counter()
+
+    def put(items, section, spec, item):
+        items.setdefault((section, getSheetSignature(spec)), []).append((spec, item))
+
+    built, builtDisables = {}, {}
+    for record in records:
+        spec = getHotkeySpec(record.hotkey)
+        if record.action != 'add':
+            if spec:
+                put(builtDisables, record.section, spec, record)
+            continue
+        if spec:
+            put(built, record.section, spec, record)
+        for field in ['disableOld', 'disableOldExactProps']:
+            oldSpec = getHotkeySpec(getattr(record, field))  # None for disableOld=True \
+            if oldSpec:
+                put(builtDisables, record.section, oldSpec, record)
+
+    sectionsByKeymap = {}
+    for record in records:
+        sectionsByKeymap.setdefault(record.keymapName, []).append(record.section)
+    allSections = list(dict.fromkeys(record.section for record in records))
+    featuresBuilt = {}
+    features = []  # [(sections, spec, feature item)]
+    for i, (kmName, className, hotkey) in enumerate(featureKeymaps):
+        spec = getHotkeySpec(hotkey)
+        sections = list(dict.fromkeys(sectionsByKeymap.get(kmName, allSections)))
+        item = SimpleNamespace(keymapName=kmName, operatorData=className, order=len(records) + i)
+        for section in sections:
+            put(featuresBuilt, section, spec, item)
+        features.append((sections, spec, item))
+
+    documented, documentedDisables = {}, {}
+    for entry in entries:
+        if entry.section == None or entry.addon in ('b', ' '):
+            continue
+        disablesByOperator = False
+        for spec, mark in zip(entry.hotkeys, entry.marks):
+            if spec and (mark or entry.addon == 'n'):
+                put(documented, entry.section, spec, entry)
+                disablesByOperator = disablesByOperator or any(
+                    record.disableOld is True
+                    for s, record in built.get((entry.section, getSheetSignature(spec)), []))
+        if not disablesByOperator:  # disableOld=True finds old hotkey in Blender, sheet one can't be checked
+            for spec in entry.olds:
+                put(documentedDisables, entry.section, spec, entry)
+        for spec in entry.disables:
+            put(documentedDisables, entry.section, spec, entry)
+
+    def missing(items, others):
+        return [(key[0],) + items[key][0] for key in items if key not in others]
+
+    return SimpleNamespace(
+        notBuilt=missing(documented, {**built, **featuresBuilt}),  # [(section, spec, entry)]
+        notDocumented=missing(built, documented) + [  # [(section, spec, record | feature item)]
+            (sections[0], spec, item) for sections, spec, item in features
+            if not any((section, getSheetSignature(spec)) in documented for section in sections)],
+        disablesNotBuilt=missing(documentedDisables, builtDisables),
+        disablesNotDocumented=missing(builtDisables, documentedDisables),
+        documented=len(documented) + len(documentedDisables),
+        built=len(built) + len(builtDisables) + len(features),
+        seconds=time.perf_counter() - start,
+    )
+
+
+def getHotkeysSheetDriftText(drift):
+    # Not documented hotkeys are in sheet notation, ready to paste
+    lines = ['hotkeys sheet drift: %d documented, %d built: %d not built, %d not documented, '
+             '%d disables not built, %d disables not documented (%.1f ms)' % (
+                 drift.documented, drift.built, len(drift.notBuilt), len(drift.notDocumented),
+                 len(drift.disablesNotBuilt), len(drift.disablesNotDocumented), drift.seconds * 1000)]
+    for title, items in [('not built', drift.notBuilt), ('disables not built', drift.disablesNotBuilt)]:
+        for section, spec, entry in sorted(items, key=lambda item: item[2].line):
+            lines.append('  %s: %s line %d %s: %s' % (
+                title, section, entry.line, entry.label or entry.group, getSheetHotkeyText(spec)))
+    for title, items in [('not documented', drift.notDocumented),
+                         ('disables not documented', drift.disablesNotDocumented)]:
+        for section, spec, record in sorted(items, key=lambda item: item[2].order):
+            idName, properties = parseOperatorData(record.operatorData)
+            lines.append('  %s: %s [%s] %s: %s' % (
+                title, section, record.keymapName, idName, getSheetHotkeyText(spec)))
+    return '\n'.join(lines)
@@ -0,0 +1,120 @@
+import bpy
+from .SugarKit_helpers import *
+
+
+# / Modifier Setups
+
+
+class ModifierSetupAxisBendOperator(bpy.types.Operator):
+    bl_label = "Add Modifier Setup"
+    bl_idname = "object.sk_modifier_setup_axis_bend"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    @classmethod
+    def poll(cls, context):
+        return context.selected_objects
+
+    def execute(self, context):
+        obj = context.active_object
+
+        empty = bpy.data.objects.new(name="_bend_empty", object_data=None)
+        bpy.context.collection.objects.link(empty)
+        empty.parent = obj
+        # Justifies empty's rotation (in ui its done automatically)
+        empty.scale = obj.scale
+
+        modifier = obj.modifiers.new(
+            name="Simple Deform", type='SIMPLE_DEFORM')
+        modifier.deform_method = 'BEND'
+        modifier.origin = empty
+
+        obj.select_set(False)
+        empty.select_set(True)
+        bpy.context.view_layer.objects.active = empty
+
+        return {'FINISHED'}
+
+
+class ModifierSetupRadialArrayOperator(bpy.types.Operator):
+    bl_label = "Add Modifier Setup"
+    bl_idname = "object.sk_setup_radial_array_modifier"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    @classmethod
+    def poll(cls, context):
+        return context.selected_objects
+
+    def execute(self, context):
+        obj = context.active_object
+        applyObjectTransformsWithContext(context, obj, ['scale'])
+
+        empty = bpy.data.objects.new(name="_radial_empty", object_data=None)
+        bpy.context.collection.objects.link(empty)
+        empty.parent = obj
+
+        modifier = obj.modifiers.new(
+            name="Array", type='ARRAY')
+        modifier.use_relative_offset = False
+        modifier.use_object_offset = True
+        modifier.offset_object = empty
+
+        obj.select_set(False)
+        empty.select_set(True)
+        bpy.context.view_layer.objects.active = empty
+
+        return {'FINISHED'}
+
+
+# TODO: 3.2.x
+# SetupGeoNodeModifierOperator [shift alt dbl G]
+# - ask to add geo node (list existing)
+# - add geo node modifier
+
+
+# TODO: 3.2.x
+# SetupCurveArrayModifierOperator [shift alt C A]
+#
+# result object tree:
+# [prototype]
+#   [ curve] - curve the prototype refers to
+#   [curve.001]
+#     [prototype copy]
+#   [curve.002]
+#     [prototype copy]
+#
+# part 1 - process selection:
+# * if many objects selected or curves not selected:
+#   - return
+# * if object not selected:
+#   - sample (select) object
+# * if selected object has a parent with the same object data (has prototype):
+#   - replace selected object with prototype
+# * for each curve do
+#   * if curve is a curve the prototype refers to in array/curve mods
+#       or has a child that refers to it in array/curve mods:
+#     - deselect this curve
+# * if many curves selected:
+#   - join selected curves
+# - separete curve by loose splines
+# - set curve/s parent to prototype object
+#
+# part 2 - iterate curves:
+# * for each curve do
+#   - strip() curve name from spaces
+#   * if prototype doesnt have array/curve mods [!]:
+#     - set prototype as target
+#     - add space char before curve name to uplift it in prototype child list
+#   * elif:
+#     - copy prototype object (with linked data, without array/curve mods)
+#     - set copied object as new target
+#   part 2.1 - position target:
+#   - center target origin and active curve origin
+#   - move target to active curve
+#   - apply target scale and copy rotation from active curve
+#   * if target is not prototype [!]:
+#     - parent target to active curve
+#   part 2.2 - apply mods:
+#   - add array modifier to target: set type to fit curve and curve to the parented curve
+#   - add curve modifier to target: set curve to the parented curve
+#
+# https://blenderartists.org/t/how-to-draw-an-object-selection-eyedropper-in-an-addon/1287437/8?u=nyamba
@@ -0,0 +1,68 @@
+import bpy
+from .SugarKit_helpers import *
+
+
+# / Outliner Select Grouped
+
+
+class OutlinerUnhideAllCollectionsOperator(bpy.types.Operator):
+    bl_label = "Outliner Unhide All Collections"
+    bl_idname = "outliner.sk_outliner_unhide_all_collections"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def execute(self, context):
+        try:
+            collections = context.scene.view_layers[0].layer_collection.children
+        except Exception as er:
+            collections = None
+        if not collections or not len(collections):
+            return {'FINISHED'}
+        for col in collections:
+            col.hide_viewport = False
+        return {'FINISHED'}
+
+
+class OutlinerSelectGroupedOperator(bpy.types.Operator):
+    bl_label = "Outliner Select Grouped"
+    bl_idname = "outliner.sk_outliner_select_grouped"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    @classmethod
+    def poll(cls, context):
+        return context.selected_objects
+
+    def execute(self, context):
+        mode = getObjectModeFromContextMode(context.mode)
+
+        if mode == 'OBJECT':
+            bpy.ops.object.select_grouped(type='COLLECTION')
+        else:
+            bpy.ops.object.mode_set(mode='OBJECT')
+            bpy.ops.object.select_grouped(type='COLLECTION')
+            bpy.ops.object.mode_set(mode=mode)
+
+        return {'FINISHED'}
+
+
+class OutlinerSelectGroupedUnhideOperator(bpy.types.Operator):
+    bl_label = "Outliner Select Grouped Unhide"
+    bl_idname = "outliner.sk_outliner_select_grouped_unhide"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    @classmethod
+    def poll(cls, context):
+        return len(getOutlinerActivatedObjectsFromContext(context))
+
+    def execute(self, context):
+        act = context.active_object
+        group = act.users_collection
+        mode = getObjectModeFromContextMode(context.mode)
+
+        if mode == 'OBJECT':
+            selectUnhideAllInGroup(group)
+        else:
+            bpy.ops.object.mode_set(mode='OBJECT')
+            selectUnhideAllInGroup(group)
+            bpy.ops.object.mode_set(mode=mode)
+
+        return {'FINISHED'}
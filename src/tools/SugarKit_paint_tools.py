@@ -0,0 +1,134 @@
+import bpy
+from .SugarKit_helpers import *
+
+
+# / Paint Tools
+
+
+class PaintGradientSettingsPanelOperator(bpy.types.Operator):
+    bl_label = "Paint Gradient Settings Panel"
+    bl_idname = "paint.sk_paint_gradient_panel"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    @classmethod
+    def poll(cls, context):
+        try:
+            brush = context.scene.tool_settings.image_paint.brush
+        except Exception as er:
+            brush = None
+        return brush
+
+    def execute(self, context):
+        brush = context.scene.tool_settings.image_paint.brush
+        if not brush.color_type == 'GRADIENT':
+            self.report({'INFO'}, "Brush color hasn't set to gradient!")
+            return {'FINISHED'}
+
+        bpy.ops.wm.call_panel(
+            name=PaintGradientSettingsPanel.bl_idname)
+        return {'FINISHED'}
+
+
+class PaintGradientSettingsPanel(bpy.types.Panel):
+    bl_space_type = 'TOPBAR'  # requered panel dummy
+    bl_region_type = 'HEADER'  # requered panel dummy
+    bl_label = "Gradient"
+    bl_idname = "sk_paint_gradient_panel"
+
+    @classmethod
+    def prop_unified(
+        cls,
+        layout,
+        context,
+        brush,
+        prop_name,
+        unified_name=None,
+        pressure_name=None,
+        icon='NONE',
+        text=None,
+        slider=False,
+        header=False,
+    ):
+        """ Generalized way of adding brush options to the UI,
+            along with their pen pressure setting and global toggle, if they exist. """
+        row = layout.row(align=True)
+        ups = context.tool_settings.unified_paint_settings
+        prop_owner = brush
+        if unified_name and getattr(ups, unified_name):
+            prop_owner = ups
+
+        row.prop(prop_owner, prop_name, icon=icon, text=text, slider=slider)
+
+        if pressure_name:
+            row.prop(brush, pressure_name, text="")
+
+        if unified_name and not header:
+            # NOTE: We don't draw UnifiedPaintSettings in the header to reduce clutter. D5928#136281
+            row.prop(ups, unified_name, text="", icon='BRUSHES_ALL')
+
+        return row
+
+    def draw(self, context):
+        layout = self.layout
+        brush = context.scene.tool_settings.image_paint.brush
+
+        layout.template_color_ramp(brush, "gradient", expand=True)
+
+        layout.use_property_split = True
+
+        col = layout.column()
+
+        if brush.image_tool == 'DRAW':
+            self.prop_unified(
+                col,
+                context,
+                brush,
+                "secondary_color",
+                unified_name="use_unified_color",
+                text="Background Color",
+                header=True,
+            )
+
+            col.prop(brush, "gradient_stroke_mode", text="Gradient Mapping")
+
+            if brush.gradient_stroke_mode in {'SPACING_REPEAT', 'SPACING_CLAMP'}:
+                col.prop(brush, "grad_spacing")
+
+
+class PaintColorPalettePanelOperator(bpy.types.Operator):
+    bl_label = "Paint Color Palette Panel"
+    bl_idname = "paint.sk_paint_color_palette_panel"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def execute(self, context):
+        bpy.ops.wm.call_panel(
+            name=PaintColorPalettePanel.bl_idname)
+        return {'FINISHED'}
+
+
+class PaintColorPalettePanel(bpy.types.Panel):
+    bl_space_type = 'TOPBAR'  # requered panel dummy
+    bl_region_type = 'HEADER'  # requered panel dummy
+    bl_label = "Color Palette"
+    bl_idname = "sk_paint_color_palette_panel"
+    bl_ui_units_x = 10  # width
+
+    def draw(self, context):
+        layout = self.layout
+        layout.use_property_split = True
+        layout.use_property_decorate = False
+
+        paint = context.scene.tool_settings.vertex_paint if (
+            'VERTEX' in context.mode) else context.scene.tool_settings.image_paint
+        uniPaint = context.scene.tool_settings.unified_paint_settings
+        paintBrush = uniPaint if uniPaint.use_unified_color else paint.brush
+
+        if context.object:
+            sub_row = layout.row(align=True)
+            sub_row.prop(paintBrush, "color", text="")
+
+            row = layout.row(align=True)
+            row.template_ID(paint, "palette", new="palette.new")
+
+            if paint.palette:
+                layout.template_palette(paint, "palette", color=True)
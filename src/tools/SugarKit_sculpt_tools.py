@@ -0,0 +1,55 @@
+import bpy
+from .SugarKit_helpers import *
+
+
+# / Sculpt Tools
+
+
+class SculptDrawCurveOperator(bpy.types.Operator):
+    bl_label = "Sculpt Quick Draw Curve"
+    bl_idname = "sculpt.sk_sculpt_draw_curve"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    @classmethod
+    def poll(cls, context):
+        return context.active_object
+
+    def invoke(self, context, event):
+        context.tool_settings.curve_paint_settings.curve_type = 'BEZIER'
+        context.tool_settings.curve_paint_settings.depth_mode = 'SURFACE'
+        return self.execute(context)
+
+    def execute(self, context):
+        act = context.active_object
+        drawCurve = createCurveAndEditInContext(context, 'DrawCurve')
+        drawCurve.data.bevel_depth = 0.01
+        drawCurve.data.use_fill_caps = True
+        # TODO: put the same collection as parent
+        drawCurve.parent = act
+        return {'FINISHED'}
+
+
+class SculptSymmetrizeWeldPanelOperator(bpy.types.Operator):
+    bl_label = "Sculpt Symmetrize Weld Panel"
+    bl_idname = "paint.sk_sculpt_symmetrize_weld_panel"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def execute(self, context):
+        bpy.ops.wm.call_panel(
+            name=SculptSymmetrizeWeldPanel.bl_idname, keep_open=True)
+        return {'FINISHED'}
+
+
+class SculptSymmetrizeWeldPanel(bpy.types.Panel):
+    bl_space_type = 'TOPBAR'  # requered panel dummy
+    bl_region_type = 'HEADER'  # requered panel dummy
+    bl_label = "Symmetrize Weld"
+    bl_idname = "sk_sculpt_symmetrize_weld_panel"
+
+    def draw(self, context):
+        layout = self.layout
+        sculpt = context.tool_settings.sculpt
+        layout.prop(sculpt, "symmetrize_direction")
+        # When active_default=true, an operator button defined after this will be activated when pressing return
+        layout.active_default = True
+        layout.operator("sculpt.symmetrize")
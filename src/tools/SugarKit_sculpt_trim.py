@@ -0,0 +1,543 @@
+import bpy
+from bpy.app.handlers import persistent
+import math
+from .SugarKit_helpers import *
+from .SugarKit import glob, getSpaceUnderMouseFromContext
+
+
+# / Sculpt Trim Curve
+
+
+# TODO: 3.2.x Make modal keys setable from keymap settings
+class SculptTrimCurveModalOperator(bpy.types.Operator):
+    thanks = [
+        'https://blenderartists.org/t/how-can-i-ask-the-user-to-draw-a-curve/1462361',
+        'https://blenderartists.org/t/using-grease-pencil-annotation-from-modal-in-blender-2-8/1203973',
+        "https://www.youtube.com/watch?v=3C6wVPVrPtM",
+    ]
+    bl_idname = "sculpt.sk_trim_curve_modal"
+    bl_label = "Sculpt Trim Curve Modal"
+    bl_options = {"REGISTER", "UNDO"}
+
+    DRAW_HEADER_TEXT = "Trim Curve Innards (Draw)"
+    DRAW_STATUS_TEXT = """
+      Cancel: Esc | 
+      Pass: Ent/Space | 
+      Draw: LM
+    """
+    HEADER_TEXT = "Trim Curve Innards"
+    EXTERIOR_HEADER_TEXT = "Trim Curve Exterior"
+    STATUS_TEXT = """
+      Cancel: Esc | 
+      Confirm: Ent/Space | 
+      Close: Shift+Ctrl+LM | 
+      Select: LM | 
+      Extend: Shift+LM | 
+      Extrude: Dbl-LM/E | 
+      Insert/Delete: Alt+LM | 
+      Dissolve: Ctrl+X | 
+      Move/Scale/Rotate: RM/Shift+RM/Alt+RM | 
+      Innards/Exterior: T | 
+      Cyclic: Shift+C | 
+      Smooth: Shift+Alt+S | 
+      Whole: Dbl+Shift | 
+      Align/Free: Dbl+Ctrl | 
+      Auto/Vector: Dbl+Alt/Ctrl+Dbl+Alt | 
+      Recalc: Shift+R | 
+      All: A | 
+      Invert: Alt+A | 
+      Transform: S/D/R | 
+      Prop-editing: P | 
+      Focus: F | 
+      Redo: Shift+Ctrl+Z | 
+      Undo: Ctrl+Z
+    """
+
+    # Modal state, set in initProps(). Plain attributes: operator is registered as a SugarKit_features stub
+    view3dSpace = None
+    initIsOrthographic = False
+    isFinish = False
+    isDraw = False
+    isExterior = False
+    initWorkSpace = None
+    targetObj = None
+    trimCurve = None
+
+    disabledDrawKeymapItemsIds = []
+    disabledPenKeymapItemsIds = []
+    hasUnabledBackDrawKeymapItems = False
+    hasUnabledBackPenKeymapItems = False
+
+    historySteps = 0
+    dbl = {}
+
+    @classmethod
+    def poll(cls, context):
+        return context.active_object
+
+    def invoke(self, context, event):
+        self.initProps(self, context, event)
+        self.mapModalToolKeys(self, context, True)
+
+        context.window_manager.modal_handler_add(self)  # required for modal
+
+        setModalTextInContext(
+            context, self.DRAW_HEADER_TEXT, self.DRAW_STATUS_TEXT)
+
+        context.tool_settings.curve_paint_settings.curve_type = 'BEZIER'
+        context.tool_settings.curve_paint_settings.depth_mode = 'CURSOR'
+        context.tool_settings.use_proportional_edit = False
+
+        return {'RUNNING_MODAL'}
+
+    @classmethod
+    def initProps(cls, self, context, event):
+        self.view3dSpace = getSpaceUnderMouseFromContext(context, event)
+        self.initIsOrthographic = self.view3dSpace.region_3d.is_orthographic_side_view
+        self.isFinish = False
+        self.isDraw = True
+        self.isExterior = False
+        self.initWorkSpace = findBpyObjectByName(
+            context.window.workspace.name, bpy.data.workspaces)
+        self.targetObj = findBpyObjectByName(context.active_object.name)
+        self.trimCurve = createCurveAndEditInContext(
+            context, 'TrimCurve', inFront=True)
+        self.trimCurve.parent = self.targetObj
+
+    @classmethod
+    def mapModalToolKeys(cls, self, context, isSet):
+        drawKeymap = getKeymapFromContext(
+            context, '3D View Tool: Edit Curve, Draw', 'user')
+        penKeymap = getKeymapFromContext(
+            context, '3D View Tool: Edit Curve, Curve Pen', 'user')
+
+        if isSet:
+            # Disable old
+            self.disabledDrawKeymapItemsIds = disableActiveKeymapItems(
+                drawKeymap)
+            self.disabledPenKeymapItemsIds = disableActiveKeymapItems(
+                penKeymap)
+            # Append new
+            self.appendModalToolKeys(drawKeymap, penKeymap)
+        else:
+            # Remove new
+            if not self.hasUnabledBackDrawKeymapItems:
+                removeActiveKeymapItems(drawKeymap)
+                self.hasUnabledBackDrawKeymapItems = True
+            if not self.hasUnabledBackPenKeymapItems:
+                removeActiveKeymapItems(penKeymap)
+                self.hasUnabledBackPenKeymapItems = True
+            # Unable old
+            unableDisabledKeymapItems(
+                drawKeymap, self.disabledDrawKeymapItemsIds)
+            unableDisabledKeymapItems(
+                penKeymap, self.disabledPenKeymapItemsIds)
+
+    @classmethod
+    def appendModalToolKeys(cls, drawKeymap, penKeymap):
+        if drawKeymap and drawKeymap.keymap_items:
+            # Draw
+            kmiDrawDraw = drawKeymap.keymap_items.new(
+                'curve.draw', 'LEFTMOUSE', 'PRESS')
+            kmiDrawDraw.properties['wait_for_input'] = False
+
+        if penKeymap and penKeymap.keymap_items:
+            # Extend
+            kmiPenExtend = penKeymap.keymap_items.new(
+                'curve.pen', 'LEFTMOUSE', 'PRESS', shift=True)
+            kmiPenExtend.properties['extend'] = True
+            # Select
+            kmiPenSelect = penKeymap.keymap_items.new(
+                'curve.pen', 'LEFTMOUSE', 'PRESS')
+            kmiPenSelect.properties['select_point'] = True
+            # Quick extrude
+            kmiPenExtrude = penKeymap.keymap_items.new(
+                'curve.pen', 'LEFTMOUSE', 'DOUBLE_CLICK')
+            kmiPenExtrude.properties['extrude_point'] = True
+            # Close
+            kmiPenClose = penKeymap.keymap_items.new(
+                'curve.pen', 'LEFTMOUSE', 'PRESS', shift=True, ctrl=True)
+            kmiPenClose.properties['close_spline'] = True
+            kmiPenClose.properties['close_spline_method'] = 1
+            # Insert/delete
+            kmiPenInsertDelete = penKeymap.keymap_items.new(
+                'curve.pen', 'LEFTMOUSE', 'PRESS', alt=True)
+            kmiPenInsertDelete.properties['insert_point'] = True
+            kmiPenInsertDelete.properties['delete_point'] = True
+            # Quick move/rotate/scale
+            kmiPenDrag = penKeymap.keymap_items.new(
+                'transform.translate', 'RIGHTMOUSE', 'CLICK_DRAG')
+            kmiPenDrag.properties['use_snap_self'] = True
+            kmiPenDrag.properties['use_snap_edit'] = True
+            kmiPenDrag.properties['use_snap_nonedit'] = True
+            kmiPenDrag = penKeymap.keymap_items.new(
+                'transform.rotate', 'RIGHTMOUSE', 'CLICK_DRAG', shift=True)
+            kmiPenDrag = penKeymap.keymap_items.new(
+                'transform.resize', 'RIGHTMOUSE', 'CLICK_DRAG', alt=True)
+
+    def modal(self, context, event):
+        # C(event.type, ": ", event.value)
+        try:
+            global glob
+            isPen = not self.isDraw
+
+            # / FINISHED
+            if self.isFinish and not event.type == 'ESC':
+                if not glob.trimCurveResolution:
+                    if event.value == 'RELEASE':
+                        self.isFinish = False
+                        return {'RUNNING_MODAL'}
+                    else:
+                        return {'PASS_THROUGH'}
+                else:
+                    return self.finish(self, context, glob.trimCurveResolution)
+            elif event.type in ['RET', 'SPACE']:
+                if isPen:
+                    bpy.ops.curve.sk_curve_resolution_dialog('INVOKE_DEFAULT')
+                    self.isFinish = True
+                    return {'RUNNING_MODAL'}
+                else:
+                    setModalTextInContext(
+                        context, self.HEADER_TEXT, self.STATUS_TEXT)
+                    bpy.ops.wm.tool_set_by_id(name='builtin.pen')
+                    self.isDraw = False
+                    return {'PASS_THROUGH'}
+
+            # / CANCELLED
+            elif event.type == 'ESC' and event.value == 'PRESS':
+                setActiveObjectInContext(
+                    context, self.targetObj, delPrev=True, mode='SCULPT')
+                setModalTextInContext(context, None)
+                self.mapModalToolKeys(self, context, False)
+                return {'CANCELLED'}
+            # Workspace has changed
+            elif event.value == 'PRESS' and self.initWorkSpace.name != context.window.workspace.name:
+                setModalTextInContext(context, None)
+                self.mapModalToolKeys(self, context, False)
+                return {'CANCELLED'}
+            # Tool has changed from ui
+            elif (self.isDraw and glob.workspaceActiveToolName != 'builtin.draw') or (isPen and glob.workspaceActiveToolName != 'builtin.pen'):
+                setModalTextInContext(context, None)
+                self.mapModalToolKeys(self, context, False)
+                return {'CANCELLED'}
+
+            # / PASSED DRAW OPS
+            # Start
+            elif self.isDraw and event.type == 'LEFTMOUSE':
+                return {'PASS_THROUGH'}
+            # End
+            elif self.isDraw and len(getCurvePointsAll(context.active_object)):
+                setModalTextInContext(
+                    context, self.HEADER_TEXT, self.STATUS_TEXT)
+                bpy.ops.wm.tool_set_by_id(name='builtin.pen')
+                self.isDraw = False
+                return {'PASS_THROUGH'}
+
+            # / PASSED PEN OPS
+            # Close
+            elif isPen and event.type == 'LEFTMOUSE' and event.shift and event.ctrl:
+                self.historySteps += 1
+                return {'PASS_THROUGH'}
+            # Extend
+            elif isPen and event.type == 'LEFTMOUSE' and event.shift:
+                self.historySteps += 1
+                return {'PASS_THROUGH'}
+            # Select
+            elif isPen and event.type == 'LEFTMOUSE' and not self.dbl.get('LEFTMOUSE'):
+                self.historySteps += 1
+                self.dbl['LEFTMOUSE'] = addTimerForContext(context)
+                return {'PASS_THROUGH'}
+            # Extrude
+            elif isPen and event.type == 'LEFTMOUSE' and self.dbl.get('LEFTMOUSE'):
+                # Add point only to existing spline
+                curve = context.active_object
+                actPoint = getCurveActivePoint(curve)
+                points = curve.data.splines[0].bezier_points
+                if not actPoint or actPoint != points[0]:
+                    curve.data.splines[0].bezier_points[len(
+                        points) - 1].select_control_point = True
+
+                self.dbl['LEFTMOUSE'] = removeTimerFromContext(
+                    context, self.dbl.get('LEFTMOUSE'))
+                return {'PASS_THROUGH'}
+            # Insert/delete
+            elif isPen and event.type == 'LEFTMOUSE' and event.alt:
+                self.historySteps += 1
+                return {'PASS_THROUGH'}
+            # Quick move/rotate/scale
+            elif isPen and event.type == 'RIGHTMOUSE' and event.value not in ['RELEASE', 'CLICK']:
+                return {'PASS_THROUGH'}
+
+            # / RUNNING PEN OPS
+            # Toggle innards/exterior
+            elif isPen and event.type == 'T' and event.value == 'PRESS':
+                self.isExterior = not self.isExterior
+                setModalTextInContext(
+                    context, self.HEADER_TEXT if not self.isExterior else self.EXTERIOR_HEADER_TEXT, self.STATUS_TEXT)
+                return {'RUNNING_MODAL'}
+            # Dissolve
+            elif isPen and event.type == 'X' and event.ctrl and event.value == 'PRESS':
+                self.historySteps += 1
+                bpy.ops.curve.dissolve_verts()
+                return {'RUNNING_MODAL'}
+            # Curve cyclic (close)
+            elif isPen and event.type == 'C' and event.shift and event.value == 'PRESS':
+                bpy.ops.curve.cyclic_toggle()
+                return {'RUNNING_MODAL'}
+            # Curve smooth
+            elif isPen and event.type == 'S' and event.shift and event.alt and event.value == 'PRESS':
+                self.historySteps += 1
+                bpy.ops.curve.smooth()
+                return {'RUNNING_MODAL'}
+            # Extrude
+            elif isPen and event.type == 'E' and event.value == 'PRESS':
+                bpy.ops.curve.extrude_move('INVOKE_DEFAULT')
+                return {'RUNNING_MODAL'}
+            # Select whole handle
+            elif isPen and event.type in ['LEFT_SHIFT'] and event.value == 'PRESS' and not self.dbl.get('SHIFT'):
+                self.dbl['SHIFT'] = addTimerForContext(context)
+                return {'PASS_THROUGH'}
+            elif isPen and event.type in ['LEFT_SHIFT'] and event.value == 'PRESS' and self.dbl.get('SHIFT'):
+                actPoint = getCurveActivePoint(context.active_object, True)
+                selectWholeBezierPoint(actPoint)
+
+                self.dbl['SHIFT'] = removeTimerFromContext(
+                    context, self.dbl.get('SHIFT'))
+                return {'RUNNING_MODAL'}
+            # Handlers type aligned/free, auto, vector
+            elif isPen and event.type in ['LEFT_CTRL'] and event.value == 'PRESS' and not self.dbl.get('CTRL'):
+                self.dbl['CTRL'] = addTimerForContext(context)
+                return {'PASS_THROUGH'}
+            elif isPen and event.type in ['LEFT_CTRL'] and event.value == 'PRESS' and self.dbl.get('CTRL'):
+                actPoint = getCurveActivePoint(context.active_object)
+                if actPoint and actPoint.handle_left_type in ['FREE', 'VECTOR']:
+                    bpy.ops.curve.handle_type_set(type='ALIGNED')
+                else:
+                    bpy.ops.curve.handle_type_set(type='FREE_ALIGN')
+                self.dbl['CTRL'] = removeTimerFromContext(
+                    context, self.dbl.get('CTRL'))
+                return {'RUNNING_MODAL'}
+            elif isPen and event.type in ['LEFT_ALT'] and not event.ctrl and event.value == 'PRESS' and not self.dbl.get('ALT'):
+                self.dbl['ALT'] = addTimerForContext(context)
+                return {'PASS_THROUGH'}
+            elif isPen and event.type in ['LEFT_ALT'] and not event.ctrl and event.value == 'PRESS' and self.dbl.get('ALT'):
+                bpy.ops.curve.handle_type_set(type='AUTOMATIC')
+                self.dbl['ALT'] = removeTimerFromContext(
+                    context, self.dbl.get('ALT'))
+                return {'RUNNING_MODAL'}
+            elif isPen and event.type in ['LEFT_ALT'] and event.ctrl and event.value == 'PRESS' and not self.dbl.get('ALT'):
+                self.dbl['LEFT_ALT'] = addTimerForContext(context)
+                return {'PASS_THROUGH'}
+            elif isPen and event.type in ['LEFT_ALT'] and event.ctrl and event.value == 'PRESS' and self.dbl.get('ALT'):
+                bpy.ops.curve.handle_type_set(type='VECTOR')
+                self.dbl['ALT'] = removeTimerFromContext(
+                    context, self.dbl.get('ALT'))
+                return {'RUNNING_MODAL'}
+            # Handlers recalc
+            elif isPen and event.type == 'R' and event.shift and event.value == 'PRESS':
+                bpy.ops.curve.normals_make_consistent()
+                return {'RUNNING_MODAL'}
+            # All de/select, invert
+            elif isPen and event.type == 'A' and event.value == 'PRESS':
+                if getCurveActivePoint(context.active_object):
+                    bpy.ops.curve.select_all(action='DESELECT')
+                else:
+                    bpy.ops.curve.select_all(action='SELECT')
+                return {'RUNNING_MODAL'}
+            elif isPen and event.type == 'A' and event.alt and event.value == 'PRESS':
+                bpy.ops.curve.select_all(action='INVERT')
+                return {'RUNNING_MODAL'}
+            # Scale, move, rotate
+            elif isPen and event.type == 'S' and event.value == 'PRESS':
+                bpy.ops.transform.resize('INVOKE_DEFAULT')
+                return {'RUNNING_MODAL'}
+            elif isPen and event.type == 'D' and event.value == 'PRESS':
+                bpy.ops.transform.translate('INVOKE_DEFAULT')
+                return {'RUNNING_MODAL'}
+            elif isPen and event.type == 'R' and event.value == 'PRESS':
+                bpy.ops.transform.rotate('INVOKE_DEFAULT')
+                return {'RUNNING_MODAL'}
+            # Prop-editing
+            elif isPen and event.type == 'P' and event.value == 'PRESS':
+                context.tool_settings.use_proportional_edit = not context.tool_settings.use_proportional_edit
+                return {'RUNNING_MODAL'}
+            # Focus
+            elif isPen and event.type == 'F' and event.value == 'PRESS':
+                bpy.ops.view3d.view_selected(use_all_regions=False)
+                return {'RUNNING_MODAL'}
+            # Redo/undo
+            elif isPen and event.type == 'Z' and event.shift and event.ctrl and event.value == 'PRESS':
+                try:
+                    bpy.ops.ed.redo()
+                    self.historySteps += 1
+                except Exception as er:
+                    pass
+                return {'RUNNING_MODAL'}
+            elif isPen and event.type == 'Z' and event.ctrl and event.value == 'PRESS' and self.historySteps > 0:
+                self.historySteps -= 1
+                bpy.ops.ed.undo()
+                return {'RUNNING_MODAL'}
+
+            # / RUNNING BLOCKED OPS
+            # Remove timers
+            if event.type == 'TIMER':
+                for key in self.dbl.keys():
+                    self.dbl[key] = removeTimerFromContext(
+                        context, self.dbl.get(key))
+                return {'RUNNING_MODAL'}
+            # Restore modal text after other modal commands
+            elif event.type in ['NONE', 'INBETWEEN_MOUSEMOVE']:
+                if self.isDraw:
+                    setModalTextInContext(
+                        context, self.DRAW_HEADER_TEXT, self.DRAW_STATUS_TEXT)
+                else:
+                    setModalTextInContext(
+                        context, self.HEADER_TEXT if not self.isExterior else self.EXTERIOR_HEADER_TEXT, self.STATUS_TEXT)
+                return {'RUNNING_MODAL'}
+            # Block viewport and other unconditioned commands
+            elif (
+                event.type == 'MOUSEROTATE'
+                or (event.type == 'MIDDLEMOUSE' and not event.shift and not event.ctrl)
+                or (event.type == 'TRACKPADPAN' and not event.shift and not event.ctrl)
+                or event.value in ['PRESS', 'RELEASE', 'CLICK']
+            ):
+                # Fixes ortograthic view bug
+                if self.initIsOrthographic and self.initIsOrthographic != self.view3dSpace.region_3d.is_orthographic_side_view:
+                    bpy.ops.view3d.view_persportho()
+                    self.view3dSpace.region_3d.is_orthographic_side_view = self.initIsOrthographic
+                return {'RUNNING_MODAL'}
+
+            return {'PASS_THROUGH'}
+        except Exception as er:
+            self.report({'ERROR'}, "{0}".format(er))
+            setModalTextInContext(context, None)
+            self.mapModalToolKeys(self, context, False)
+            return {'CANCELLED'}
+
+    @classmethod
+    def finish(cls, self, context, trimCurveResolution):
+        viewport = self.view3dSpace.region_3d
+        # Close and convert to mesh
+        setCurveCyclic(self.trimCurve, True)
+        self.trimCurve.data.resolution_u = trimCurveResolution
+        bpy.ops.object.mode_set(mode="OBJECT")
+        bpy.ops.object.convert(target='MESH')
+        bpy.ops.object.origin_set(
+            type='ORIGIN_CENTER_OF_VOLUME', center='MEDIAN')
+        # Fill mesh
+        bpy.ops.object.editmode_toggle()
+        bpy.ops.mesh.select_all(action='SELECT')
+        bpy.ops.mesh.edge_face_add()
+        bpy.ops.object.editmode_toggle()
+        # Add solidify modifier
+        mod_solidify = self.trimCurve.modifiers.new(
+            'TrimSolidify' + str(id(self.trimCurve)), 'SOLIDIFY')
+        mod_solidify.thickness = math.ceil(viewport.view_distance * 2)
+        mod_solidify.offset = 0.0
+        # Add bool modifier
+        mod_bool = self.targetObj.modifiers.new(
+            'TrimBool' + str(id(self.targetObj)), 'BOOLEAN')
+        moveObjectModifierAtTheEnd(self.targetObj, mod_bool)
+        mod_bool.operation = 'DIFFERENCE' if not self.isExterior else 'INTERSECT'
+        mod_bool.object = self.trimCurve
+        mod_bool.use_hole_tolerant = True
+        # Apply modifier
+        setActiveObjectInContext(context, self.targetObj)
+        bpy.ops.object.modifier_apply(
+            modifier=mod_bool.name)  # for active object
+        setActiveObjectInContext(context, self.trimCurve)
+        # Restore context
+        setActiveObjectInContext(
+            context, self.targetObj, delPrev=True, mode='SCULPT')
+        setModalTextInContext(context, None)
+        self.mapModalToolKeys(self, context, False)
+        return {'FINISHED'}
+
+
+glob.workspaceActiveToolName = ''
+glob.prevWorkspace = None
+glob.actWorkspace = None
+
+
+glob.workSpaceOwner = None
+glob.resubscribeWorkSpace = None
+
+
+def SubscribeWorkSpace(isRegister=True):
+    if not isRegister:
+        if glob.workSpaceOwner != None:
+            bpy.msgbus.clear_by_owner(glob.workSpaceOwner)
+        if glob.resubscribeWorkSpace in bpy.app.handlers.load_post:
+            bpy.app.handlers.load_post.remove(glob.resubscribeWorkSpace)
+        glob.workSpaceOwner = None
+        glob.resubscribeWorkSpace = None
+        return
+
+    workSpaceOwner = object()
+
+    def handleWorkSpaceChange():
+        global glob
+
+        try:
+            glob.workspaceActiveToolName = bpy.context.workspace.tools.from_space_view3d_mode(
+                bpy.context.mode, create=False).idname
+        except Exception as er:
+            glob.workspaceActiveToolName = ''
+        try:
+            glob.prevWorkspace = findBpyObjectByName(
+                glob.actWorkspace.name, bpy.data.workspaces)
+        except Exception as er:
+            glob.prevWorkspace = None
+        try:
+            glob.actWorkspace = findBpyObjectByName(
+                bpy.context.workspace.name, bpy.data.workspaces)
+        except Exception as er:
+            glob.actWorkspace = None
+        # Reset status text on checkout (clears unfinished modal text)
+        try:
+            if glob.prevWorkspace.name != glob.actWorkspace.name:
+                bpy.context.workspace.status_text_set(None)
+        except Exception as er:
+            pass
+
+    def subscribeWorkSpace():
+        subscribeTo = (bpy.types.WorkSpace, 'tools')
+        bpy.msgbus.subscribe_rna(
+            key=subscribeTo,
+            owner=workSpaceOwner,
+            args=(),
+            notify=handleWorkSpaceChange,
+            options={'PERSISTENT'}
+        )
+
+    @persistent
+    def resubscribeWorkSpace(dummy):
+        subscribeWorkSpace()
+
+    subscribeWorkSpace()
+    bpy.app.handlers.load_post.append(resubscribeWorkSpace)
+    glob.workSpaceOwner = workSpaceOwner
+    glob.resubscribeWorkSpace = resubscribeWorkSpace
+
+
+glob.trimCurveResolution = 0
+
+
+class SculptTrimCurveResolutionDialogOperator(bpy.types.Operator):
+    bl_label = "Set Trim Curve"
+    bl_idname = "curve.sk_curve_resolution_dialog"
+
+    # use colon for display prop in dialog
+    resolution: bpy.props.IntProperty(
+        name='Resolution', default=16, min=1, max=2047)
+
+    def invoke(self, context, event):
+        global glob
+        glob.trimCurveResolution = 0
+        # required for dialog
+        return context.window_manager.invoke_props_dialog(self, width=150)
+
+    def execute(self, context):
+        global glob
+        glob.trimCurveResolution = self.resolution
+        return {'FINISHED'}
@@ -0,0 +1,112 @@
+import bpy
+from .SugarKit_helpers import *
+
+
+# / Vertex Groups
+
+
+def VertexGroupProps(isRegister):
+    def handleActiveVertGroupNameUpdate(self, context):
+        self.vertex_groups.active.name = self.sk_active_vert_group_name
+
+    if isRegister:
+        bpy.types.Object.sk_active_vert_group_name = bpy.props.StringProperty(
+            name="", update=handleActiveVertGroupNameUpdate)
+    else:
+        del bpy.types.Object.sk_active_vert_group_name
+
+
+class VertexGroupRenamePanelOperator(bpy.types.Operator):
+    bl_label = "Vertex Group Rename"
+    bl_idname = "mesh.sk_vertex_group_rename"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    @classmethod
+    def poll(cls, context):
+        try:
+            actObjVertGroup = context.active_object.vertex_groups.active
+        except Exception as er:
+            actObjVertGroup = None
+        return actObjVertGroup
+
+    def execute(self, context):
+        vertGroupName = context.active_object.vertex_groups.active.name
+        context.active_object.sk_active_vert_group_name = vertGroupName
+
+        bpy.ops.wm.call_panel(
+            name=VertexGroupRenamePanel.bl_idname, keep_open=False)
+        return {'FINISHED'}
+
+
+def row_with_icon(layout, icon):
+    row = layout.row()
+    row.activate_init = True
+    row.label(icon=icon)
+    return row
+
+
+class VertexGroupRenamePanel(bpy.types.Panel):
+    bl_space_type = 'TOPBAR'  # requered panel dummy
+    bl_region_type = 'HEADER'  # requered panel dummy
+    bl_label = "Rename Active Vertex Group"
+    bl_idname = 'TOPBAR_PT_name_active_vertex_group'
+    bl_ui_units_x = 14
+
+    def draw(self, context):
+        found = False
+
+        if context.mode == 'EDIT_MESH':
+            self.layout.label(text="Vertex Group Name")
+            target = context.active_object
+            if target:
+                row = row_with_icon(self.layout, 'MESH_DATA')
+                row.prop(target, "sk_active_vert_group_name", text="")
+                found = True
+
+        if not found:
+            row = row_with_icon(self.layout, 'ERROR')
+            row.label(text="No active vertex group")
+
+
+class VertexGroupToSculptFaceSetOperator(bpy.types.Operator):
+    bl_label = "Vertex Group To Sculpt Face Set"
+    bl_idname = "paint.sk_vertex_group_to_sculpt_face_set"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    @classmethod
+    def poll(cls, context):
+        try:
+            actObjVertGroup = context.active_object.vertex_groups.active
+        except Exception as er:
+            actObjVertGroup = None
+        return actObjVertGroup
+
+    def execute(self, context):
+        mode = getObjectModeFromContextMode(context.mode)
+        bpy.ops.object.mode_set(mode='EDIT')
+        bpy.ops.mesh.select_all(action='DESELECT')
+        bpy.ops.object.vertex_group_select()
+        bpy.ops.object.mode_set(mode=mode)
+        bpy.ops.sculpt.face_sets_create(mode='SELECTION')
+        return {'FINISHED'}
+
+
+class VertexGroupToPaintSelectMaskOperator(bpy.types.Operator):
+    bl_label = "Vertex Group To Paint Select Mask"
+    bl_idname = "paint.sk_vertex_group_to_paint_select_mask"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    @classmethod
+    def poll(cls, context):
+        try:
+            actObjVertGroup = context.active_object.vertex_groups.active
+        except Exception as er:
+            actObjVertGroup = None
+        return actObjVertGroup
+
+    def execute(self, context):
+        mode = getObjectModeFromContextMode(context.mode)
+        bpy.ops.object.mode_set(mode='EDIT')
+        bpy.ops.object.vertex_group_select()
+        bpy.ops.object.mode_set(mode=mode)
+        return {'FINISHED'}
@@ -0,0 +1,395 @@
+import bpy
+from bpy.app.handlers import persistent
+from types import SimpleNamespace
+from .SugarKit_helpers import *
+from .SugarKit import glob, updateGlobalEvent, getSpaceUnderMouseFromContext
+
+
+# / Object Viewport Alpha/Color
+
+
+class ObjectViewportAlphaToggleOperator(bpy.types.Operator):
+    """Toggle object's viewport display color alpha."""
+    bl_label = "Toggle Opacity"
+    bl_idname = "object.sk_object_toggle_viewport_alpha"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    @classmethod
+    def poll(cls, context):
+        return context.selected_objects and len(context.selected_objects)
+
+    def execute(self, context):
+        ensureActMatForActObjectInContext(context)
+
+        actObjActMat = context.active_object.active_material
+        r, g, b, alpha = actObjActMat.diffuse_color
+
+        for obj in context.selected_objects:
+            # Set object materials viewport alpha
+            if not obj.material_slots or not len(obj.material_slots):
+                appendNewActMatToObject(
+                    obj, (1.0, 1.0, 1.0, 0.3 if alpha == 1.0 else 1.0))
+            else:
+                for ms in obj.material_slots:
+                    mat = ms.material
+                    mR, mG, mB, mA = mat.diffuse_color
+                    mat.diffuse_color = (
+                        mR, mG, mB, 0.3 if alpha == 1.0 else 1.0)
+            # Set object viewport alpha
+            if not hasattr(obj, 'color') or not obj.color:
+                setattr(obj, 'color', (
+                    1.0, 1.0, 1.0, 0.3 if alpha == 1.0 else 1.0))
+            else:
+                oR, oG, oB, oA = obj.color
+                obj.color = (
+                    oR, oG, oB, 0.3 if alpha == 1.0 else 1.0)
+
+        return {'FINISHED'}
+
+
+class ObjectViewportColorSetPanelOperator(bpy.types.Operator):
+    # This operator inits values for ObjectViewportColorSetPanel
+    """Set object's active material viewport display color."""
+    bl_label = "Set Viewport Color"
+    bl_idname = "object.sk_active_material_viewport_color_panel"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    select_with_same_mat: bpy.props.BoolProperty(
+        name='Select Other', description='Select other with same material', default=False)
+
+    @classmethod
+    def poll(cls, context):
+        return context.selected_objects
+
+    def invoke(self, context, event):
+        # Panel's Brush.color notifications read mouse tracked here
+        updateGlobalEvent(event)
+        return self.execute(context)
+
+    def execute(self, context):
+        ensureActMatForActObjectInContext(context)
+
+        mR, mG, mB, mA = context.active_object.active_material.diffuse_color
+
+        # Init panel picker with mat color
+        context.scene.tool_settings.gpencil_paint.brush.color = (mR, mG, mB)
+
+        try:
+            paletteColors = context.scene.tool_settings.gpencil_paint.palette.colors
+        except Exception as er:
+            paletteColors = None
+
+        # Init/unset panel palette with mat color
+        if (paletteColors):
+            unsetActive = True
+            for paletteColor in paletteColors:
+                pcR, pcG, pcB = paletteColor.color
+                if (pcR == mR and pcG == mG and pcB == mB):
+                    unsetActive = False
+                    paletteColors.active = paletteColor
+            if (unsetActive):
+                paletteColors.active = None
+
+        # Select only objects with active material
+        if self.select_with_same_mat:
+            bpy.ops.object.select_linked(extend=False, type='MATERIAL')
+
+        # Activate unified color to fix layout.template_palette color add
+        context.scene.tool_settings.unified_paint_settings.use_unified_color = True
+
+        bpy.ops.wm.call_panel(
+            name=ObjectViewportColorSetPanel.bl_idname)
+
+        return {'FINISHED'}
+
+
+class ObjectViewportColorSetPanel(bpy.types.Panel):
+    # This panel's changes trigger SubscribeBrushColor
+    bl_space_type = 'TOPBAR'  # requered panel dummy
+    bl_region_type = 'HEADER'  # requered panel dummy
+    bl_label = "Set Viewport Color"
+    bl_idname = "sk_active_material_viewport_color_panel"
+    bl_ui_units_x = 10  # width
+
+    def draw(self, context):
+        layout = self.layout
+        layout.use_property_split = True
+        layout.use_property_decorate = False
+
+        paint = context.scene.tool_settings.gpencil_paint
+
+        if context.object:
+            col = layout.column()
+            col.template_color_picker(paint.brush, "color", value_slider=True)
+
+            sub_row = layout.row(align=True)
+            sub_row.prop(paint.brush, "color", text="")
+
+            row = layout.row(align=True)
+            row.template_ID(paint, "palette", new="palette.new")
+
+            if paint.palette:
+                layout.template_palette(paint, "palette", color=True)
+
+
+def view3dMtViewMenu(self, context):
+    self.layout.separator()
+    self.layout.operator_context = "INVOKE_DEFAULT"
+    self.layout.operator(ObjectViewportAlphaToggleOperator.bl_idname)
+
+
+def ObjectViewportMenus(isRegister):
+    if isRegister:
+        bpy.types.VIEW3D_MT_view.append(view3dMtViewMenu)
+    else:
+        bpy.types.VIEW3D_MT_view.remove(view3dMtViewMenu)
+
+
+glob.prevPaletteColor = None
+
+
+# Material users index: mesh objects by their mesh materials for Brush.color updates, \
+# built on first use and kept by depsgraph updates of objects/meshes with updated geometry. \
+# Reset on file load, undo and redo, rebuilt for not indexed materials. \
+# Objects and meshes keyed by session_uid, renames make no depsgraph updates: \
+# indexed object not found by its name (renamed, removed) rebuilds the index.
+glob.matUsers = None
+
+
+def newMaterialUsersIndex():
+    index = SimpleNamespace(
+        objectsByMat={},  # {material name: {object uid}}
+        entryByObject={},  # {object uid: (object name, mesh uid, {material name})}
+        objectsByMesh={},  # {mesh uid: {object uid}}
+        mats=set(mat.name for mat in bpy.data.materials),
+    )
+    for obj in bpy.data.objects:
+        indexMaterialUser(index, obj)
+    return index
+
+
+def indexMaterialUser(index, obj):
+    unindexMaterialUser(index, obj.session_uid)
+    if not isinstance(obj.data, bpy.types.Mesh):
+        return
+    matNames = set(mat.name for mat in obj.data.materials if mat)
+    index.entryByObject[obj.session_uid] = (obj.name, obj.data.session_uid, matNames)
+    index.objectsByMesh.setdefault(obj.data.session_uid, set()).add(obj.session_uid)
+    for matName in matNames:
+        index.objectsByMat.setdefault(matName, set()).add(obj.session_uid)
+
+
+def unindexMaterialUser(index, objUid):
+    entry = index.entryByObject.pop(objUid, None)
+    if entry == None:
+        return
+    objName, meshUid, matNames = entry
+    index.objectsByMesh.get(meshUid, set()).discard(objUid)
+    for matName in matNames:
+        index.objectsByMat.get(matName, set()).discard(objUid)
+
+
+def getIndexedObject(index, objUid):
+    # -> object | None if renamed or removed since indexed
+    obj = bpy.data.objects.get(index.entryByObject[objUid][0])
+    return obj if obj and obj.session_uid == objUid else None
+
+
+def findIndexedMaterialUsers(index, mat):
+    # -> [object] | None if index is stale
+    users = []
+    for objUid in list(index.objectsByMat.get(mat.name, ())):
+        obj = getIndexedObject(index, objUid)
+        if obj == None:
+            return None
+        if isinstance(obj.data, bpy.types.Mesh) and mat.name in obj.data.materials:
+            users.append(obj)
+        else:
+            indexMaterialUser(index, obj)
+    return users
+
+
+def getMaterialUsers(mat):
+    # Same objects as getObjectUsersOfMat(mat, bpy.data.objects), in bpy.data.objects order
+    global glob
+    if glob.matUsers == None or mat.name not in glob.matUsers.mats:
+        glob.matUsers = newMaterialUsersIndex()
+    users = findIndexedMaterialUsers(glob.matUsers, mat)
+    if users == None:
+        glob.matUsers = newMaterialUsersIndex()
+        users = findIndexedMaterialUsers(glob.matUsers, mat)
+    return sorted(users, key=lambda obj: obj.name)
+
+
+@persistent
+def handleMaterialUsersDepsgraphUpdate(scene, depsgraph):
+    index = glob.matUsers
+    if index == None:
+        return
+    for update in depsgraph.updates:
+        if not update.is_updated_geometry:
+            continue
+        id = update.id.original
+        if isinstance(id, bpy.types.Object):
+            indexMaterialUser(index, id)
+        elif isinstance(id, bpy.types.Mesh):
+            for objUid in list(index.objectsByMesh.get(id.session_uid, ())):
+                obj = getIndexedObject(index, objUid)
+                if obj:
+                    indexMaterialUser(index, obj)
+
+
+@persistent
+def resetMaterialUsersIndex(*args):
+    global glob
+    glob.matUsers = None
+
+
+MATERIAL_USERS_HANDLERS = [
+    ('depsgraph_update_post', handleMaterialUsersDepsgraphUpdate),
+    ('load_post', resetMaterialUsersIndex),
+    ('undo_post', resetMaterialUsersIndex),
+    ('redo_post', resetMaterialUsersIndex),
+]
+
+
+def MaterialUsersIndex(isRegister):
+    for handlersName, handler in MATERIAL_USERS_HANDLERS:
+        handlers = getattr(bpy.app.handlers, handlersName)
+        if isRegister and handler not in handlers:
+            handlers.append(handler)
+        elif not isRegister and handler in handlers:
+            handlers.remove(handler)
+    resetMaterialUsersIndex()
+
+
+glob.brushColorOwner = None
+glob.resubscribeBrushColor = None
+glob.brushColorTimer = None
+glob.brushColorPending = False
+
+BRUSH_COLOR_UPDATE_FPS = 30  # fallback for addon preferences brush_color_update_fps
+
+
+def getBrushColorUpdateInterval():
+    try:
+        fps = bpy.context.preferences.addons[__name__.split('.')[0]].preferences.brush_color_update_fps
+    except Exception as er:
+        fps = BRUSH_COLOR_UPDATE_FPS
+    return 1 / max(1, fps)
+
+
+def SubscribeBrushColor(isRegister=True):
+    # Owner and load_post handler kept in glob, so unregister clears what register added
+    if not isRegister:
+        if glob.brushColorOwner != None:
+            bpy.msgbus.clear_by_owner(glob.brushColorOwner)
+        if glob.resubscribeBrushColor in bpy.app.handlers.load_post:
+            bpy.app.handlers.load_post.remove(glob.resubscribeBrushColor)
+        if glob.brushColorTimer != None and bpy.app.timers.is_registered(glob.brushColorTimer):
+            bpy.app.timers.unregister(glob.brushColorTimer)
+        glob.brushColorOwner = None
+        glob.resubscribeBrushColor = None
+        glob.brushColorTimer = None
+        glob.brushColorPending = False
+        return
+
+    brushColorOwner = object()
+
+    def setObjectViewportColorSet():
+        global glob
+
+        try:
+            mat = bpy.context.active_object.active_material
+        except Exception as er:
+            mat = None
+        try:
+            unifiedPaintSettings = bpy.context.scene.tool_settings.unified_paint_settings
+        except Exception as er:
+            unifiedPaintSettings = None
+        try:
+            brush = bpy.context.scene.tool_settings.gpencil_paint.brush
+        except Exception as er:
+            brush = None
+        try:
+            paletteColor = bpy.context.scene.tool_settings.gpencil_paint.palette.colors.active.color
+        except Exception as er:
+            paletteColor = None
+
+        global_event = updateGlobalEvent()
+        space = getSpaceUnderMouseFromContext(
+            bpy.context, global_event)
+
+        if (bpy.context.mode != 'OBJECT' or space == None or space.type != 'VIEW_3D' or not mat):
+            glob.prevPaletteColor = paletteColor
+            return
+
+        def setObjectUsersOfMatWithColor(r, g, b):
+            for obj in getMaterialUsers(mat):
+                if not len(obj.data.color_attributes):
+                    appendNewColorAttrForObject(
+                        obj, 'Attribute')  # creates new color attr to show it in vertex color shading color mode \
+                firstMat = list(obj.material_slots)[0].material
+                if (firstMat == mat):
+                    obj.color = (r, g, b, 1.0)
+
+        if (paletteColor == glob.prevPaletteColor):
+            # Color changed by picker
+            if (brush and brush.color):
+                bcR, bcG, bcB = brush.color
+                mat.diffuse_color = (bcR, bcG, bcB, 1.0)
+                if (unifiedPaintSettings):
+                    unifiedPaintSettings.color = (bcR, bcG, bcB)
+                setObjectUsersOfMatWithColor(bcR, bcG, bcB)
+        else:
+            # Color changed by palette
+            if (paletteColor):
+                pcR, pcG, pcB = paletteColor
+                mat.diffuse_color = (pcR, pcG, pcB, 1.0)
+                if (brush):
+                    brush.color = (pcR, pcG, pcB)
+                setObjectUsersOfMatWithColor(pcR, pcG, pcB)
+
+        glob.prevPaletteColor = paletteColor
+
+    def flushBrushColorChange():
+        # Timer: pending change applied once per interval, stops after an interval without changes (drag ended)
+        if not glob.brushColorPending:
+            return None
+        glob.brushColorPending = False
+        try:
+            setObjectViewportColorSet()
+        except Exception as er:
+            print('SugarKit: brush color update failed:', er)
+            return None
+        return getBrushColorUpdateInterval()
+
+    def handleBrushColorChange():
+        # After ObjectViewportColorSetPanel changes, coalesced while picker is dragged: \
+        # first change applied now, next ones only marked pending, timer applies latest colors from context. \
+        # Tracked mouse is refreshed here if stale, timer has no window to dispatch from.
+        if bpy.app.timers.is_registered(flushBrushColorChange):
+            updateGlobalEvent()
+            glob.brushColorPending = True
+            return
+        bpy.app.timers.register(flushBrushColorChange, first_interval=getBrushColorUpdateInterval())
+        setObjectViewportColorSet()
+
+    def subscribeBrushColor():
+        bpy.msgbus.subscribe_rna(
+            key=(bpy.types.Brush, 'color'),
+            owner=brushColorOwner,
+            args=(),
+            notify=handleBrushColorChange,
+            options={"PERSISTENT"}
+        )
+
+    @persistent
+    def resubscribeBrushColor(dummy):
+        subscribeBrushColor()
+
+    subscribeBrushColor()
+    bpy.app.handlers.load_post.append(resubscribeBrushColor)
+    glob.brushColorOwner = brushColorOwner
+    glob.resubscribeBrushColor = resubscribeBrushColor
+    glob.brushColorTimer = flushBrushColorChange